@@ -0,0 +1,78 @@
+"""Benchmark the incremental Ahmia parser against the old DOTALL regex.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_ahmia_parser [results] [repeat]
+
+Also times a truncated page (results without closing markup), the case
+where the old regex backtracks across the rest of the document.
+
+This is parse CPU only, on a fully buffered page. search_ahmia feeds the
+parser while the page downloads, so in practice parsing overlaps network
+I/O rather than adding to it.
+"""
+
+import random
+import re
+import sys
+import time
+
+from digital_footprint.scanners.dark_web_scanner import _parse_ahmia_html
+
+OLD_PATTERN = re.compile(
+    r'<li\s+class="result">\s*<h4><a\s+href="([^"]+)">([^<]+)</a></h4>\s*<p>([^<]*)</p>',
+    re.DOTALL,
+)
+
+RESULT = """<li class="result">
+  <h4><a href="/search/redirect?search_term=q&amp;redirect_url=http://{host}.onion/{path}">{title}</a></h4>
+  <p>{snippet}</p>
+  <p class="urlinfo"><cite>http://{host}.onion/{path}</cite> {age} days ago</p>
+</li>
+"""
+
+
+def make_page(results: int, rng: random.Random, truncated: bool = False) -> str:
+    words = ["leak", "dump", "forum", "market", "email", "list", "combo", "paste", "archive", "index"]
+    parts = ["<html><body><ol class=\"searchResults\">"]
+    for i in range(results):
+        item = RESULT.format(
+            host="".join(rng.choices("abcdefghijklmnopqrstuvwxyz234567", k=16)),
+            path=f"page{i}",
+            title=" ".join(rng.choices(words, k=5)),
+            snippet=" ".join(rng.choices(words, k=40)),
+            age=rng.randint(1, 900),
+        )
+        if truncated:
+            # Broken markup: the snippet paragraph is never closed
+            item = item.replace("</p>\n  <p class", "\n  <p class", 1)
+        parts.append(item)
+    parts.append("</ol></body></html>")
+    return "".join(parts)
+
+
+def timed(fn, page: str, repeat: int) -> tuple[float, int]:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        count = fn(page)
+    return (time.perf_counter() - start) / repeat, count
+
+
+def main() -> None:
+    results = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    rng = random.Random(42)
+
+    for label, page in [
+        ("well-formed", make_page(results, rng)),
+        ("truncated", make_page(results, rng, truncated=True)),
+    ]:
+        regex_s, regex_n = timed(lambda p: sum(1 for _ in OLD_PATTERN.finditer(p)), page, repeat)
+        parser_s, parser_n = timed(lambda p: len(_parse_ahmia_html(p)), page, repeat)
+        print(f"{label:12s} {len(page) / 1e6:.1f} MB  "
+              f"regex: {regex_s * 1000:8.1f} ms ({regex_n} results)  "
+              f"parser: {parser_s * 1000:8.1f} ms ({parser_n} results)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark the compiled name matcher against the old substring check.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_name_matcher [pages] [page_kb]
+"""
+
+import random
+import string
+import sys
+import time
+
+from digital_footprint.scanners.name_matcher import NameMatcher
+
+WORDS = ["address", "phone", "relatives", "age", "lives", "in", "view", "report",
+         "john", "smith", "johnson", "maria", "street", "ca", "tx", "jones", "dover"]
+NAMES = ["John Doe", "Doe, Jonathan Q.", "J. Doe", "Jack A. Doe", "John Smith-Johnson"]
+
+
+def make_page(size: int, rng: random.Random) -> str:
+    words = []
+    length = 0
+    while length < size:
+        if rng.random() < 0.7:
+            word = rng.choice(WORDS).capitalize()
+        else:
+            word = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+        words.append(word)
+        length += len(word) + 1
+    for _ in range(rng.randint(0, 3)):
+        words.insert(rng.randrange(len(words)), rng.choice(NAMES))
+    return " ".join(words)
+
+
+def substring_check(text: str, first: str, last: str) -> bool:
+    lowered = text.lower()
+    return first.lower() in lowered and last.lower() in lowered
+
+
+def main() -> None:
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    page_kb = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    rng = random.Random(42)
+    corpus = [make_page(page_kb * 1024, rng) for _ in range(pages)]
+
+    start = time.perf_counter()
+    matcher = NameMatcher("John", "Doe")
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    found = sum(matcher.search(page).found for page in corpus)
+    elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    naive = sum(substring_check(page, "John", "Doe") for page in corpus)
+    naive_elapsed = time.perf_counter() - start
+
+    print(f"pages={pages} page_size={page_kb}KB compile={compile_ms:.2f}ms")
+    print(f"matcher:   {pages / elapsed:8.0f} pages/s  found={found}")
+    print(f"substring: {pages / naive_elapsed:8.0f} pages/s  found={naive}")
+
+
+if __name__ == "__main__":
+    main()
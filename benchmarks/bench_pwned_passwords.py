@@ -0,0 +1,67 @@
+"""Benchmark the offline Pwned Passwords store: bulk load and lookup throughput.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_pwned_passwords [ranges] [per_range] [lookups]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from digital_footprint.scanners.pwned_passwords import PwnedPasswordsStore
+
+
+def write_dump(path: Path, ranges: int, per_range: int, rng: random.Random) -> list[str]:
+    """Write a hash-ordered HASH:COUNT dump; returns the hashes it contains."""
+    prefixes = sorted(rng.sample(range(16 ** 5), ranges))
+    hashes = []
+    with open(path, "w") as f:
+        for prefix in prefixes:
+            suffixes = sorted({rng.getrandbits(140) for _ in range(per_range)})
+            for suffix in suffixes:
+                sha1 = f"{prefix:05X}{suffix:035X}"
+                hashes.append(sha1)
+                f.write(f"{sha1}:{rng.randint(1, 100000)}\n")
+    return hashes
+
+
+def main() -> None:
+    ranges = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    per_range = int(sys.argv[2]) if len(sys.argv) > 2 else 800
+    lookups = int(sys.argv[3]) if len(sys.argv) > 3 else 200000
+    rng = random.Random(42)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dump = Path(tmp) / "dump.txt"
+        hashes = write_dump(dump, ranges, per_range, rng)
+
+        store = PwnedPasswordsStore(Path(tmp) / "store")
+        start = time.perf_counter()
+        store.load_dump(dump)
+        load_s = time.perf_counter() - start
+        stats = store.stats()
+
+        # Half known hashes, half random ones in stored ranges
+        queries = []
+        for _ in range(lookups):
+            sha1 = rng.choice(hashes)
+            if rng.random() < 0.5:
+                sha1 = sha1[:5] + f"{rng.getrandbits(140):035X}"
+            queries.append(sha1)
+
+        start = time.perf_counter()
+        hits = sum(1 for sha1 in queries if store.lookup(sha1))
+        lookup_s = time.perf_counter() - start
+        store.close()
+
+    print(f"ranges: {ranges}, hashes: {stats['hashes']}, data: {stats['data_bytes'] / 1e6:.1f} MB "
+          f"({stats['data_bytes'] / stats['hashes']:.0f} B/hash)")
+    print(f"bulk load: {load_s:.2f}s ({stats['hashes'] / load_s:,.0f} hashes/s)")
+    print(f"lookups:   {lookups} in {lookup_s:.2f}s ({lookups / lookup_s:,.0f}/s, {hits} hits)")
+
+
+if __name__ == "__main__":
+    main()
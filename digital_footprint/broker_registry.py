@@ -15,6 +15,7 @@ VALID_CATEGORIES = {
 }
 VALID_METHODS = {"web_form", "email", "api", "phone", "mail"}
 VALID_DIFFICULTIES = {"easy", "medium", "hard", "manual"}
+VALID_RENDER_MODES = {"http", "browser", "auto"}
 
 
 def validate_broker_yaml(data: dict) -> list[str]:
@@ -30,6 +31,9 @@ def validate_broker_yaml(data: dict) -> list[str]:
     opt_out = data.get("opt_out", {})
     if "method" in opt_out and opt_out["method"] not in VALID_METHODS:
         errors.append(f"Invalid opt_out method: {opt_out['method']}. Valid: {VALID_METHODS}")
+    search = data.get("search", {})
+    if "render_mode" in search and search["render_mode"] not in VALID_RENDER_MODES:
+        errors.append(f"Invalid search render_mode: {search['render_mode']}. Valid: {VALID_RENDER_MODES}")
     return errors
 
 
@@ -1,6 +1,5 @@
 """Digital Footprint Manager CLI."""
 
-import asyncio
 import json
 import sys
 
@@ -8,6 +7,8 @@ import click
 
 from digital_footprint.config import get_config
 from digital_footprint.db import Database
+from digital_footprint.http_cache import open_response_cache
+from digital_footprint.http_client import configure_http_cache, get_http_client, run_async
 
 
 def _get_db():
@@ -17,16 +18,32 @@ def _get_db():
     return db
 
 
+def _enable_http_cache():
+    """Attach the response cache for commands that call external APIs.
+
+    Opened on first use rather than for every command, and skipped when
+    ``--no-cache`` was given.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None and (ctx.find_root().obj or {}).get("no_cache"):
+        configure_http_cache(None)
+    elif get_http_client().cache is None:
+        configure_http_cache(open_response_cache(get_config()))
+
+
 def _run_async(coro):
     """Run async function from sync CLI context."""
-    return asyncio.run(coro)
+    _enable_http_cache()
+    return run_async(coro)
 
 
 @click.group()
 @click.version_option(version="1.0.0", prog_name="dfp")
-def cli():
+@click.option("--no-cache", is_flag=True, help="Bypass the HTTP response cache for this run")
+@click.pass_context
+def cli(ctx, no_cache):
     """Digital Footprint Manager - Personal data removal and privacy protection."""
-    pass
+    ctx.obj = {"no_cache": no_cache}
 
 
 # -- Person commands --
@@ -106,6 +123,7 @@ def scan_breach(email):
         email=email,
         hibp_api_key=config.hibp_api_key,
         dehashed_api_key=config.dehashed_api_key,
+        hibp_rpm=config.hibp_rpm,
     ))
     click.echo(result)
 
@@ -113,12 +131,14 @@ def scan_breach(email):
 @scan.command("username")
 @click.argument("username")
 @click.option("--timeout", "-t", default=120, help="Timeout in seconds")
-def scan_username(username, timeout):
+@click.option("--tier", type=click.Choice(["fast", "tail", "full"]), default=None,
+              help="fast: top sites + risky tags; tail: the rest; full: every site")
+def scan_username(username, timeout, tier):
     """Search for a username across 3,000+ sites (Maigret)."""
-    from digital_footprint.scanners.username_scanner import search_username
+    from digital_footprint.scanners.username_scanner import scan_username as run_scan
 
     click.echo(f"Scanning username '{username}' across sites...")
-    results = _run_async(search_username(username, timeout=timeout))
+    results = _run_async(run_scan(username, timeout=timeout, tier=tier)).results
 
     if not results:
         click.echo("No accounts found.")
@@ -134,33 +154,197 @@ def scan_username(username, timeout):
 @click.argument("name")
 @click.option("--email", "-e", help="Email to include in dorks")
 @click.option("--phone", "-p", help="Phone to include in dorks")
-def scan_dorks(name, email, phone):
-    """Generate Google dork queries for OSINT."""
-    from digital_footprint.scanners.google_dorker import generate_dorks
+@click.option("--run", "run_queries", is_flag=True, help="Run the queries through SearXNG (SEARXNG_URL)")
+@click.option("--all", "show_all", is_flag=True, help="List every generated query instead of the merged plan")
+def scan_dorks(name, email, phone, run_queries, show_all):
+    """Generate (and optionally run) Google dork queries for OSINT."""
+    from digital_footprint.scanners.dork_planner import plan_dork_queries, run_planned_dorks
+    from digital_footprint.scanners.google_dorker import SearxngBackend, build_dork_queries
+
+    dorks = build_dork_queries(name=name, email=email, phone=phone)
+    if not run_queries:
+        planned = dorks if show_all else [p.query for p in plan_dork_queries(dorks, name=name).queries]
+        click.echo(f"Google Dork Queries for '{name}':\n")
+        for i, dork in enumerate(planned, 1):
+            click.echo(f"  {i}. {dork}")
+        return
 
-    dorks = generate_dorks(name=name, email=email, phone=phone)
-    click.echo(f"Google Dork Queries for '{name}':\n")
-    for i, dork in enumerate(dorks, 1):
-        click.echo(f"  {i}. {dork}")
+    config = get_config()
+    if not config.searxng_url:
+        raise click.UsageError("Set SEARXNG_URL to run dork queries.")
+    backend = SearxngBackend(config.searxng_url, rpm=config.searxng_rpm)
+    outcome = _run_async(run_planned_dorks(dorks, backend, db=_get_db(), name=name))
+    plan = outcome["plan"]
+    click.echo(
+        f"Ran {outcome['queries']} requests for {outcome['requested']} queries "
+        f"({len(plan['pruned'])} redundant, {len(plan['skipped_recent'])} fetched recently): "
+        f"{len(outcome['results'])} unique results, {outcome['cached']} from earlier runs\n"
+    )
+    for r in sorted(outcome["results"], key=lambda x: x.risk_level != "high"):
+        marker = {"high": "!!", "medium": "!"}[r.risk_level]
+        click.echo(f"  [{marker}] {r.url}  ({r.query})")
+    for query, error in outcome["errors"].items():
+        click.echo(f"  failed: {query}: {error}", err=True)
 
 
 @scan.command("holehe")
-@click.argument("email")
-def scan_holehe(email):
-    """Check which services an email is registered with."""
-    from digital_footprint.scanners.holehe_scanner import check_email_registrations
+@click.argument("emails", nargs=-1, required=True)
+def scan_holehe(emails):
+    """Check which services one or more emails are registered with."""
+    from digital_footprint.scanners.holehe_scanner import check_email_registrations_many
 
-    click.echo(f"Checking email registrations for '{email}'...")
-    results = _run_async(check_email_registrations(email))
+    click.echo(f"Checking email registrations for {', '.join(repr(e) for e in emails)}...")
+    by_email = _run_async(check_email_registrations_many(list(emails)))
 
-    if not results:
-        click.echo("No registrations found (or holehe not installed).")
+    for email, results in by_email.items():
+        if len(emails) > 1:
+            click.echo(f"\n{email}:")
+        if not results:
+            click.echo("No registrations found (or holehe not installed).")
+            continue
+
+        click.echo(f"\nFound {len(results)} registrations:\n")
+        for r in results:
+            marker = {"high": "!!", "medium": "!", "low": "."}[r.risk_level]
+            click.echo(f"  [{marker}] {r.service}")
+
+
+# -- Username scan job commands --
+
+@cli.group()
+def usernames():
+    """Queued Maigret username scans."""
+    pass
+
+
+@usernames.command("queue")
+@click.argument("names", nargs=-1)
+@click.option("--person-id", "-p", type=int, default=None, help="Only this person's usernames")
+@click.option("--tier", type=click.Choice(["fast", "tail", "full"]), default="full", help="Site subset to scan")
+def usernames_queue(names, person_id, tier):
+    """Queue scans for USERNAMES, or for every person's stored usernames."""
+    from digital_footprint.scanners.username_pool import enqueue_usernames
+
+    job_ids = enqueue_usernames(_get_db(), usernames=list(names), person_id=person_id, tier=tier)
+    if not job_ids:
+        click.echo("No usernames to scan.")
         return
+    click.echo(f"Queued {len(job_ids)} jobs: {', '.join(str(i) for i in job_ids)}")
 
-    click.echo(f"\nFound {len(results)} registrations:\n")
-    for r in results:
-        marker = {"high": "!!", "medium": "!", "low": "."}[r.risk_level]
-        click.echo(f"  [{marker}] {r.service}")
+
+@usernames.command("rescan")
+@click.argument("username")
+@click.option("--ttl-days", default=7.0, help="Re-check sites last checked more than this many days ago")
+@click.option("--timeout", "-t", default=120, help="Maigret per-request timeout in seconds")
+def usernames_rescan(username, ttl_days, timeout):
+    """Re-check stale sites for USERNAME and report what changed."""
+    from digital_footprint.scanners.username_rescan import rescan_username
+
+    diff = _run_async(rescan_username(_get_db(), username, ttl=ttl_days * 86400, timeout=timeout))
+    click.echo(f"Checked {diff.checked} sites ({diff.cached} cached), status: {diff.status}")
+    for r in diff.new:
+        click.echo(f"  [+] {r.site_name}: {r.url}")
+    for site in diff.gone:
+        click.echo(f"  [-] {site}")
+    click.echo(f"{len(diff.accounts)} accounts, {len(diff.new)} new, {len(diff.gone)} gone since last scan.")
+
+
+@usernames.command("run")
+@click.option("--concurrency", "-c", default=4, help="Maigret processes to run at once")
+@click.option("--timeout", "-t", default=120, help="Maigret per-request timeout in seconds")
+@click.option("--deadline", "-d", type=float, default=None, help="Hard wall-clock limit per username in seconds")
+@click.option("--requeue", is_flag=True, help="First requeue jobs left running by a worker that died")
+def usernames_run(concurrency, timeout, deadline, requeue):
+    """Run queued username scans until the queue is empty."""
+    from digital_footprint.scanners.username_pool import run_username_jobs
+
+    db = _get_db()
+    if requeue:
+        click.echo(f"Requeued {db.requeue_running_username_jobs()} jobs.")
+    counts = run_username_jobs(db, concurrency=concurrency, timeout=timeout, deadline=deadline)
+    if not counts:
+        click.echo("No queued jobs.")
+        return
+    click.echo("Finished: " + ", ".join(f"{n} {status}" for status, n in sorted(counts.items())))
+
+
+@usernames.command("jobs")
+@click.option("--status", "-s", default=None, help="Filter by status (queued, running, completed, timeout, cancelled, failed)")
+def usernames_jobs(status):
+    """List username scan jobs."""
+    jobs = _get_db().list_username_jobs(status=status)
+    if not jobs:
+        click.echo("No jobs.")
+        return
+    for job in jobs:
+        flag = " (cancelling)" if job["cancel_requested"] and job["status"] == "running" else ""
+        click.echo(
+            f"  {job['id']:>4}  {job['username']:<24} {job['tier']:<5} {job['status']}{flag}  "
+            f"{len(job['results'])} sites"
+        )
+
+
+@usernames.command("cancel")
+@click.argument("job_id", type=int, required=False)
+def usernames_cancel(job_id):
+    """Cancel JOB_ID, or every queued and running job."""
+    cancelled = _get_db().cancel_username_jobs(job_id)
+    click.echo(f"Cancelled {cancelled} jobs.")
+
+
+# -- Pwned Passwords commands --
+
+@cli.group()
+def passwords():
+    """Offline Pwned Passwords range store."""
+    pass
+
+
+@passwords.command("load")
+@click.argument("dump", type=click.Path(exists=True))
+@click.option("--compact/--no-compact", default=True, help="Drop superseded records afterwards")
+def passwords_load(dump, compact):
+    """Bulk-load a Pwned Passwords dump (range directory or HASH:COUNT file)."""
+    from digital_footprint.scanners.pwned_passwords import PwnedPasswordsStore
+
+    store = PwnedPasswordsStore(get_config().pwned_passwords_dir)
+    try:
+        loaded = store.load_dump(dump)
+        if compact:
+            store.compact()
+        click.echo(f"Loaded {loaded} ranges.")
+        click.echo(json.dumps(store.stats(), indent=2))
+    finally:
+        store.close()
+
+
+@passwords.command("check")
+@click.option("--sha1", "sha1", help="SHA-1 hash to check instead of prompting for a password")
+@click.option("--offline", is_flag=True, help="Never contact the API")
+def passwords_check(sha1, offline):
+    """Check a password (prompted, never echoed) against Pwned Passwords."""
+    from digital_footprint.scanners.pwned_passwords import (
+        PwnedPasswordsStore,
+        check_hashes,
+        is_sha1,
+        sha1_hex,
+    )
+
+    if sha1 and not is_sha1(sha1):
+        raise click.BadParameter("expected 40 hex characters", param_hint="--sha1")
+    if not sha1:
+        sha1 = sha1_hex(click.prompt("Password", hide_input=True))
+    store = PwnedPasswordsStore(get_config().pwned_passwords_dir)
+    try:
+        count = _run_async(check_hashes([sha1], store=store, offline=offline)).get(sha1.upper())
+    finally:
+        store.close()
+    if count is None:
+        click.echo("Unknown: range not stored locally (run without --offline or load a dump).")
+    elif count:
+        click.echo(f"Pwned: seen {count:,} times.")
+    else:
+        click.echo("Not found in Pwned Passwords.")
 
 
 # -- Broker commands --
@@ -242,6 +426,7 @@ def protect(person_id):
     db = _get_db()
 
     click.echo(f"Running protection pipeline for person {person_id}...")
+    _enable_http_cache()
     result = do_protect(person_id=person_id, db=db, config=config)
     click.echo(result)
 
@@ -12,6 +12,7 @@ class Config:
     db_path: Path = field(default_factory=lambda: Path.home() / ".digital-footprint" / "footprint.db")
     brokers_dir: Path = field(default_factory=lambda: Path(__file__).parent / "brokers")
     hibp_api_key: str = ""
+    hibp_rpm: int = 10
     dehashed_api_key: str = ""
     dehashed_email: str = ""
     captcha_api_key: str = ""
@@ -20,6 +21,17 @@ class Config:
     smtp_user: str = ""
     smtp_password: str = ""
     alert_email: str = ""
+    page_cache_path: Path = field(default_factory=lambda: Path.home() / ".digital-footprint" / "page_cache.db")
+    page_cache_max_mb: int = 64
+    http_cache_path: Path = field(default_factory=lambda: Path.home() / ".digital-footprint" / "http_cache.db")
+    http_cache_max_mb: int = 32
+    http_cache_enabled: bool = True
+    http_cache_ttls: str = ""
+    searxng_url: str = ""
+    searxng_rpm: float = 30
+    username_time_budget: int = 90
+    maigret_top_sites: int = 200
+    pwned_passwords_dir: Path = field(default_factory=lambda: Path.home() / ".digital-footprint" / "pwned-passwords")
 
 
 def get_config() -> Config:
@@ -33,6 +45,7 @@ def get_config() -> Config:
         config.db_path = Path(os.path.expanduser(db_override))
 
     config.hibp_api_key = os.environ.get("HIBP_API_KEY", "")
+    config.hibp_rpm = int(os.environ.get("HIBP_RPM", "10"))
     config.dehashed_api_key = os.environ.get("DEHASHED_API_KEY", "")
     config.dehashed_email = os.environ.get("DEHASHED_EMAIL", "")
     config.captcha_api_key = os.environ.get("CAPTCHA_API_KEY", "")
@@ -42,4 +55,25 @@ def get_config() -> Config:
     config.smtp_password = os.environ.get("SMTP_PASSWORD", "")
     config.alert_email = os.environ.get("ALERT_EMAIL", "")
 
+    cache_override = os.environ.get("DIGITAL_FOOTPRINT_PAGE_CACHE_PATH")
+    if cache_override:
+        config.page_cache_path = Path(os.path.expanduser(cache_override))
+    config.page_cache_max_mb = int(os.environ.get("PAGE_CACHE_MAX_MB", "64"))
+
+    http_cache_override = os.environ.get("DIGITAL_FOOTPRINT_HTTP_CACHE_PATH")
+    if http_cache_override:
+        config.http_cache_path = Path(os.path.expanduser(http_cache_override))
+    config.http_cache_max_mb = int(os.environ.get("HTTP_CACHE_MAX_MB", "32"))
+    config.http_cache_enabled = os.environ.get("HTTP_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+    config.http_cache_ttls = os.environ.get("HTTP_CACHE_TTLS", "")
+
+    config.searxng_url = os.environ.get("SEARXNG_URL", "")
+    config.searxng_rpm = float(os.environ.get("SEARXNG_RPM", "30"))
+    config.username_time_budget = int(os.environ.get("USERNAME_TIME_BUDGET", "90"))
+    config.maigret_top_sites = int(os.environ.get("MAIGRET_TOP_SITES", "200"))
+
+    pwned_override = os.environ.get("DIGITAL_FOOTPRINT_PWNED_PASSWORDS_DIR")
+    if pwned_override:
+        config.pwned_passwords_dir = Path(os.path.expanduser(pwned_override))
+
     return config
@@ -53,6 +53,7 @@ CREATE TABLE IF NOT EXISTS findings (
     url TEXT,
     screenshot_path TEXT,
     status TEXT DEFAULT 'active',
+    fingerprint TEXT,
     discovered_at TEXT DEFAULT (datetime('now')),
     updated_at TEXT DEFAULT (datetime('now'))
 );
@@ -129,6 +130,88 @@ CREATE TABLE IF NOT EXISTS pipeline_runs (
     report_path TEXT
 );
 CREATE INDEX IF NOT EXISTS idx_pipeline_runs_person ON pipeline_runs(person_id);
+
+CREATE TABLE IF NOT EXISTS username_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT NOT NULL,
+    person_id INTEGER REFERENCES persons(id),
+    tier TEXT DEFAULT 'full',
+    status TEXT DEFAULT 'queued',
+    cancel_requested INTEGER DEFAULT 0,
+    results TEXT DEFAULT '[]',
+    error TEXT,
+    created_at TEXT DEFAULT (datetime('now')),
+    started_at TEXT,
+    completed_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_username_jobs_status ON username_jobs(status);
+
+CREATE TABLE IF NOT EXISTS username_sites (
+    username TEXT NOT NULL,
+    site_name TEXT NOT NULL,
+    claimed INTEGER NOT NULL,
+    url TEXT DEFAULT '',
+    tags TEXT DEFAULT '[]',
+    first_seen_at REAL,
+    last_checked_at REAL NOT NULL,
+    PRIMARY KEY (username, site_name)
+);
+
+CREATE TABLE IF NOT EXISTS dork_queries (
+    backend TEXT NOT NULL,
+    query TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    results TEXT DEFAULT '[]',
+    PRIMARY KEY (backend, query)
+);
+
+CREATE TABLE IF NOT EXISTS broker_latency (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    broker_slug TEXT NOT NULL,
+    elapsed_ms REAL NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_broker_latency_slug ON broker_latency(broker_slug, id);
+
+CREATE TABLE IF NOT EXISTS broker_breakers (
+    broker_slug TEXT PRIMARY KEY,
+    consecutive_failures INTEGER NOT NULL DEFAULT 0,
+    opened_until REAL NOT NULL DEFAULT 0,
+    last_error TEXT,
+    updated_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS hibp_catalogue (
+    name TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    domain TEXT,
+    breach_date TEXT,
+    data_classes TEXT DEFAULT '[]',
+    is_verified INTEGER DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS hibp_catalogue_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Columns added after the initial schema: (table, column, definition).
+# Applied in order to databases created before the column existed.
+MIGRATIONS = [
+    ("findings", "fingerprint", "TEXT"),
+    ("breaches", "last_seen_at", "TEXT"),
+    ("breaches", "reported_at", "TEXT"),
+    ("username_jobs", "tier", "TEXT DEFAULT 'full'"),
+    ("dork_queries", "results", "TEXT DEFAULT '[]'"),
+]
+
+POST_MIGRATION_SCHEMA = """
+CREATE UNIQUE INDEX IF NOT EXISTS idx_findings_fingerprint ON findings(fingerprint);
+DELETE FROM breaches WHERE id NOT IN (
+    SELECT MIN(id) FROM breaches GROUP BY person_id, source, breach_name
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_breaches_identity ON breaches(person_id, source, breach_name);
 """
 
 
@@ -144,8 +227,16 @@ class Database:
         self.conn.execute("PRAGMA journal_mode=WAL")
         self.conn.execute("PRAGMA foreign_keys=ON")
         self.conn.executescript(SCHEMA)
+        self._migrate()
+        self.conn.executescript(POST_MIGRATION_SCHEMA)
         self.conn.commit()
 
+    def _migrate(self) -> None:
+        for table, column, definition in MIGRATIONS:
+            existing = {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+            if column not in existing:
+                self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
     def close(self) -> None:
         if self.conn:
             self.conn.close()
@@ -221,11 +312,19 @@ class Database:
     # --- Broker operations ---
 
     def insert_broker(self, broker: Broker) -> int:
-        cursor = self.conn.execute(
-            """INSERT OR REPLACE INTO brokers
+        # Upsert in place so findings and removals keep a valid broker_id
+        self.conn.execute(
+            """INSERT INTO brokers
             (slug, name, url, category, opt_out_method, opt_out_url, opt_out_email,
              difficulty, automatable, recheck_days, ccpa_compliant, gdpr_compliant, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(slug) DO UPDATE SET
+                name = excluded.name, url = excluded.url, category = excluded.category,
+                opt_out_method = excluded.opt_out_method, opt_out_url = excluded.opt_out_url,
+                opt_out_email = excluded.opt_out_email, difficulty = excluded.difficulty,
+                automatable = excluded.automatable, recheck_days = excluded.recheck_days,
+                ccpa_compliant = excluded.ccpa_compliant, gdpr_compliant = excluded.gdpr_compliant,
+                notes = excluded.notes, loaded_at = datetime('now')""",
             (
                 broker.slug, broker.name, broker.url, broker.category,
                 broker.opt_out_method, broker.opt_out_url, broker.opt_out_email,
@@ -234,7 +333,7 @@ class Database:
             ),
         )
         self.conn.commit()
-        return cursor.lastrowid
+        return self.conn.execute("SELECT id FROM brokers WHERE slug = ?", (broker.slug,)).fetchone()[0]
 
     def get_broker_by_slug(self, slug: str) -> Optional[Broker]:
         row = self.conn.execute("SELECT * FROM brokers WHERE slug = ?", (slug,)).fetchone()
@@ -301,6 +400,150 @@ class Database:
             notes=row["notes"],
         )
 
+    # --- Finding operations ---
+
+    def upsert_findings(
+        self,
+        person_id: int,
+        source: str,
+        findings: list[dict],
+        scope_broker_ids: Optional[list[int]] = None,
+    ) -> dict:
+        """Insert or refresh fingerprinted findings in a single transaction.
+
+        Each finding dict carries ``fingerprint``, ``finding_type`` and
+        optionally ``broker_id``, ``data_found``, ``risk_level``, ``url`` and
+        ``screenshot_path``. A fingerprint seen before only bumps
+        ``updated_at`` (and reactivates it). Active findings for this person
+        and source that are missing from the batch are marked ``disappeared``
+        (gone without a removal request, unlike ``removed``); pass ``scope_broker_ids`` to limit that to the brokers actually scanned.
+
+        Returns counts of ``new``, ``unchanged`` and ``disappeared`` findings.
+        """
+        counts = {"new": 0, "unchanged": 0, "disappeared": 0}
+        seen = set()
+        with self.conn:
+            for finding in findings:
+                fingerprint = finding["fingerprint"]
+                if fingerprint in seen:
+                    continue
+                seen.add(fingerprint)
+                updated = self.conn.execute(
+                    """UPDATE findings SET updated_at = datetime('now'), status = 'active'
+                    WHERE fingerprint = ?""",
+                    (fingerprint,),
+                ).rowcount
+                if updated:
+                    counts["unchanged"] += 1
+                    continue
+                self.conn.execute(
+                    """INSERT INTO findings
+                    (person_id, broker_id, source, finding_type, data_found, risk_level,
+                     url, screenshot_path, fingerprint)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (
+                        person_id,
+                        finding.get("broker_id"),
+                        source,
+                        finding["finding_type"],
+                        json.dumps(finding.get("data_found", {})),
+                        finding.get("risk_level", "medium"),
+                        finding.get("url"),
+                        finding.get("screenshot_path"),
+                        fingerprint,
+                    ),
+                )
+                counts["new"] += 1
+
+            query = """SELECT id, fingerprint FROM findings
+                WHERE person_id = ? AND source = ? AND status = 'active'"""
+            params: list = [person_id, source]
+            if scope_broker_ids is not None:
+                if not scope_broker_ids:
+                    return counts
+                query += f" AND broker_id IN ({', '.join('?' * len(scope_broker_ids))})"
+                params.extend(scope_broker_ids)
+            gone = [row[0] for row in self.conn.execute(query, params) if row[1] not in seen]
+            for finding_id in gone:
+                self.conn.execute(
+                    "UPDATE findings SET status = 'disappeared', updated_at = datetime('now') WHERE id = ?",
+                    (finding_id,),
+                )
+            counts["disappeared"] = len(gone)
+        return counts
+
+    def get_findings(self, person_id: int, status: Optional[str] = None) -> list[dict]:
+        query = "SELECT * FROM findings WHERE person_id = ?"
+        params: list = [person_id]
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        rows = self.conn.execute(query + " ORDER BY id", params).fetchall()
+        return [dict(r) for r in rows]
+
+    # --- Breach operations ---
+
+    def upsert_breaches(self, person_id: int, breaches: list[dict]) -> dict:
+        """Record breaches seen for a person in a single transaction.
+
+        Each breach dict carries ``source`` and ``breach_name`` (the identity
+        key) and optionally ``breach_date``, ``data_types`` and ``severity``.
+        Known breaches only get their details and ``last_seen_at`` refreshed.
+
+        Returns ``{"new": [...], "known": int}`` where ``new`` holds the
+        breach dicts not seen for this person before.
+        """
+        result = {"new": [], "known": 0}
+        seen = set()
+        with self.conn:
+            for breach in breaches:
+                key = (breach["source"], breach["breach_name"])
+                if key in seen:
+                    continue
+                seen.add(key)
+                values = (
+                    breach.get("breach_date"),
+                    json.dumps(breach.get("data_types", [])),
+                    breach.get("severity", "medium"),
+                )
+                inserted = self.conn.execute(
+                    """INSERT OR IGNORE INTO breaches
+                    (person_id, source, breach_name, breach_date, data_types, severity, last_seen_at)
+                    VALUES (?, ?, ?, ?, ?, ?, datetime('now'))""",
+                    (person_id, *key, *values),
+                ).rowcount
+                if inserted:
+                    result["new"].append(breach)
+                    continue
+                self.conn.execute(
+                    """UPDATE breaches SET breach_date = ?, data_types = ?, severity = ?,
+                        last_seen_at = datetime('now')
+                    WHERE person_id = ? AND source = ? AND breach_name = ?""",
+                    (*values, person_id, *key),
+                )
+                result["known"] += 1
+        return result
+
+    def get_breaches(self, person_id: int, unreported_only: bool = False) -> list[dict]:
+        query = "SELECT * FROM breaches WHERE person_id = ?"
+        if unreported_only:
+            query += " AND reported_at IS NULL"
+        rows = self.conn.execute(query + " ORDER BY id", (person_id,)).fetchall()
+        breaches = []
+        for row in rows:
+            breach = dict(row)
+            breach["data_types"] = json.loads(breach["data_types"] or "[]")
+            breaches.append(breach)
+        return breaches
+
+    def mark_breaches_reported(self, person_id: int) -> int:
+        """Mark every unreported breach for a person as reported; returns how many."""
+        with self.conn:
+            return self.conn.execute(
+                "UPDATE breaches SET reported_at = datetime('now') WHERE person_id = ? AND reported_at IS NULL",
+                (person_id,),
+            ).rowcount
+
     # --- Removal operations ---
 
     def insert_removal(
@@ -421,6 +664,319 @@ class Database:
         ).fetchall()
         return [dict(r) for r in rows]
 
+    # --- Username scan job operations ---
+
+    def enqueue_username_job(
+        self, username: str, person_id: Optional[int] = None, tier: str = "full"
+    ) -> int:
+        """Queue a username scan; returns the existing job if one is already pending."""
+        row = self.conn.execute(
+            "SELECT id FROM username_jobs WHERE username = ? AND tier = ? AND status IN ('queued', 'running')",
+            (username, tier),
+        ).fetchone()
+        if row:
+            return row["id"]
+        cursor = self.conn.execute(
+            "INSERT INTO username_jobs (username, person_id, tier) VALUES (?, ?, ?)",
+            (username, person_id, tier),
+        )
+        self.conn.commit()
+        return cursor.lastrowid
+
+    def record_username_scan(
+        self,
+        username: str,
+        tier: str,
+        status: str,
+        results: list[dict],
+        person_id: Optional[int] = None,
+        error: Optional[str] = None,
+    ) -> int:
+        """Store a scan that ran outside the job queue (e.g. the pipeline's fast tier)."""
+        cursor = self.conn.execute(
+            """INSERT INTO username_jobs
+            (username, person_id, tier, status, results, error, started_at, completed_at)
+            VALUES (?, ?, ?, ?, ?, ?, datetime('now'), datetime('now'))""",
+            (username, person_id, tier, status, json.dumps(results), error),
+        )
+        self.conn.commit()
+        return cursor.lastrowid
+
+    def get_username_accounts(self, username: str) -> list[dict]:
+        """Accounts found for a username, merged across the latest scan of each tier."""
+        rows = self.conn.execute(
+            """SELECT results FROM username_jobs WHERE id IN (
+                SELECT MAX(id) FROM username_jobs
+                WHERE username = ? AND status IN ('completed', 'timeout', 'cancelled')
+                GROUP BY tier
+            ) ORDER BY id""",
+            (username,),
+        ).fetchall()
+        accounts: dict[str, dict] = {}
+        for row in rows:
+            for result in json.loads(row["results"] or "[]"):
+                known = accounts.get(result["site_name"])
+                # Keep the tagged (JSON report) version over a bare stdout line
+                if known is None or (result.get("tags") and not known.get("tags")):
+                    accounts[result["site_name"]] = result
+        return list(accounts.values())
+
+    def claim_username_job(self) -> Optional[dict]:
+        """Mark the oldest queued job as running and return it."""
+        while True:
+            row = self.conn.execute(
+                "SELECT id FROM username_jobs WHERE status = 'queued' ORDER BY id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            claimed = self.conn.execute(
+                """UPDATE username_jobs SET status = 'running', started_at = datetime('now')
+                WHERE id = ? AND status = 'queued'""",
+                (row["id"],),
+            ).rowcount
+            self.conn.commit()
+            # Another worker process may have claimed it first
+            if claimed:
+                return self.get_username_job(row["id"])
+
+    def finish_username_job(
+        self, job_id: int, status: str, results: list[dict], error: Optional[str] = None
+    ) -> None:
+        self.conn.execute(
+            """UPDATE username_jobs SET status = ?, results = ?, error = ?, completed_at = datetime('now')
+            WHERE id = ?""",
+            (status, json.dumps(results), error, job_id),
+        )
+        self.conn.commit()
+
+    def cancel_username_jobs(self, job_id: Optional[int] = None) -> int:
+        """Cancel one job (or every pending job). Running jobs are flagged for the worker to kill."""
+        where, params = ("AND id = ?", (job_id,)) if job_id is not None else ("", ())
+        cancelled = self.conn.execute(
+            f"""UPDATE username_jobs SET status = 'cancelled', completed_at = datetime('now')
+            WHERE status = 'queued' {where}""",
+            params,
+        ).rowcount
+        cancelled += self.conn.execute(
+            f"UPDATE username_jobs SET cancel_requested = 1 WHERE status = 'running' {where}",
+            params,
+        ).rowcount
+        self.conn.commit()
+        return cancelled
+
+    def username_job_cancel_requested(self, job_id: int) -> bool:
+        row = self.conn.execute("SELECT cancel_requested FROM username_jobs WHERE id = ?", (job_id,)).fetchone()
+        return bool(row and row["cancel_requested"])
+
+    def requeue_running_username_jobs(self) -> int:
+        """Put jobs left 'running' by a worker that died back in the queue."""
+        count = self.conn.execute(
+            """UPDATE username_jobs SET status = CASE cancel_requested WHEN 1 THEN 'cancelled' ELSE 'queued' END,
+            started_at = NULL WHERE status = 'running'"""
+        ).rowcount
+        self.conn.commit()
+        return count
+
+    def get_username_job(self, job_id: int) -> Optional[dict]:
+        row = self.conn.execute("SELECT * FROM username_jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_username_job(row) if row else None
+
+    def list_username_jobs(self, status: Optional[str] = None, limit: int = 100) -> list[dict]:
+        if status:
+            rows = self.conn.execute(
+                "SELECT * FROM username_jobs WHERE status = ? ORDER BY id DESC LIMIT ?", (status, limit)
+            ).fetchall()
+        else:
+            rows = self.conn.execute("SELECT * FROM username_jobs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+        return [self._row_to_username_job(r) for r in rows]
+
+    def get_username_sites(self, username: str, claimed_only: bool = False) -> dict[str, dict]:
+        """Cached per-site Maigret results for a username, keyed by site name."""
+        query = "SELECT * FROM username_sites WHERE username = ?"
+        if claimed_only:
+            query += " AND claimed = 1"
+        sites = {}
+        for row in self.conn.execute(query + " ORDER BY site_name", (username,)):
+            site = dict(row)
+            site["claimed"] = bool(site["claimed"])
+            site["tags"] = json.loads(site["tags"] or "[]")
+            sites[site["site_name"]] = site
+        return sites
+
+    def update_username_sites(
+        self,
+        username: str,
+        claimed: list[dict],
+        unclaimed: list[str],
+        checked_at: float,
+    ) -> None:
+        """Record sites just checked: ``claimed`` results and ``unclaimed`` site names."""
+        self.conn.executemany(
+            """INSERT INTO username_sites (username, site_name, claimed, url, tags, first_seen_at, last_checked_at)
+            VALUES (?, ?, 1, ?, ?, ?, ?)
+            ON CONFLICT(username, site_name) DO UPDATE SET
+                claimed = 1, url = excluded.url, last_checked_at = excluded.last_checked_at,
+                tags = CASE WHEN excluded.tags != '[]' THEN excluded.tags ELSE username_sites.tags END,
+                first_seen_at = CASE WHEN username_sites.claimed = 1
+                    THEN username_sites.first_seen_at ELSE excluded.first_seen_at END""",
+            [(username, r["site_name"], r.get("url", ""), json.dumps(r.get("tags", [])), checked_at, checked_at)
+             for r in claimed],
+        )
+        self.conn.executemany(
+            """INSERT INTO username_sites (username, site_name, claimed, last_checked_at)
+            VALUES (?, ?, 0, ?)
+            ON CONFLICT(username, site_name) DO UPDATE SET
+                claimed = 0, first_seen_at = NULL, last_checked_at = excluded.last_checked_at""",
+            [(username, site, checked_at) for site in unclaimed],
+        )
+        self.conn.commit()
+
+    def get_dork_queries(self, backend: str, queries: list[str]) -> dict[str, dict]:
+        """Last fetch of each of ``queries`` from ``backend``: ``{"fetched_at", "results"}``.
+
+        Queries never fetched are absent.
+        """
+        fetched = {}
+        for i in range(0, len(queries), 500):
+            chunk = queries[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT query, fetched_at, results FROM dork_queries WHERE backend = ? "
+                f"AND query IN ({','.join('?' * len(chunk))})",
+                (backend, *chunk),
+            ).fetchall()
+            for row in rows:
+                fetched[row["query"]] = {
+                    "fetched_at": row["fetched_at"],
+                    "results": json.loads(row["results"] or "[]"),
+                }
+        return fetched
+
+    def record_dork_queries(self, backend: str, results: dict[str, list[dict]], fetched_at: float) -> None:
+        """Store the results each query returned (query -> list of result dicts)."""
+        self.conn.executemany(
+            """INSERT INTO dork_queries (backend, query, fetched_at, results) VALUES (?, ?, ?, ?)
+            ON CONFLICT(backend, query) DO UPDATE SET
+                fetched_at = excluded.fetched_at, results = excluded.results""",
+            [(backend, q, fetched_at, json.dumps(rows)) for q, rows in results.items()],
+        )
+        self.conn.commit()
+
+    # --- Broker health operations ---
+
+    def get_broker_latencies(self, broker_slug: str, limit: int) -> list[float]:
+        """The ``limit`` most recent successful fetch times (ms), newest first."""
+        rows = self.conn.execute(
+            "SELECT elapsed_ms FROM broker_latency WHERE broker_slug = ? ORDER BY id DESC LIMIT ?",
+            (broker_slug, limit),
+        ).fetchall()
+        return [r[0] for r in rows]
+
+    def record_broker_success(self, broker_slug: str, elapsed_ms: float, window: int, recorded_at: float) -> None:
+        """Add a latency sample (keeping the newest ``window``) and close the breaker."""
+        self.conn.execute(
+            "INSERT INTO broker_latency (broker_slug, elapsed_ms, recorded_at) VALUES (?, ?, ?)",
+            (broker_slug, elapsed_ms, recorded_at),
+        )
+        self.conn.execute(
+            """DELETE FROM broker_latency WHERE broker_slug = ? AND id NOT IN (
+                SELECT id FROM broker_latency WHERE broker_slug = ? ORDER BY id DESC LIMIT ?)""",
+            (broker_slug, broker_slug, window),
+        )
+        self.conn.execute(
+            """INSERT INTO broker_breakers (broker_slug, consecutive_failures, opened_until, updated_at)
+            VALUES (?, 0, 0, ?)
+            ON CONFLICT(broker_slug) DO UPDATE SET
+                consecutive_failures = 0, opened_until = 0, updated_at = excluded.updated_at""",
+            (broker_slug, recorded_at),
+        )
+        self.conn.commit()
+
+    def get_broker_breaker(self, broker_slug: str) -> Optional[dict]:
+        row = self.conn.execute(
+            "SELECT * FROM broker_breakers WHERE broker_slug = ?", (broker_slug,)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def update_broker_breaker(
+        self,
+        broker_slug: str,
+        consecutive_failures: int,
+        opened_until: float,
+        last_error: Optional[str],
+        updated_at: float,
+    ) -> None:
+        self.conn.execute(
+            """INSERT OR REPLACE INTO broker_breakers
+            (broker_slug, consecutive_failures, opened_until, last_error, updated_at)
+            VALUES (?, ?, ?, ?, ?)""",
+            (broker_slug, consecutive_failures, opened_until, last_error, updated_at),
+        )
+        self.conn.commit()
+
+    def delete_broker_breaker(self, broker_slug: str) -> None:
+        self.conn.execute("DELETE FROM broker_breakers WHERE broker_slug = ?", (broker_slug,))
+        self.conn.commit()
+
+    def list_broker_breakers(self) -> list[dict]:
+        rows = self.conn.execute("SELECT * FROM broker_breakers ORDER BY broker_slug").fetchall()
+        return [dict(r) for r in rows]
+
+    # --- HIBP breach catalogue operations ---
+
+    def get_hibp_catalogue(self) -> dict[str, dict]:
+        """Every catalogued breach, keyed by its HIBP ``Name``."""
+        rows = self.conn.execute(
+            "SELECT name, title, domain, breach_date, data_classes, is_verified FROM hibp_catalogue"
+        ).fetchall()
+        return {
+            row["name"]: {
+                "name": row["name"],
+                "title": row["title"],
+                "domain": row["domain"] or "",
+                "breach_date": row["breach_date"] or "",
+                "data_classes": json.loads(row["data_classes"] or "[]"),
+                "is_verified": bool(row["is_verified"]),
+            }
+            for row in rows
+        }
+
+    def replace_hibp_catalogue(self, breaches: list[dict]) -> None:
+        """Replace the catalogue with HIBP ``/breaches`` JSON."""
+        with self.conn:
+            self.conn.execute("DELETE FROM hibp_catalogue")
+            self.conn.executemany(
+                """INSERT OR REPLACE INTO hibp_catalogue
+                (name, title, domain, breach_date, data_classes, is_verified)
+                VALUES (?, ?, ?, ?, ?, ?)""",
+                [
+                    (
+                        b["Name"],
+                        b.get("Title", b["Name"]),
+                        b.get("Domain", ""),
+                        b.get("BreachDate", ""),
+                        json.dumps(b.get("DataClasses", [])),
+                        int(b.get("IsVerified", False)),
+                    )
+                    for b in breaches
+                ],
+            )
+
+    def get_hibp_catalogue_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM hibp_catalogue_meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def set_hibp_catalogue_meta(self, **values: Optional[str]) -> None:
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO hibp_catalogue_meta (key, value) VALUES (?, ?)", list(values.items())
+        )
+        self.conn.commit()
+
+    def _row_to_username_job(self, row: sqlite3.Row) -> dict:
+        job = dict(row)
+        job["results"] = json.loads(job.get("results") or "[]")
+        job["cancel_requested"] = bool(job.get("cancel_requested"))
+        return job
+
     # --- Status ---
 
     def get_status(self) -> dict:
@@ -430,6 +986,9 @@ class Database:
         findings_active = self.conn.execute("SELECT COUNT(*) FROM findings WHERE status = 'active'").fetchone()[0]
         findings_removed = self.conn.execute("SELECT COUNT(*) FROM findings WHERE status = 'removed'").fetchone()[0]
         findings_pending = self.conn.execute("SELECT COUNT(*) FROM findings WHERE status = 'removal_pending'").fetchone()[0]
+        findings_disappeared = self.conn.execute(
+            "SELECT COUNT(*) FROM findings WHERE status = 'disappeared'"
+        ).fetchone()[0]
 
         removals_pending = self.conn.execute("SELECT COUNT(*) FROM removals WHERE status = 'pending'").fetchone()[0]
         removals_submitted = self.conn.execute("SELECT COUNT(*) FROM removals WHERE status = 'submitted'").fetchone()[0]
@@ -446,6 +1005,7 @@ class Database:
                 "active": findings_active,
                 "removal_pending": findings_pending,
                 "removed": findings_removed,
+                "disappeared": findings_disappeared,
             },
             "removals": {
                 "pending": removals_pending,
@@ -0,0 +1,158 @@
+"""SQLite-backed response cache for the shared HTTP client."""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+
+from digital_footprint.sqlite_cache import SqliteCache
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+HOUR = 3600
+
+# Responses worth reusing: 404 is HIBP's "no breaches/pastes" answer
+CACHEABLE_STATUSES = {200, 404}
+STORED_HEADERS = ("content-type", "etag", "last-modified")
+SECRET_PARAM_RE = re.compile(r"(key|token|secret|password|auth)", re.IGNORECASE)
+REDACTED = "REDACTED"
+
+
+@dataclass
+class CacheRule:
+    host: str
+    path_prefix: str
+    ttl_seconds: int
+
+
+# Endpoint name -> rule. Only matching GET requests are cached.
+DEFAULT_RULES = {
+    "breachedaccount": CacheRule("haveibeenpwned.com", "/api/v3/breachedaccount/", 24 * HOUR),
+    "pasteaccount": CacheRule("haveibeenpwned.com", "/api/v3/pasteaccount/", 12 * HOUR),
+    "dehashed": CacheRule("api.dehashed.com", "/search", 24 * HOUR),
+    "ahmia": CacheRule("ahmia.fi", "/search", 6 * HOUR),
+}
+
+
+def parse_duration(value: str) -> int:
+    """Seconds from ``"90"``, ``"30m"``, ``"12h"`` or ``"7d"``."""
+    value = value.strip().lower()
+    units = {"s": 1, "m": 60, "h": HOUR, "d": 24 * HOUR}
+    if value and value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+
+def parse_ttl_overrides(spec: str) -> dict[str, int]:
+    """Parse ``"breachedaccount=24h,ahmia=0"`` into endpoint -> seconds."""
+    overrides = {}
+    for item in spec.split(","):
+        name, sep, value = item.partition("=")
+        if sep and name.strip():
+            overrides[name.strip()] = parse_duration(value)
+    return overrides
+
+
+def redact_url(url: str, params: Optional[dict] = None) -> str:
+    """URL with ``params`` merged in, sorted, and secret-looking values redacted."""
+    parts = urlsplit(str(url))
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query += [(k, str(v)) for k, v in params.items()]
+    query = sorted((k, REDACTED if SECRET_PARAM_RE.search(k) else v) for k, v in query)
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+
+class ResponseCache(SqliteCache):
+    """Size-bounded LRU cache of HTTP responses in a SQLite file.
+
+    Only GET requests matching a rule are cached, for that rule's TTL (a
+    TTL of 0 disables the endpoint). Keys cover the method and the full
+    URL including query parameters; secret-looking parameters are redacted
+    and request headers (API keys, auth) are never stored.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_overrides: Optional[dict[str, int]] = None,
+    ):
+        super().__init__(
+            path, "http_responses", max_bytes,
+            extra_columns=("status INTEGER NOT NULL", "headers TEXT NOT NULL"),
+        )
+        self.rules = {name: CacheRule(r.host, r.path_prefix, r.ttl_seconds) for name, r in DEFAULT_RULES.items()}
+        for name, ttl in (ttl_overrides or {}).items():
+            if name in self.rules:
+                self.rules[name].ttl_seconds = ttl
+
+    def ttl_for(self, method: str, url: str) -> int:
+        """TTL for a request, or 0 if it is not cacheable."""
+        if method.upper() != "GET":
+            return 0
+        parts = urlsplit(str(url))
+        host = (parts.hostname or "").lower()
+        for rule in self.rules.values():
+            if (host == rule.host or host.endswith("." + rule.host)) and parts.path.startswith(rule.path_prefix):
+                return rule.ttl_seconds
+        return 0
+
+    @staticmethod
+    def key(method: str, redacted_url: str) -> str:
+        return hashlib.sha256(f"{method.upper()}\n{redacted_url}".encode()).hexdigest()
+
+    def get(self, method: str, url: str, params: Optional[dict] = None) -> Optional[httpx.Response]:
+        if not self.ttl_for(method, url):
+            return None
+        redacted = redact_url(url, params)
+        entry = self.get_entry(self.key(method, redacted))
+        if entry is None:
+            return None
+        body, extra = entry
+        headers = json.loads(extra["headers"])
+        headers["x-cache"] = "HIT"
+        return httpx.Response(
+            extra["status"],
+            headers=headers,
+            content=body,
+            request=httpx.Request(method.upper(), redacted),
+        )
+
+    def put(self, response: httpx.Response) -> bool:
+        """Store a response if its endpoint and status are cacheable.
+
+        The key comes from ``response.request``, whose URL already carries
+        the query parameters the request was sent with.
+        """
+        method, url = response.request.method, str(response.request.url)
+        ttl = self.ttl_for(method, url)
+        if not ttl or response.status_code not in CACHEABLE_STATUSES:
+            return False
+        if response.headers.get("x-cache") == "HIT":
+            return False
+        redacted = redact_url(url)
+        headers = {h: response.headers[h] for h in STORED_HEADERS if h in response.headers}
+        self.put_entry(
+            self.key(method, redacted), redacted, response.content, ttl,
+            status=response.status_code, headers=json.dumps(headers),
+        )
+        return True
+
+    def stats(self) -> dict:
+        return dict(super().stats(), ttls={name: rule.ttl_seconds for name, rule in self.rules.items()})
+
+
+def open_response_cache(config) -> Optional[ResponseCache]:
+    """The response cache described by ``config``, or None if it is disabled."""
+    if not config.http_cache_enabled:
+        return None
+    return ResponseCache(
+        config.http_cache_path,
+        max_bytes=config.http_cache_max_mb * 1024 * 1024,
+        ttl_overrides=parse_ttl_overrides(config.http_cache_ttls),
+    )
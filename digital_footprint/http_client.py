@@ -0,0 +1,211 @@
+"""Process-wide pooled httpx client shared by the external API scanners."""
+
+import asyncio
+import contextlib
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+if TYPE_CHECKING:
+    from digital_footprint.http_cache import ResponseCache
+
+DEFAULT_TIMEOUT = 15.0
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 10
+KEEPALIVE_EXPIRY = 60.0
+USER_AGENT = "DigitalFootprint-Scanner"
+
+
+@dataclass
+class HostPolicy:
+    max_connections: int = 4
+    timeout: float = DEFAULT_TIMEOUT
+
+
+DEFAULT_POLICY = HostPolicy()
+
+HOST_POLICIES = {
+    "haveibeenpwned.com": HostPolicy(max_connections=4, timeout=15.0),
+    "api.pwnedpasswords.com": HostPolicy(max_connections=8, timeout=10.0),
+    "api.dehashed.com": HostPolicy(max_connections=4, timeout=30.0),
+    "ahmia.fi": HostPolicy(max_connections=2, timeout=20.0),
+}
+
+
+def http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class HttpClientManager:
+    """Hand out one keep-alive ``httpx.AsyncClient`` per event loop.
+
+    httpx clients are bound to the loop they first ran on, and the sync
+    wrappers in this project (pipeline, scheduler, MCP tools) start their
+    own loops, so clients are keyed by loop rather than being a single
+    global. Requests through :meth:`request` are capped per host and get
+    the host's default timeout. HTTP/2 is used when the optional ``h2``
+    package is installed.
+
+    With a :class:`~digital_footprint.http_cache.ResponseCache` attached,
+    cacheable GETs are answered from it and fresh responses are stored.
+    """
+
+    def __init__(
+        self,
+        http2: Optional[bool] = None,
+        max_connections: int = MAX_CONNECTIONS,
+        max_keepalive_connections: int = MAX_KEEPALIVE_CONNECTIONS,
+        host_policies: Optional[dict[str, HostPolicy]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional["ResponseCache"] = None,
+    ):
+        self.http2 = http2_available() if http2 is None else (http2 and http2_available())
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        )
+        self.host_policies = HOST_POLICIES if host_policies is None else host_policies
+        self.transport = transport
+        self.cache = cache
+        self.clients_created = 0
+        self._clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self._semaphores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    def policy_for(self, url: str) -> HostPolicy:
+        host = (urlsplit(url).hostname or "").lower()
+        while host:
+            if host in self.host_policies:
+                return self.host_policies[host]
+            _, _, host = host.partition(".")
+        return DEFAULT_POLICY
+
+    def client(self) -> httpx.AsyncClient:
+        """The pooled client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=self.limits,
+                timeout=DEFAULT_TIMEOUT,
+                headers={"user-agent": USER_AGENT},
+                transport=self.transport,
+            )
+            self._clients[loop] = client
+            self.clients_created += 1
+        return client
+
+    def _semaphore(self, url: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        per_host = self._semaphores.setdefault(loop, {})
+        host = (urlsplit(url).hostname or "").lower()
+        if host not in per_host:
+            per_host[host] = asyncio.Semaphore(self.policy_for(url).max_connections)
+        return per_host[host]
+
+    def cached_response(self, method: str, url: str, params: Optional[dict] = None) -> Optional[httpx.Response]:
+        """A fresh cached response for this request, if the cache has one."""
+        if self.cache is None:
+            return None
+        return self.cache.get(method, url, params)
+
+    def store_response(self, response: httpx.Response) -> None:
+        if self.cache is not None:
+            self.cache.put(response)
+
+    async def request(self, method: str, url: str, use_cache: bool = True, **kwargs) -> httpx.Response:
+        """Send a request, serving cacheable GETs from the response cache.
+
+        ``use_cache=False`` skips both the lookup and the store, for
+        callers that consult the cache themselves.
+        """
+        if use_cache:
+            cached = self.cached_response(method, url, kwargs.get("params"))
+            if cached is not None:
+                return cached
+        kwargs.setdefault("timeout", self.policy_for(url).timeout)
+        async with self._semaphore(url):
+            response = await self.client().request(method, url, **kwargs)
+        if use_cache:
+            self.store_response(response)
+        return response
+
+    @contextlib.asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs):
+        """Stream a response under the host's connection cap and timeout.
+
+        Streamed responses bypass the cache; callers that want caching use
+        :meth:`cached_response` and :meth:`store_response` themselves.
+        """
+        kwargs.setdefault("timeout", self.policy_for(url).timeout)
+        async with self._semaphore(url):
+            async with self.client().stream(method, url, **kwargs) as response:
+                yield response
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close the client belonging to the running loop, if any."""
+        loop = asyncio.get_running_loop()
+        self._semaphores.pop(loop, None)
+        client = self._clients.pop(loop, None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+
+_manager: Optional[HttpClientManager] = None
+
+
+def get_http_client() -> HttpClientManager:
+    """The process-wide :class:`HttpClientManager`."""
+    global _manager
+    if _manager is None:
+        _manager = HttpClientManager()
+    return _manager
+
+
+def configure_http_cache(cache: Optional["ResponseCache"]) -> None:
+    """Attach ``cache`` to the shared client (None disables caching)."""
+    manager = get_http_client()
+    if manager.cache is not None and manager.cache is not cache:
+        manager.cache.close()
+    manager.cache = cache
+
+
+async def aclose_http_client() -> None:
+    if _manager is not None:
+        await _manager.aclose()
+
+
+async def _run_and_close(coro):
+    try:
+        return await coro
+    finally:
+        await aclose_http_client()
+
+
+def run_async(coro):
+    """Run a coroutine from sync code and close the pooled client it used.
+
+    Works whether or not an event loop is already running in this thread
+    (the MCP server calls sync tools from inside its loop).
+    """
+    try:
+        loop = asyncio.get_event_loop()
+        if loop.is_running():
+            import concurrent.futures
+            with concurrent.futures.ThreadPoolExecutor() as pool:
+                return pool.submit(asyncio.run, _run_and_close(coro)).result()
+        else:
+            return loop.run_until_complete(_run_and_close(coro))
+    except RuntimeError:
+        return asyncio.run(_run_and_close(coro))
@@ -36,11 +36,15 @@ class Broker:
     ccpa_compliant: bool = False
     gdpr_compliant: bool = False
     notes: Optional[str] = None
+    search_url_pattern: Optional[str] = None
+    render_mode: str = "browser"
+    cache_ttl_hours: Optional[int] = None
     id: Optional[int] = None
 
     @classmethod
     def from_yaml(cls, slug: str, data: dict[str, Any]) -> "Broker":
         opt_out = data.get("opt_out", {})
+        search = data.get("search", {})
         return cls(
             slug=slug,
             name=data["name"],
@@ -55,6 +59,9 @@ class Broker:
             ccpa_compliant=data.get("ccpa_compliant", False),
             gdpr_compliant=data.get("gdpr_compliant", False),
             notes=data.get("notes"),
+            search_url_pattern=search.get("url_pattern"),
+            render_mode=search.get("render_mode", "browser"),
+            cache_ttl_hours=search.get("cache_ttl_hours"),
         )
 
 
@@ -4,14 +4,24 @@ import logging
 from typing import Optional
 
 from digital_footprint.scanners.dark_web_scanner import check_hibp_pastes, search_ahmia
+from digital_footprint.scanners.hibp_scheduler import PRIORITY_NORMAL
 from digital_footprint.scanners.holehe_scanner import check_email_registrations
 
 logger = logging.getLogger("digital_footprint.monitors")
 
 
-async def run_dark_web_scan(email: str, hibp_api_key: Optional[str] = None) -> dict:
+async def run_dark_web_scan(
+    email: str,
+    hibp_api_key: Optional[str] = None,
+    hibp_rpm: Optional[float] = None,
+    priority: int = PRIORITY_NORMAL,
+) -> dict:
     """Run all dark web monitoring scans for an email."""
-    pastes = await check_hibp_pastes(email, api_key=hibp_api_key)
+    try:
+        pastes = await check_hibp_pastes(email, api_key=hibp_api_key, rpm=hibp_rpm, priority=priority)
+    except Exception as e:
+        logger.warning(f"HIBP paste check failed for {email}: {e}")
+        pastes = []
 
     try:
         ahmia_results = await search_ahmia(email)
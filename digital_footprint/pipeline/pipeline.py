@@ -2,13 +2,23 @@
 
 import asyncio
 import logging
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 
+from digital_footprint.broker_registry import load_all_brokers
 from digital_footprint.config import Config
 from digital_footprint.db import Database
-from digital_footprint.scanners.breach_scanner import scan_breaches
+from digital_footprint.http_client import run_async
+from digital_footprint.scanners.breach_scanner import (
+    DehashedSummary,
+    save_breach_results,
+    scan_breaches_many,
+)
+from digital_footprint.scanners.broker_health import BrokerHealth
+from digital_footprint.scanners.broker_scanner import save_broker_results, scan_all_brokers, split_name
+from digital_footprint.scanners.hibp_catalogue import BreachCatalogue
+from digital_footprint.scanners.username_scanner import UsernameResult, UsernameScan, scan_username
 from digital_footprint.monitors.dark_web_monitor import run_dark_web_scan
 from digital_footprint.reporters.exposure_report import (
     generate_exposure_report,
@@ -25,6 +35,7 @@ class PipelineResult:
     completed_at: str = ""
     status: str = "running"
     breaches_found: int = 0
+    new_breaches: int = 0
     dark_web_findings: int = 0
     accounts_found: int = 0
     removals_submitted: int = 0
@@ -33,18 +44,133 @@ class PipelineResult:
     error: Optional[str] = None
 
 
-def _run_async(coro):
-    """Run an async function from sync context."""
+def _breach_stage(
+    emails: list[str],
+    config: Config,
+    db: Optional[Database] = None,
+    person_id: Optional[int] = None,
+) -> dict:
+    """Check all emails concurrently and merge the per-email results.
+
+    DeHashed records are streamed into a per-database summary rather than
+    kept, since one identity can have thousands of them. With ``db`` the
+    results are saved for ``person_id`` and ``new`` holds the
+    ``(source, breach_name)`` keys not recorded before.
+    """
+    breach_results = {"hibp_breaches": [], "dehashed_summary": DehashedSummary(), "total": 0, "new": set()}
+    catalogue = BreachCatalogue(db) if config.hibp_api_key and db is not None else None
+    try:
+        batch = run_async(scan_breaches_many(
+            emails,
+            hibp_api_key=config.hibp_api_key,
+            dehashed_api_key=config.dehashed_api_key,
+            hibp_rpm=config.hibp_rpm,
+            catalogue=catalogue,
+            keep_dehashed_records=False,
+        ))
+    except Exception as e:
+        logger.error(f"Breach check failed: {e}")
+        return breach_results
+
+    for provider, failures in batch.get("errors", {}).items():
+        for email, message in failures.items():
+            logger.error(f"Breach check ({provider}) failed for {email}: {message}")
+    for results in batch.get("results", []):
+        breach_results["hibp_breaches"].extend(results.get("hibp_breaches", []))
+        summary = results.get("dehashed_summary")
+        if summary is None:
+            summary = DehashedSummary()
+            summary.add(results.get("dehashed_records", []))
+        breach_results["dehashed_summary"].merge(summary)
+        breach_results["total"] += results.get("total", 0)
+        if db is not None:
+            diff = save_breach_results(db, person_id, results)
+            breach_results["new"].update((b["source"], b["breach_name"]) for b in diff["new"])
+    return breach_results
+
+
+async def _dark_web_stage(emails: list[str], config: Config) -> dict:
+    dark_web_results = {"pastes": [], "ahmia_results": [], "holehe_results": [], "total": 0}
+    for email in emails:
+        try:
+            results = await run_dark_web_scan(email, hibp_api_key=config.hibp_api_key, hibp_rpm=config.hibp_rpm)
+            dark_web_results["pastes"].extend(results.get("pastes", []))
+            dark_web_results["ahmia_results"].extend(results.get("ahmia_results", []))
+            dark_web_results["holehe_results"].extend(results.get("holehe_results", []))
+            dark_web_results["total"] += results.get("total", 0)
+        except Exception as e:
+            logger.error(f"Dark web scan failed for {email}: {e}")
+    return dark_web_results
+
+
+def _broker_stage(person, config: Config, db: Database) -> list[dict]:
+    """Scan every broker with a search URL and save the listings as findings.
+
+    Listings gone since the last scan of a broker are marked disappeared
+    in ``findings`` (see :func:`save_broker_results`).
+    """
+    brokers = [asdict(b) for b in load_all_brokers(config.brokers_dir) if b.search_url_pattern]
+    first_name, last_name = split_name(person.name)
+    if not brokers or not (first_name or last_name):
+        return []
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                return pool.submit(asyncio.run, coro).result()
+        results = run_async(scan_all_brokers(brokers, first_name, last_name, health=BrokerHealth(db)))
+    except Exception as e:
+        logger.error(f"Broker scan failed: {e}")
+        return []
+    counts = save_broker_results(db, person.id, results)
+    logger.info(f"Broker findings for {person.name}: {counts}")
+    return [
+        {"broker_name": r.broker_name, "url": r.url, "found": r.found, "risk_level": r.risk_level}
+        for r in results
+        if not r.error and not r.skipped
+    ]
+
+
+# Maigret's per-request timeout inside the pipeline's fast tier
+USERNAME_REQUEST_TIMEOUT = 10
+
+
+async def _username_fast_scans(usernames: list[str], config: Config) -> list[UsernameScan]:
+    """Fast-tier Maigret scans for every username, bounded by the time budget."""
+    budget = config.username_time_budget
+    return await asyncio.gather(*(
+        scan_username(
+            username,
+            timeout=min(USERNAME_REQUEST_TIMEOUT, budget),
+            deadline=budget,
+            tier="fast",
+            top_sites=config.maigret_top_sites,
+        )
+        for username in usernames
+    ))
+
+
+def _username_stage(usernames: list[str], config: Config, db: Database, person_id: int) -> list[dict]:
+    """Scan the fast tier now and queue the long tail for the background pool.
+
+    Returns the accounts known for these usernames, merged across tiers
+    (so a finished background scan from an earlier run is included).
+    """
+    if config.username_time_budget <= 0:
+        return []
+    scans = run_async(_username_fast_scans(usernames, config))
+    for username, scan in zip(usernames, scans):
+        db.record_username_scan(
+            username, "fast", scan.status, [asdict(r) for r in scan.results],
+            person_id=person_id, error=scan.error,
+        )
+        if scan.status == "failed":
+            logger.warning(f"Username scan failed for {username}: {scan.error}")
         else:
-            return loop.run_until_complete(coro)
-    except RuntimeError:
-        return asyncio.run(coro)
+            db.enqueue_username_job(username, person_id=person_id, tier="tail")
+
+    accounts = []
+    for username in usernames:
+        for account in db.get_username_accounts(username):
+            result = UsernameResult(**account)
+            accounts.append({"site_name": result.site_name, "url": result.url, "risk_level": result.risk_level})
+    return accounts
 
 
 def protect_person(person_id: int, db: Database, config: Config) -> PipelineResult:
@@ -64,44 +190,30 @@ def protect_person(person_id: int, db: Database, config: Config) -> PipelineResu
     # Create pipeline run record
     run_id = db.insert_pipeline_run(person_id=person_id, started_at=started)
 
-    breach_results = {"hibp_breaches": [], "dehashed_records": [], "total": 0}
+    breach_results = {"hibp_breaches": [], "dehashed_summary": DehashedSummary(), "total": 0, "new": set()}
     dark_web_results = {"pastes": [], "ahmia_results": [], "holehe_results": [], "total": 0}
     username_results = []
+    broker_results = []
 
     # Stage 1: Breach check
     if person.emails:
-        for email in person.emails:
-            try:
-                results = _run_async(scan_breaches(
-                    email=email,
-                    hibp_api_key=config.hibp_api_key,
-                    dehashed_api_key=config.dehashed_api_key,
-                ))
-                breach_results["hibp_breaches"].extend(results.get("hibp_breaches", []))
-                breach_results["dehashed_records"].extend(results.get("dehashed_records", []))
-                breach_results["total"] += results.get("total", 0)
-            except Exception as e:
-                logger.error(f"Breach check failed for {email}: {e}")
+        breach_results = _breach_stage(person.emails, config, db=db, person_id=person_id)
 
     # Stage 2: Dark web scan
     if person.emails:
-        for email in person.emails:
-            try:
-                results = _run_async(run_dark_web_scan(email, hibp_api_key=config.hibp_api_key))
-                dark_web_results["pastes"].extend(results.get("pastes", []))
-                dark_web_results["ahmia_results"].extend(results.get("ahmia_results", []))
-                dark_web_results["holehe_results"].extend(results.get("holehe_results", []))
-                dark_web_results["total"] += results.get("total", 0)
-            except Exception as e:
-                logger.error(f"Dark web scan failed for {email}: {e}")
-
-    # Stage 3: Username search (skip actual Maigret call -- too slow for pipeline)
-    accounts_found = 0
+        dark_web_results = run_async(_dark_web_stage(person.emails, config))
+
+    # Stage 3: Broker scan (persisted to findings)
+    broker_results = _broker_stage(person, config, db)
+
+    # Stage 4: Username search (fast tier within the time budget; long tail queued)
     if person.usernames:
-        accounts_found = len(person.usernames)
+        username_results = _username_stage(person.usernames, config, db, person_id)
+    accounts_found = len(username_results)
 
-    # Stage 4: Generate report
+    # Stage 5: Generate report
     # Convert breach dataclass objects to dicts for the report generator
+    new_keys = breach_results["new"]
     hibp_dicts = []
     for b in breach_results["hibp_breaches"]:
         if isinstance(b, dict):
@@ -110,17 +222,17 @@ def protect_person(person_id: int, db: Database, config: Config) -> PipelineResu
             hibp_dicts.append({
                 "name": b.name, "title": b.title,
                 "breach_date": b.breach_date, "data_classes": b.data_classes,
-                "severity": b.severity,
+                "severity": b.severity, "new": ("hibp", b.name) in new_keys,
             })
 
-    dehashed_dicts = []
-    for r in breach_results["dehashed_records"]:
-        if isinstance(r, dict):
-            dehashed_dicts.append(r)
-        else:
-            dehashed_dicts.append({
-                "database_name": r.database_name, "severity": r.severity,
-            })
+    # One entry per leaked database, at the worst severity seen in it
+    dehashed_dicts = [
+        {
+            "database_name": name, "severity": stats["severity"], "count": stats["count"],
+            "new": ("dehashed", name) in new_keys,
+        }
+        for name, stats in breach_results["dehashed_summary"].databases.items()
+    ]
 
     report_breach = {
         "hibp_breaches": hibp_dicts,
@@ -130,14 +242,14 @@ def protect_person(person_id: int, db: Database, config: Config) -> PipelineResu
 
     report = generate_exposure_report(
         person_name=person.name,
-        broker_results=[],
+        broker_results=broker_results,
         breach_results=report_breach,
-        username_results=[{"site_name": u, "url": "", "risk_level": "low"} for u in (person.usernames or [])],
+        username_results=username_results,
         dork_results=[],
     )
 
     # Compute risk score
-    all_findings = []
+    all_findings = [b for b in broker_results if b["found"]]
     for b in hibp_dicts:
         all_findings.append({"risk_level": b.get("severity", "medium")})
     for r in dehashed_dicts:
@@ -166,6 +278,7 @@ def protect_person(person_id: int, db: Database, config: Config) -> PipelineResu
         completed_at=completed,
         status="completed",
         breaches_found=breach_results["total"],
+        new_breaches=len(new_keys),
         dark_web_findings=dark_web_results["total"],
         accounts_found=accounts_found,
         removals_submitted=0,
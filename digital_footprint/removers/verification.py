@@ -3,13 +3,27 @@
 from datetime import datetime
 
 from digital_footprint.scanners.broker_scanner import scan_broker
+from digital_footprint.scanners.page_cache import cache_ttl_for
 
 
 MAX_ATTEMPTS = 3
 
 
 class RemovalVerifier:
-    async def verify_single(self, removal: dict) -> dict:
+    def __init__(self, pool=None, blocker=None, cache=None, health=None):
+        # Optional BrowserPool, ResourceBlocker, PageCache and BrokerHealth
+        # shared across verifications
+        self.pool = pool
+        self.blocker = blocker
+        self.cache = cache
+        self.health = health
+
+    async def verify_single(self, removal: dict, bypass_cache: bool = False) -> dict:
+        """Re-scan the broker for a removal.
+
+        With ``bypass_cache`` the page is always re-fetched (the fresh copy
+        still refreshes the cache).
+        """
         broker_slug = removal["broker_slug"]
         broker_name = removal["broker_name"]
         first_name = removal["person_first_name"]
@@ -24,14 +38,44 @@ class RemovalVerifier:
                 "reason": "No search URL pattern for broker",
             }
 
+        if not first_name and not last_name:
+            return {
+                "removal_id": removal["id"],
+                "status": "error",
+                "attempts": attempts + 1,
+                "message": "No person name to search for",
+            }
+
         result = await scan_broker(
             broker_slug=broker_slug,
             broker_name=broker_name,
             url_pattern=url_pattern,
             first_name=first_name,
             last_name=last_name,
+            pool=self.pool,
+            blocker=self.blocker,
+            cache=self.cache,
+            cache_ttl=cache_ttl_for(removal),
+            refresh_cache=bypass_cache,
+            health=self.health,
         )
 
+        if result.skipped:
+            return {
+                "removal_id": removal["id"],
+                "status": "skipped",
+                "reason": f"{broker_name} is temporarily skipped after repeated failures",
+            }
+
+        # A failed scan (block page, timeout, no browser) says nothing about the listing
+        if result.error:
+            return {
+                "removal_id": removal["id"],
+                "status": "error",
+                "attempts": attempts + 1,
+                "message": f"Could not check {broker_name}: {result.error}",
+            }
+
         if not result.found:
             return {
                 "removal_id": removal["id"],
@@ -73,6 +73,17 @@ def detect_captcha(html: str) -> bool:
 
 
 class WebFormRemover:
+    def __init__(self, pool=None, blocker=None):
+        # Optional BrowserPool; without one each submit launches its own browser
+        self.pool = pool
+        # Optional ResourceBlocker; off by default since CAPTCHAs need images
+        self.blocker = blocker
+
+    def _blocker_for(self, broker: dict):
+        if self.blocker is not None and self.blocker.applies_to(broker.get("slug")):
+            return self.blocker
+        return None
+
     def build_form_data(self, person: dict, broker: dict) -> dict:
         # Normalize list fields to singular
         email = person.get("email", "")
@@ -142,6 +153,74 @@ class WebFormRemover:
                 continue
         return False
 
+    async def _submit_on_page(
+        self,
+        page,
+        person: dict,
+        broker: dict,
+        opt_out_url: str,
+        timeout: int,
+        screenshot_dir: Optional[str],
+    ) -> dict:
+        await page.goto(opt_out_url, timeout=timeout)
+        await page.wait_for_load_state("networkidle", timeout=timeout)
+
+        # Check for CAPTCHA
+        html = await page.content()
+        if detect_captcha(html):
+            return {
+                "status": "captcha_required",
+                "method": "web_form",
+                "broker": broker.get("name", ""),
+                "url": opt_out_url,
+                "message": f"CAPTCHA detected on {broker.get('name', '')}. Manual action required at {opt_out_url}",
+            }
+
+        # Fill the form
+        form_data = self.build_form_data(person, broker)
+        fields_filled = await self._fill_form(page, form_data)
+
+        if fields_filled == 0:
+            page_text = await page.inner_text("body")
+            return {
+                "status": "no_form_found",
+                "method": "web_form",
+                "broker": broker.get("name", ""),
+                "url": opt_out_url,
+                "message": f"No fillable form fields found on {broker.get('name', '')}. Manual action may be required.",
+                "page_excerpt": page_text[:200],
+            }
+
+        # Take screenshot before submit if requested
+        if screenshot_dir:
+            ss_path = Path(screenshot_dir) / f"{broker.get('name', 'unknown')}_pre_submit.png"
+            await page.screenshot(path=str(ss_path))
+
+        # Submit the form
+        submitted = await self._click_submit(page)
+
+        if submitted:
+            await random_delay(2.0, 4.0)
+            await page.wait_for_load_state("networkidle", timeout=10000)
+
+            # Take screenshot after submit
+            if screenshot_dir:
+                ss_path = Path(screenshot_dir) / f"{broker.get('name', 'unknown')}_post_submit.png"
+                await page.screenshot(path=str(ss_path))
+
+        page_text = await page.inner_text("body")
+
+        return {
+            "status": "submitted" if submitted else "filled_not_submitted",
+            "method": "web_form",
+            "broker": broker.get("name", ""),
+            "url": opt_out_url,
+            "fields_filled": fields_filled,
+            "form_submitted": submitted,
+            "submitted_at": datetime.now().isoformat(),
+            "page_excerpt": page_text[:200],
+        }
+
     async def submit(
         self,
         person: dict,
@@ -157,70 +236,17 @@ class WebFormRemover:
                 "message": f"No opt-out URL for {broker.get('name', 'unknown')}",
             }
 
+        blocker = self._blocker_for(broker)
         try:
-            pw, browser, context = await create_stealth_browser()
-            page = await context.new_page()
+            if self.pool is not None:
+                async with self.pool.context(blocker=blocker) as context:
+                    page = await context.new_page()
+                    return await self._submit_on_page(page, person, broker, opt_out_url, timeout, screenshot_dir)
 
+            pw, browser, context = await create_stealth_browser(blocker=blocker)
             try:
-                await page.goto(opt_out_url, timeout=timeout)
-                await page.wait_for_load_state("networkidle", timeout=timeout)
-
-                # Check for CAPTCHA
-                html = await page.content()
-                if detect_captcha(html):
-                    return {
-                        "status": "captcha_required",
-                        "method": "web_form",
-                        "broker": broker.get("name", ""),
-                        "url": opt_out_url,
-                        "message": f"CAPTCHA detected on {broker.get('name', '')}. Manual action required at {opt_out_url}",
-                    }
-
-                # Fill the form
-                form_data = self.build_form_data(person, broker)
-                fields_filled = await self._fill_form(page, form_data)
-
-                if fields_filled == 0:
-                    page_text = await page.inner_text("body")
-                    return {
-                        "status": "no_form_found",
-                        "method": "web_form",
-                        "broker": broker.get("name", ""),
-                        "url": opt_out_url,
-                        "message": f"No fillable form fields found on {broker.get('name', '')}. Manual action may be required.",
-                        "page_excerpt": page_text[:200],
-                    }
-
-                # Take screenshot before submit if requested
-                if screenshot_dir:
-                    ss_path = Path(screenshot_dir) / f"{broker.get('name', 'unknown')}_pre_submit.png"
-                    await page.screenshot(path=str(ss_path))
-
-                # Submit the form
-                submitted = await self._click_submit(page)
-
-                if submitted:
-                    await random_delay(2.0, 4.0)
-                    await page.wait_for_load_state("networkidle", timeout=10000)
-
-                    # Take screenshot after submit
-                    if screenshot_dir:
-                        ss_path = Path(screenshot_dir) / f"{broker.get('name', 'unknown')}_post_submit.png"
-                        await page.screenshot(path=str(ss_path))
-
-                page_text = await page.inner_text("body")
-
-                return {
-                    "status": "submitted" if submitted else "filled_not_submitted",
-                    "method": "web_form",
-                    "broker": broker.get("name", ""),
-                    "url": opt_out_url,
-                    "fields_filled": fields_filled,
-                    "form_submitted": submitted,
-                    "submitted_at": datetime.now().isoformat(),
-                    "page_excerpt": page_text[:200],
-                }
-
+                page = await context.new_page()
+                return await self._submit_on_page(page, person, broker, opt_out_url, timeout, screenshot_dir)
             finally:
                 await browser.close()
                 await pw.stop()
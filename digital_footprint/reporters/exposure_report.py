@@ -79,15 +79,26 @@ def generate_exposure_report(
     # Breach results
     hibp = breach_results.get("hibp_breaches", [])
     dehashed = breach_results.get("dehashed_records", [])
-    lines.append(f"## Data Breaches ({len(hibp)} breaches, {len(dehashed)} records)")
+    record_count = sum(r.get("count", 1) for r in dehashed)
+    lines.append(f"## Data Breaches ({len(hibp)} breaches, {record_count} records)")
     lines.append("")
+    new_count = sum(1 for entry in [*hibp, *dehashed] if entry.get("new"))
+    if new_count:
+        lines.append(f"{new_count} newly detected.")
+        lines.append("")
     if hibp:
         for b in hibp:
-            lines.append(f"- **{b['name']}** ({b.get('breach_date', 'unknown')}): {', '.join(b.get('data_classes', []))}")
+            marker = " (NEW)" if b.get("new") else ""
+            lines.append(f"- **{b['name']}**{marker} ({b.get('breach_date', 'unknown')}): {', '.join(b.get('data_classes', []))}")
     if dehashed:
         for r in dehashed:
             db_name = r.get("database_name", "Unknown")
-            lines.append(f"- **{db_name}**: Exposed record found")
+            marker = " (NEW)" if r.get("new") else ""
+            count = r.get("count", 1)
+            if count > 1:
+                lines.append(f"- **{db_name}**{marker}: {count} exposed records")
+            else:
+                lines.append(f"- **{db_name}**{marker}: Exposed record found")
     if not hibp and not dehashed:
         lines.append("No breach records found.")
     lines.append("")
@@ -1,13 +1,24 @@
 """Breach scanner using HIBP and DeHashed APIs."""
 
+import asyncio
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import AsyncIterator, Iterable, Optional, Union
 
 import httpx
 
+from digital_footprint.http_client import get_http_client
+from digital_footprint.scanners.hibp_catalogue import BreachCatalogue
+from digital_footprint.scanners.hibp_scheduler import PRIORITY_NORMAL, get_hibp_scheduler
+
 
 HIBP_BASE = "https://haveibeenpwned.com/api/v3"
 DEHASHED_BASE = "https://api.dehashed.com"
+DEHASHED_CONCURRENCY = 4
+DEHASHED_PAGE_SIZE = 1000
+# DeHashed will not page past this many results for one query
+DEHASHED_MAX_RESULTS = 10000
+
+SEVERITY_RANK = {"medium": 0, "high": 1, "critical": 2}
 
 
 @dataclass
@@ -48,8 +59,58 @@ class DehashedRecord:
         return "medium"
 
 
-async def check_hibp(email: str, api_key: Optional[str] = None) -> list[HibpBreach]:
-    """Check Have I Been Pwned for breaches affecting this email."""
+@dataclass
+class DehashedSummary:
+    """Record counts per severity and per source database."""
+
+    total: int = 0
+    severities: dict[str, int] = field(default_factory=dict)
+    databases: dict[str, dict] = field(default_factory=dict)
+
+    def add(self, records: Iterable[DehashedRecord]) -> None:
+        for r in records:
+            severity = r.severity
+            self.total += 1
+            self.severities[severity] = self.severities.get(severity, 0) + 1
+            db = self.databases.setdefault(
+                r.database_name or "Unknown", {"count": 0, "severity": severity}
+            )
+            db["count"] += 1
+            if SEVERITY_RANK[severity] > SEVERITY_RANK[db["severity"]]:
+                db["severity"] = severity
+
+    def merge(self, other: "DehashedSummary") -> None:
+        self.total += other.total
+        for severity, count in other.severities.items():
+            self.severities[severity] = self.severities.get(severity, 0) + count
+        for name, stats in other.databases.items():
+            db = self.databases.setdefault(name, {"count": 0, "severity": stats["severity"]})
+            db["count"] += stats["count"]
+            if SEVERITY_RANK[stats["severity"]] > SEVERITY_RANK[db["severity"]]:
+                db["severity"] = stats["severity"]
+
+    def to_dict(self) -> dict:
+        return {"total": self.total, "severities": dict(self.severities), "databases": dict(self.databases)}
+
+
+async def check_hibp(
+    email: str,
+    api_key: Optional[str] = None,
+    rpm: Optional[float] = None,
+    priority: int = PRIORITY_NORMAL,
+    catalogue: Optional[BreachCatalogue] = None,
+) -> list[HibpBreach]:
+    """Check Have I Been Pwned for breaches affecting this email.
+
+    Requests are paced by the key's :class:`HibpScheduler` at ``rpm``;
+    answers still fresh in the HTTP response cache skip the scheduler.
+    Raises ``HibpRateLimitError`` if HIBP keeps returning 429, and
+    ``httpx.HTTPStatusError`` for other unexpected statuses; 404 means
+    no breaches.
+
+    With a ``catalogue`` the truncated (names only) response is requested
+    and details are filled in from the local breach catalogue.
+    """
     if not api_key:
         return []
 
@@ -58,20 +119,31 @@ async def check_hibp(email: str, api_key: Optional[str] = None) -> list[HibpBrea
         "user-agent": "DigitalFootprint-Scanner",
     }
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(
-            f"{HIBP_BASE}/breachedaccount/{email}",
-            headers=headers,
-            params={"truncateResponse": "false"},
+    params = {} if catalogue is not None else {"truncateResponse": "false"}
+    url = f"{HIBP_BASE}/breachedaccount/{email}"
+    http = get_http_client()
+    # Cache hits don't spend a rate-limit slot
+    resp = http.cached_response("GET", url, params)
+    if resp is None:
+        resp = await get_hibp_scheduler(api_key, rpm).request(
+            lambda: http.get(url, headers=headers, params=params, use_cache=False),
+            priority=priority,
         )
+        http.store_response(resp)
 
+    if resp.status_code == 404:
+        return []
     if resp.status_code != 200:
+        resp.raise_for_status()
         return []
 
     breaches = resp.json()
     if not isinstance(breaches, list):
         return []
 
+    if catalogue is not None:
+        return [_from_catalogue(b["Name"], catalogue) for b in breaches]
+
     return [
         HibpBreach(
             name=b["Name"],
@@ -85,55 +157,280 @@ async def check_hibp(email: str, api_key: Optional[str] = None) -> list[HibpBrea
     ]
 
 
+def _from_catalogue(name: str, catalogue: BreachCatalogue) -> HibpBreach:
+    entry = catalogue.get(name)
+    if entry is None:
+        # Breach added to HIBP after the last catalogue refresh
+        return HibpBreach(name=name, title=name, domain="", breach_date="")
+    return HibpBreach(
+        name=name,
+        title=entry["title"],
+        domain=entry["domain"],
+        breach_date=entry["breach_date"],
+        data_classes=list(entry["data_classes"]),
+        is_verified=entry["is_verified"],
+    )
+
+
+async def iter_dehashed(
+    email: str,
+    api_key: Optional[str] = None,
+    page_size: int = DEHASHED_PAGE_SIZE,
+    max_pages: Optional[int] = None,
+    prefetch: int = 1,
+) -> AsyncIterator[list[DehashedRecord]]:
+    """Yield DeHashed records for this email one page at a time.
+
+    At most ``prefetch`` pages are fetched ahead of the consumer, so a slow
+    consumer holds back further requests. Stops after ``max_pages`` pages,
+    at the API's result window, or at a 404. Other non-200 responses
+    (bad key, rate limit, server error) raise ``httpx.HTTPStatusError``.
+    """
+    if not api_key:
+        return
+
+    pages: asyncio.Queue = asyncio.Queue(maxsize=max(1, prefetch))
+    done = object()
+
+    async def _produce() -> None:
+        try:
+            page = 1
+            seen = 0
+            while max_pages is None or page <= max_pages:
+                resp = await get_http_client().get(
+                    f"{DEHASHED_BASE}/search",
+                    headers={"Accept": "application/json"},
+                    params={"query": f"email:{email}", "size": page_size, "page": page},
+                    auth=("email@example.com", api_key),
+                )
+                if resp.status_code == 404:
+                    break
+                if resp.status_code != 200:
+                    raise httpx.HTTPStatusError(
+                        f"DeHashed returned HTTP {resp.status_code}", request=resp.request, response=resp
+                    )
+                data = resp.json()
+                entries = data.get("entries") or []
+                if entries:
+                    await pages.put([_dehashed_record(e) for e in entries])
+                seen += len(entries)
+                # Without a total (or a zero one), only a short page or the result window ends the walk
+                total = data.get("total")
+                if len(entries) < page_size or (total and seen >= total):
+                    break
+                if page * page_size >= DEHASHED_MAX_RESULTS:
+                    break
+                page += 1
+        except Exception as e:
+            await pages.put(e)
+        else:
+            await pages.put(done)
+
+    producer = asyncio.create_task(_produce())
+    try:
+        while True:
+            item = await pages.get()
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+
+
+def _dehashed_record(entry: dict) -> DehashedRecord:
+    return DehashedRecord(
+        email=entry.get("email"),
+        username=entry.get("username"),
+        password=entry.get("password"),
+        hashed_password=entry.get("hashed_password"),
+        name=entry.get("name"),
+        database_name=entry.get("database_name"),
+    )
+
+
 async def check_dehashed(
-    email: str, api_key: Optional[str] = None
+    email: str, api_key: Optional[str] = None, max_pages: Optional[int] = None
 ) -> list[DehashedRecord]:
-    """Check DeHashed for breach records containing this email."""
-    if not api_key:
-        return []
+    """Check DeHashed for breach records containing this email (all pages)."""
+    records = []
+    async for batch in iter_dehashed(email, api_key=api_key, max_pages=max_pages):
+        records.extend(batch)
+    return records
 
-    headers = {"Accept": "application/json"}
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(
-            f"{DEHASHED_BASE}/search",
-            headers=headers,
-            params={"query": f"email:{email}"},
-            auth=("email@example.com", api_key),
-        )
+async def summarize_dehashed(
+    email: str, api_key: Optional[str] = None, max_pages: Optional[int] = None
+) -> DehashedSummary:
+    """Aggregate DeHashed records page by page without keeping them."""
+    summary = DehashedSummary()
+    async for batch in iter_dehashed(email, api_key=api_key, max_pages=max_pages):
+        summary.add(batch)
+    return summary
 
-    if resp.status_code != 200:
-        return []
 
-    data = resp.json()
-    entries = data.get("entries", [])
-    return [
-        DehashedRecord(
-            email=e.get("email"),
-            username=e.get("username"),
-            password=e.get("password"),
-            hashed_password=e.get("hashed_password"),
-            name=e.get("name"),
-            database_name=e.get("database_name"),
-        )
-        for e in entries
-    ]
+def _summarize(
+    email: str, hibp_results: list, dehashed_results: Union[list, DehashedSummary]
+) -> dict:
+    if isinstance(dehashed_results, DehashedSummary):
+        summary, records = dehashed_results, []
+    else:
+        summary, records = DehashedSummary(), dehashed_results
+        summary.add(records)
+    return {
+        "email": email,
+        "hibp_breaches": hibp_results,
+        "hibp_count": len(hibp_results),
+        "dehashed_records": records,
+        "dehashed_summary": summary,
+        "dehashed_count": summary.total,
+        "total": len(hibp_results) + summary.total,
+    }
 
 
 async def scan_breaches(
     email: str,
     hibp_api_key: Optional[str] = None,
     dehashed_api_key: Optional[str] = None,
+    hibp_rpm: Optional[float] = None,
+    priority: int = PRIORITY_NORMAL,
+    catalogue: Optional[BreachCatalogue] = None,
+) -> dict:
+    """Run all breach checks for an email address.
+
+    A provider that fails (bad key, rate limit, server error) is reported
+    under ``errors`` as provider -> message; the other provider's results
+    are still returned.
+    """
+    if catalogue is not None and hibp_api_key and not await catalogue.ensure_fresh():
+        catalogue = None
+    errors: dict[str, str] = {}
+
+    async def _guard(provider: str, coro) -> list:
+        try:
+            return await coro
+        except Exception as e:
+            errors[provider] = str(e) or type(e).__name__
+            return []
+
+    hibp_results, dehashed_results = await asyncio.gather(
+        _guard("hibp", check_hibp(email, api_key=hibp_api_key, rpm=hibp_rpm, priority=priority, catalogue=catalogue)),
+        _guard("dehashed", check_dehashed(email, api_key=dehashed_api_key)),
+    )
+    result = _summarize(email, hibp_results, dehashed_results)
+    result["errors"] = errors
+    return result
+
+
+async def scan_breaches_many(
+    emails: list[str],
+    hibp_api_key: Optional[str] = None,
+    dehashed_api_key: Optional[str] = None,
+    hibp_rpm: Optional[float] = None,
+    priority: int = PRIORITY_NORMAL,
+    dehashed_concurrency: int = DEHASHED_CONCURRENCY,
+    catalogue: Optional[BreachCatalogue] = None,
+    dehashed_max_pages: Optional[int] = None,
+    keep_dehashed_records: bool = True,
 ) -> dict:
-    """Run all breach checks for an email address."""
-    hibp_results = await check_hibp(email, api_key=hibp_api_key)
-    dehashed_results = await check_dehashed(email, api_key=dehashed_api_key)
+    """Run breach checks for many emails with all providers in flight at once.
+
+    HIBP lookups are paced by the API key's scheduler; DeHashed lookups are
+    capped at ``dehashed_concurrency``. A provider failing for one email is
+    recorded and does not affect other emails or providers.
 
+    Returns ``{"results": [...], "errors": {...}, "total": int}`` where
+    ``results`` holds one :func:`scan_breaches`-shaped dict per unique email
+    (in input order) and ``errors`` maps provider -> email -> message.
+
+    With a ``catalogue`` it is refreshed once up front if stale, and every
+    HIBP lookup uses truncated responses joined against it. If no catalogue
+    could ever be downloaded, full responses are requested instead.
+
+    With ``keep_dehashed_records=False`` DeHashed pages are folded into each
+    result's ``dehashed_summary`` as they stream in and ``dehashed_records``
+    stays empty, so memory does not grow with the number of records.
+    """
+    emails = list(dict.fromkeys(emails))
+    errors: dict[str, dict[str, str]] = {"hibp": {}, "dehashed": {}}
+    if catalogue is not None and hibp_api_key and not await catalogue.ensure_fresh():
+        catalogue = None
+    dehashed_slots = asyncio.Semaphore(max(1, dehashed_concurrency))
+
+    async def _hibp(email: str) -> list[HibpBreach]:
+        try:
+            return await check_hibp(
+                email, api_key=hibp_api_key, rpm=hibp_rpm, priority=priority, catalogue=catalogue
+            )
+        except Exception as e:
+            errors["hibp"][email] = str(e) or type(e).__name__
+            return []
+
+    async def _dehashed(email: str) -> Union[list[DehashedRecord], DehashedSummary]:
+        async with dehashed_slots:
+            try:
+                if keep_dehashed_records:
+                    return await check_dehashed(email, api_key=dehashed_api_key, max_pages=dehashed_max_pages)
+                return await summarize_dehashed(email, api_key=dehashed_api_key, max_pages=dehashed_max_pages)
+            except Exception as e:
+                errors["dehashed"][email] = str(e) or type(e).__name__
+                return []
+
+    hibp_lists, dehashed_lists = await asyncio.gather(
+        asyncio.gather(*(_hibp(email) for email in emails)),
+        asyncio.gather(*(_dehashed(email) for email in emails)),
+    )
+    results = [
+        _summarize(email, hibp, dehashed)
+        for email, hibp, dehashed in zip(emails, hibp_lists, dehashed_lists)
+    ]
     return {
-        "email": email,
-        "hibp_breaches": hibp_results,
-        "hibp_count": len(hibp_results),
-        "dehashed_records": dehashed_results,
-        "dehashed_count": len(dehashed_results),
-        "total": len(hibp_results) + len(dehashed_results),
+        "results": results,
+        "errors": errors,
+        "total": sum(r["total"] for r in results),
     }
+
+
+def breach_rows(result: dict) -> list[dict]:
+    """Rows for ``Database.upsert_breaches`` from one :func:`scan_breaches` result.
+
+    HIBP breaches are keyed by breach name; DeHashed records are collapsed
+    into one row per leaked database.
+    """
+    rows = []
+    for b in result.get("hibp_breaches", []):
+        if isinstance(b, dict):
+            rows.append({
+                "source": "hibp",
+                "breach_name": b["name"],
+                "breach_date": b.get("breach_date"),
+                "data_types": b.get("data_classes", []),
+                "severity": b.get("severity", "medium"),
+            })
+        else:
+            rows.append({
+                "source": "hibp",
+                "breach_name": b.name,
+                "breach_date": b.breach_date,
+                "data_types": b.data_classes,
+                "severity": b.severity,
+            })
+
+    summary = result.get("dehashed_summary")
+    if summary is None:
+        summary = DehashedSummary()
+        summary.add(result.get("dehashed_records", []))
+    for name, stats in summary.databases.items():
+        rows.append({"source": "dehashed", "breach_name": name, "severity": stats["severity"]})
+    return rows
+
+
+def save_breach_results(db, person_id: int, result: dict) -> dict:
+    """Persist one email's breach results for a person.
+
+    Returns ``{"new": [...], "known": int}``; ``new`` lists only breaches
+    not previously recorded for this person, so callers can alert on it.
+    """
+    return db.upsert_breaches(person_id, breach_rows(result))
@@ -0,0 +1,90 @@
+"""Per-broker latency statistics and circuit breaker, persisted in the database."""
+
+import math
+import time
+from typing import Optional
+
+from digital_footprint.db import Database
+
+DEFAULT_TIMEOUT_MS = 30000
+MIN_TIMEOUT_MS = 5000
+# Timeouts are the rolling p95 of recent successes times this headroom
+TIMEOUT_HEADROOM = 2.0
+LATENCY_WINDOW = 50
+MIN_SAMPLES = 5
+FAILURE_THRESHOLD = 3
+COOLDOWN_SECONDS = 6 * 3600
+
+
+class BrokerHealth:
+    """Adaptive timeouts and a circuit breaker for broker scans.
+
+    Successful fetches feed a rolling window of latencies per broker whose
+    p95 sets the next timeout. After ``failure_threshold`` consecutive
+    errors or block pages the breaker opens and the broker is skipped for
+    ``cooldown_seconds``; once the cooldown passes one trial request is let
+    through, and a single further failure reopens it.
+
+    State lives in the ``broker_latency`` and ``broker_breakers`` tables
+    of ``db`` so separate scheduler runs share it.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        cooldown_seconds: float = COOLDOWN_SECONDS,
+        default_timeout: int = DEFAULT_TIMEOUT_MS,
+    ):
+        self.db = db
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.default_timeout = default_timeout
+
+    def p95(self, broker_slug: str) -> Optional[float]:
+        samples = sorted(self.db.get_broker_latencies(broker_slug, LATENCY_WINDOW))
+        if len(samples) < MIN_SAMPLES:
+            return None
+        return samples[min(len(samples) - 1, math.ceil(0.95 * len(samples)) - 1)]
+
+    def timeout_for(self, broker_slug: str) -> int:
+        """Timeout in ms for the next request, capped at the default."""
+        p95 = self.p95(broker_slug)
+        if p95 is None:
+            return self.default_timeout
+        return int(min(self.default_timeout, max(MIN_TIMEOUT_MS, p95 * TIMEOUT_HEADROOM)))
+
+    def is_open(self, broker_slug: str) -> bool:
+        breaker = self.db.get_broker_breaker(broker_slug)
+        return breaker is not None and breaker["opened_until"] > time.time()
+
+    def record_success(self, broker_slug: str, elapsed_ms: float) -> None:
+        self.db.record_broker_success(broker_slug, elapsed_ms, LATENCY_WINDOW, time.time())
+
+    def record_failure(self, broker_slug: str, reason: str) -> bool:
+        """Count a failure; returns True if the breaker is now open."""
+        now = time.time()
+        breaker = self.db.get_broker_breaker(broker_slug)
+        failures = (breaker["consecutive_failures"] if breaker else 0) + 1
+        opened_until = now + self.cooldown_seconds if failures >= self.failure_threshold else 0
+        self.db.update_broker_breaker(broker_slug, failures, opened_until, reason, now)
+        return opened_until > 0
+
+    def reset(self, broker_slug: str) -> None:
+        self.db.delete_broker_breaker(broker_slug)
+
+    def status(self) -> list[dict]:
+        """Breaker state and current timeout for every broker seen so far."""
+        now = time.time()
+        return [
+            {
+                "broker_slug": b["broker_slug"],
+                "consecutive_failures": b["consecutive_failures"],
+                "open": b["opened_until"] > now,
+                "open_for_seconds": max(0, int(b["opened_until"] - now)),
+                "last_error": b["last_error"],
+                "p95_ms": self.p95(b["broker_slug"]),
+                "timeout_ms": self.timeout_for(b["broker_slug"]),
+            }
+            for b in self.db.list_broker_breakers()
+        ]
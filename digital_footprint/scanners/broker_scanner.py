@@ -1,7 +1,19 @@
 """Broker scanner using Playwright for site checking."""
 
+import asyncio
+import hashlib
+import re
+import time
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import AsyncIterator, Optional
+
+from digital_footprint.broker_registry import VALID_RENDER_MODES
+from digital_footprint.scanners.name_matcher import compile_matcher
+from digital_footprint.scanners.page_cache import PageState, cache_ttl_for, content_hash
+
+DEFAULT_CACHE_TTL = 30 * 24 * 3600
+
+FINDING_SOURCE = "broker_scan"
 
 
 @dataclass
@@ -13,11 +25,38 @@ class BrokerScanResult:
     page_text: Optional[str] = None
     screenshot_path: Optional[str] = None
     error: Optional[str] = None
+    render_mode: Optional[str] = None  # how the page was actually fetched
+    cached: bool = False
+    unchanged: bool = False  # 304 or same content hash as the last fetch
+    skipped: bool = False  # circuit breaker open for this broker
 
     @property
     def risk_level(self) -> str:
         return "high" if self.found else "low"
 
+    @property
+    def outcome(self) -> str:
+        """One of ``skipped``, ``error``, ``cached``, ``unchanged``, ``found`` or ``not_found``."""
+        if self.skipped:
+            return "skipped"
+        if self.error:
+            return "error"
+        if self.cached:
+            return "cached"
+        if self.unchanged:
+            return "unchanged"
+        return "found" if self.found else "not_found"
+
+
+@dataclass
+class PageFetch:
+    text: str
+    render_mode: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified: bool = False
+    waited: float = 0.0  # seconds spent in politeness delays
+
 
 def build_search_url(
     url_pattern: str,
@@ -37,12 +76,114 @@ def build_search_url(
 
 
 def check_name_in_results(page_text: str, first_name: str, last_name: str) -> bool:
-    """Check if a person's full name appears in page text (fuzzy)."""
-    text_lower = page_text.lower()
-    first_lower = first_name.lower()
-    last_lower = last_name.lower()
-    # Both first and last name must appear
-    return first_lower in text_lower and last_lower in text_lower
+    """Check if a person's name appears in page text.
+
+    Accepts nickname, middle-initial, initial and "Last, First" forms, and
+    requires first and last names to appear close together.
+    """
+    return compile_matcher(first_name, last_name).search(page_text).found
+
+
+async def _load_page_text(context, url: str, timeout: int) -> str:
+    page = await context.new_page()
+    try:
+        await page.goto(url, timeout=timeout)
+        await page.wait_for_load_state("networkidle", timeout=timeout)
+        return await page.inner_text("body")
+    finally:
+        await page.close()
+
+
+class _SharedContext:
+    """A pooled context opened on first use and reused for later pages.
+
+    Reused pages count toward the pool's recycle threshold; once the
+    browser is due, the context is swapped for one on a fresh browser.
+    """
+
+    def __init__(self, pool, blocker=None):
+        self.pool = pool
+        self.blocker = blocker
+        self._browser = None
+        self._context = None
+
+    async def get(self):
+        if self._context is not None and not self.pool.reuse(self._browser):
+            await self.close()
+        if self._context is None:
+            self._browser, self._context = await self.pool.acquire(blocker=self.blocker)
+        return self._context
+
+    async def close(self) -> None:
+        if self._context is not None:
+            context, self._context = self._context, None
+            await self.pool.release(self._browser, context)
+
+
+async def _browser_page_text(
+    url: str, timeout: int, pool=None, blocker=None, shared_context=None,
+) -> str:
+    from digital_footprint.scanners.playwright_scanner import create_stealth_browser
+
+    if shared_context is not None:
+        return await _load_page_text(await shared_context.get(), url, timeout)
+    if pool is not None:
+        async with pool.context(blocker=blocker) as context:
+            return await _load_page_text(context, url, timeout)
+    pw, browser, context = await create_stealth_browser(blocker=blocker)
+    try:
+        return await _load_page_text(context, url, timeout)
+    finally:
+        await browser.close()
+        await pw.stop()
+
+
+async def _fetch_page_text(
+    url: str,
+    render_mode: str,
+    timeout: int,
+    pool=None,
+    throttle=None,
+    blocker=None,
+    shared_context=None,
+    state: Optional[PageState] = None,
+) -> PageFetch:
+    """Fetch a broker search URL.
+
+    ``http`` uses a plain HTTP GET, ``browser`` drives Playwright, and
+    ``auto`` tries HTTP first and escalates to the browser only when the
+    response looks like a JS shell or a block page. HTTP requests are
+    made conditional on the validators in ``state``.
+    """
+    from digital_footprint.scanners.http_fetcher import fetch_http
+
+    if render_mode not in VALID_RENDER_MODES:
+        raise ValueError(f"Invalid render_mode: {render_mode}. Valid: {VALID_RENDER_MODES}")
+
+    waited = 0.0
+    if render_mode in ("http", "auto"):
+        if throttle is not None:
+            waited += await throttle.wait(url)
+        fetched = await fetch_http(
+            url,
+            timeout=timeout / 1000,
+            etag=state.etag if state else None,
+            last_modified=state.last_modified if state else None,
+        )
+        result = PageFetch(
+            fetched.text, "http", fetched.etag, fetched.last_modified, fetched.not_modified, waited,
+        )
+        if render_mode == "http":
+            if fetched.status_code >= 400 and fetched.status_code != 404:
+                raise RuntimeError(f"HTTP {fetched.status_code} from {url}")
+            return result
+        if not fetched.needs_browser:
+            return result
+
+    if throttle is not None:
+        waited += await throttle.wait(url)
+    text = await _browser_page_text(url, timeout, pool, blocker, shared_context)
+    return PageFetch(text, "browser", waited=waited)
 
 
 async def scan_broker(
@@ -54,37 +195,131 @@ async def scan_broker(
     state: str = "",
     city: str = "",
     timeout: int = 30000,
+    pool=None,
+    throttle=None,
+    render_mode: str = "browser",
+    blocker=None,
+    shared_context=None,
+    cache=None,
+    cache_ttl: Optional[int] = None,
+    refresh_cache: bool = False,
+    health=None,
 ) -> BrokerScanResult:
-    """Scan a single broker site for a person's data."""
-    from digital_footprint.scanners.playwright_scanner import (
-        create_stealth_browser,
-        random_delay,
-    )
+    """Scan a single broker site for a person's data.
+
+    ``render_mode`` selects the fetch path (``http``, ``browser`` or
+    ``auto``). With a ``BrowserPool`` browser loads use a fresh context
+    from the pool; otherwise a one-off browser is launched and torn down.
+    With a ``HostThrottle`` the politeness delay is applied per host
+    before each request instead of unconditionally after the scan. A
+    ``ResourceBlocker`` drops images, fonts, media and trackers on the
+    browser path unless the broker is on its allowlist. With a
+    ``PageCache`` the extracted text is served from and stored to the
+    cache, and re-fetches are conditional (HTTP validators, then a hash
+    of the page text); a page that has not changed keeps its previous
+    verdict and is reported as ``unchanged`` without re-matching.
+    ``refresh_cache`` forces a fresh, unconditional fetch. With a
+    ``BrokerHealth`` the timeout comes from the broker's recent latency,
+    errors and block pages feed its circuit breaker, and a broker whose
+    breaker is open is reported as ``skipped`` without a request.
+    """
+    from digital_footprint.scanners.http_fetcher import has_block_text
+    from digital_footprint.scanners.playwright_scanner import random_delay
 
     url = build_search_url(url_pattern, first_name, last_name, state, city)
+    if blocker is not None and not blocker.applies_to(broker_slug):
+        blocker = None
 
     try:
-        pw, browser, context = await create_stealth_browser()
-        page = await context.new_page()
-
-        try:
-            await page.goto(url, timeout=timeout)
-            await page.wait_for_load_state("networkidle", timeout=timeout)
-            page_text = await page.inner_text("body")
-
+        page_text = None
+        if cache is not None and not refresh_cache:
+            page_text = cache.get(url, render_mode)
+        if page_text is not None:
             found = check_name_in_results(page_text, first_name, last_name)
-
             return BrokerScanResult(
                 broker_slug=broker_slug,
                 broker_name=broker_name,
                 url=url,
                 found=found,
                 page_text=page_text[:500] if found else None,
+                cached=True,
+            )
+
+        if health is not None:
+            if health.is_open(broker_slug):
+                return BrokerScanResult(
+                    broker_slug=broker_slug,
+                    broker_name=broker_name,
+                    url=url,
+                    found=False,
+                    skipped=True,
+                )
+            timeout = health.timeout_for(broker_slug)
+
+        page_state = None
+        if cache is not None and not refresh_cache:
+            page_state = cache.get_state(broker_slug, url)
+        started = time.monotonic()
+        try:
+            fetched = await _fetch_page_text(
+                url, render_mode, timeout, pool=pool, throttle=throttle,
+                blocker=blocker, shared_context=shared_context, state=page_state,
             )
+        except Exception as e:
+            if health is not None:
+                health.record_failure(broker_slug, str(e) or type(e).__name__)
+            raise
         finally:
-            await browser.close()
-            await pw.stop()
-            await random_delay()
+            if throttle is None:
+                await random_delay()
+        elapsed_ms = (time.monotonic() - started - fetched.waited) * 1000
+
+        new_hash = None if fetched.not_modified else content_hash(fetched.text)
+        unchanged = page_state is not None and (
+            fetched.not_modified
+            or (page_state.content_hash is not None and page_state.content_hash == new_hash)
+        )
+        if unchanged:
+            found = page_state.found
+            snippet = page_state.snippet if found else None
+        else:
+            found = check_name_in_results(fetched.text, first_name, last_name)
+            snippet = fetched.text[:500] if found else None
+            if not found and has_block_text(fetched.text):
+                if health is not None:
+                    health.record_failure(broker_slug, "block page")
+                return BrokerScanResult(
+                    broker_slug=broker_slug,
+                    broker_name=broker_name,
+                    url=url,
+                    found=False,
+                    render_mode=fetched.render_mode,
+                    error="Blocked by bot protection",
+                )
+        if health is not None:
+            health.record_success(broker_slug, elapsed_ms)
+
+        if cache is not None:
+            if not fetched.not_modified:
+                cache.put(url, render_mode, fetched.text, cache_ttl or DEFAULT_CACHE_TTL)
+            previous = page_state if fetched.not_modified and page_state is not None else PageState()
+            cache.put_state(broker_slug, url, PageState(
+                etag=fetched.etag or previous.etag,
+                last_modified=fetched.last_modified or previous.last_modified,
+                content_hash=new_hash or previous.content_hash,
+                found=found,
+                snippet=snippet,
+            ))
+
+        return BrokerScanResult(
+            broker_slug=broker_slug,
+            broker_name=broker_name,
+            url=url,
+            found=found,
+            page_text=snippet,
+            render_mode=fetched.render_mode,
+            unchanged=unchanged,
+        )
 
     except Exception as e:
         return BrokerScanResult(
@@ -102,21 +337,201 @@ async def scan_all_brokers(
     last_name: str,
     state: str = "",
     city: str = "",
+    pool=None,
+    concurrency: int = 1,
+    throttle=None,
+    blocker=None,
+    cache=None,
+    health=None,
 ) -> list[BrokerScanResult]:
-    """Scan all brokers that have search URL patterns."""
-    results = []
-    for broker in brokers:
-        url_pattern = broker.get("search_url_pattern")
-        if not url_pattern:
-            continue
-        result = await scan_broker(
-            broker_slug=broker["slug"],
-            broker_name=broker["name"],
-            url_pattern=url_pattern,
-            first_name=first_name,
-            last_name=last_name,
-            state=state,
-            city=city,
-        )
-        results.append(result)
-    return results
+    """Scan all brokers that have search URL patterns.
+
+    Up to ``concurrency`` brokers are scanned at once. Politeness delays
+    apply only between requests to the same host (see ``HostThrottle``),
+    so brokers on different domains do not wait on each other. Results
+    are returned in the order of ``brokers``.
+
+    A single ``BrowserPool`` is shared across the sweep; one is created
+    (and closed afterwards) when the caller does not supply it.
+    """
+    from digital_footprint.scanners.browser_pool import BrowserPool
+    from digital_footprint.scanners.throttle import HostThrottle
+
+    owns_pool = pool is None
+    if owns_pool:
+        pool = BrowserPool()
+    if throttle is None:
+        throttle = HostThrottle()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _scan(broker: dict) -> BrokerScanResult:
+        async with semaphore:
+            return await scan_broker(
+                broker_slug=broker["slug"],
+                broker_name=broker["name"],
+                url_pattern=broker["search_url_pattern"],
+                first_name=first_name,
+                last_name=last_name,
+                state=state,
+                city=city,
+                pool=pool,
+                throttle=throttle,
+                render_mode=broker.get("render_mode", "browser"),
+                blocker=blocker,
+                cache=cache,
+                cache_ttl=cache_ttl_for(broker),
+                health=health,
+            )
+
+    try:
+        return list(await asyncio.gather(*[
+            _scan(broker) for broker in brokers if broker.get("search_url_pattern")
+        ]))
+    finally:
+        if owns_pool:
+            await pool.close()
+
+
+def summarize_outcomes(results: list[BrokerScanResult]) -> dict:
+    """Count results by :attr:`BrokerScanResult.outcome`."""
+    counts = {"found": 0, "not_found": 0, "unchanged": 0, "cached": 0, "skipped": 0, "error": 0}
+    for result in results:
+        counts[result.outcome] += 1
+    return counts
+
+
+def split_name(name: str) -> tuple[str, str]:
+    """Split a full name into (first, last), ignoring middle names."""
+    parts = name.split()
+    if not parts:
+        return "", ""
+    return parts[0], parts[-1] if len(parts) > 1 else ""
+
+
+async def scan_brokers_for_persons(
+    persons: list,
+    brokers: list[dict],
+    pool=None,
+    concurrency: int = 4,
+    throttle=None,
+    blocker=None,
+    cache=None,
+    health=None,
+) -> AsyncIterator[tuple[Optional[int], BrokerScanResult]]:
+    """Scan many persons against many brokers, grouping the work by broker.
+
+    Each broker gets one task that walks every person through a single
+    warmed browser context and the broker's host throttle, so per-broker
+    setup and rate limits are paid once rather than once per person. Up to
+    ``concurrency`` brokers run at once. ``(person_id, BrokerScanResult)``
+    pairs are yielded as soon as they finish, in completion order.
+    """
+    from digital_footprint.scanners.browser_pool import BrowserPool
+    from digital_footprint.scanners.throttle import HostThrottle
+
+    owns_pool = pool is None
+    if owns_pool:
+        pool = BrowserPool()
+    if throttle is None:
+        throttle = HostThrottle()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+
+    async def _sweep(broker: dict) -> None:
+        try:
+            async with semaphore:
+                broker_blocker = blocker if blocker is not None and blocker.applies_to(broker["slug"]) else None
+                shared = _SharedContext(pool, broker_blocker)
+                try:
+                    for person in persons:
+                        first_name, last_name = split_name(person.name)
+                        result = await scan_broker(
+                            broker_slug=broker["slug"],
+                            broker_name=broker["name"],
+                            url_pattern=broker["search_url_pattern"],
+                            first_name=first_name,
+                            last_name=last_name,
+                            pool=pool,
+                            throttle=throttle,
+                            render_mode=broker.get("render_mode", "browser"),
+                            blocker=broker_blocker,
+                            shared_context=shared,
+                            cache=cache,
+                            cache_ttl=cache_ttl_for(broker),
+                            health=health,
+                        )
+                        await queue.put((person.id, result))
+                finally:
+                    await shared.close()
+        finally:
+            await queue.put(done)
+
+    tasks = [
+        asyncio.create_task(_sweep(broker))
+        for broker in brokers if broker.get("search_url_pattern")
+    ]
+    remaining = len(tasks)
+    try:
+        while remaining:
+            item = await queue.get()
+            if item is done:
+                remaining -= 1
+                continue
+            yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if owns_pool:
+            await pool.close()
+
+
+def normalize_snippet(text: Optional[str]) -> str:
+    """Lowercase, drop digits and collapse whitespace so counters and ages don't change identity."""
+    if not text:
+        return ""
+    text = re.sub(r"\d+", "", text.lower())
+    return " ".join(text.split())
+
+
+def finding_fingerprint(person_id: int, result: BrokerScanResult) -> str:
+    """Stable identity of a broker listing: (person, broker, url, normalized snippet)."""
+    parts = [str(person_id), result.broker_slug, result.url, normalize_snippet(result.page_text)]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def save_broker_results(db, person_id: int, results: list[BrokerScanResult]) -> dict:
+    """Persist one person's broker scan results into ``findings``.
+
+    Found listings are upserted by fingerprint. Brokers that were scanned
+    successfully but no longer show the person mark their earlier findings
+    as disappeared; errored and skipped scans leave existing findings
+    untouched.
+    Returns ``{"new", "unchanged", "disappeared"}`` counts.
+    """
+    broker_ids = {}
+    for result in results:
+        if result.broker_slug not in broker_ids:
+            broker = db.get_broker_by_slug(result.broker_slug)
+            broker_ids[result.broker_slug] = broker.id if broker else None
+
+    findings = [
+        {
+            "fingerprint": finding_fingerprint(person_id, r),
+            "broker_id": broker_ids[r.broker_slug],
+            "finding_type": "broker_listing",
+            "data_found": {"broker": r.broker_name, "snippet": r.page_text},
+            "risk_level": r.risk_level,
+            "url": r.url,
+            "screenshot_path": r.screenshot_path,
+        }
+        for r in results
+        if r.found and not r.error
+    ]
+    scanned = {
+        broker_ids[r.broker_slug]
+        for r in results
+        if not r.error and not r.skipped and broker_ids[r.broker_slug] is not None
+    }
+    return db.upsert_findings(person_id, FINDING_SOURCE, findings, scope_broker_ids=sorted(scanned))
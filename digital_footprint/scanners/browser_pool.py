@@ -0,0 +1,140 @@
+"""Long-lived Chromium pool that hands out fresh stealth contexts."""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+from digital_footprint.scanners.playwright_scanner import (
+    launch_stealth_browser,
+    new_stealth_context,
+)
+
+# Recycle the browser process after this many page loads to cap memory growth
+DEFAULT_MAX_PAGES_PER_BROWSER = 50
+
+
+async def _start_playwright():
+    from playwright.async_api import async_playwright
+    return await async_playwright().start()
+
+
+class BrowserPool:
+    """Share one Playwright driver and browser across many page loads.
+
+    Each caller gets its own context (fresh cookies, randomized UA and
+    viewport). After ``max_pages_per_browser`` page loads (one per context,
+    plus each :meth:`reuse` of a held context) the browser is retired: new
+    contexts go to a freshly launched browser while the old one is closed
+    once its outstanding contexts are released.
+    """
+
+    def __init__(
+        self,
+        headless: bool = True,
+        max_pages_per_browser: int = DEFAULT_MAX_PAGES_PER_BROWSER,
+    ):
+        self.headless = headless
+        self.max_pages_per_browser = max_pages_per_browser
+        self.browsers_launched = 0
+        self.contexts_served = 0
+        self._pw = None
+        self._browser = None
+        self._served_by_current = 0
+        self._active: dict = {}
+        self._retired: set = set()
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "BrowserPool":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def _launch(self) -> None:
+        if self._pw is None:
+            self._pw = await _start_playwright()
+        self._browser = await launch_stealth_browser(self._pw, headless=self.headless)
+        self._active[self._browser] = 0
+        self._served_by_current = 0
+        self.browsers_launched += 1
+
+    async def _retire_current(self) -> None:
+        browser = self._browser
+        self._browser = None
+        if browser is None:
+            return
+        if self._active.get(browser, 0) == 0:
+            self._active.pop(browser, None)
+            await browser.close()
+        else:
+            self._retired.add(browser)
+
+    async def acquire(self, blocker=None):
+        """Return ``(browser, context)``; pass both to :meth:`release` when done."""
+        async with self._lock:
+            if self._browser is not None and self._served_by_current >= self.max_pages_per_browser:
+                await self._retire_current()
+            if self._browser is None:
+                await self._launch()
+            browser = self._browser
+            self._served_by_current += 1
+            self._active[browser] += 1
+            self.contexts_served += 1
+
+        try:
+            context = await new_stealth_context(browser, blocker=blocker)
+        except Exception:
+            await self._release_browser(browser)
+            raise
+        return browser, context
+
+    def reuse(self, browser) -> bool:
+        """Count another page on a held context of ``browser``.
+
+        Returns False once ``browser`` is due for recycling; the caller
+        should then release its context and acquire a fresh one.
+        """
+        if browser is not self._browser or self._served_by_current >= self.max_pages_per_browser:
+            return False
+        self._served_by_current += 1
+        return True
+
+    async def release(self, browser, context) -> None:
+        try:
+            await context.close()
+        finally:
+            await self._release_browser(browser)
+
+    async def _release_browser(self, browser) -> None:
+        async with self._lock:
+            if browser not in self._active:
+                return  # pool already closed
+            self._active[browser] -= 1
+            if browser in self._retired and self._active[browser] == 0:
+                self._retired.discard(browser)
+                self._active.pop(browser, None)
+                await browser.close()
+
+    @asynccontextmanager
+    async def context(self, blocker=None):
+        """Yield a fresh stealth context that is closed on exit."""
+        browser, context = await self.acquire(blocker=blocker)
+        try:
+            yield context
+        finally:
+            await self.release(browser, context)
+
+    async def close(self) -> None:
+        """Close every browser and stop the Playwright driver."""
+        async with self._lock:
+            browsers = list(self._active)
+            self._active.clear()
+            self._retired.clear()
+            self._browser = None
+            for browser in browsers:
+                try:
+                    await browser.close()
+                except Exception:
+                    pass
+            if self._pw is not None:
+                await self._pw.stop()
+                self._pw = None
@@ -1,13 +1,18 @@
 """Dark web scanner using HIBP paste endpoint and Ahmia.fi clearnet search."""
 
-import re
 from dataclasses import dataclass
-from typing import Optional
+from html.parser import HTMLParser
+from typing import Callable, Iterable, Iterator, Optional
+from urllib.parse import parse_qs, urljoin, urlsplit
 
 import httpx
 
+from digital_footprint.http_client import get_http_client
+from digital_footprint.scanners.hibp_scheduler import PRIORITY_NORMAL, get_hibp_scheduler
+
 HIBP_BASE = "https://haveibeenpwned.com/api/v3"
 AHMIA_BASE = "https://ahmia.fi"
+AHMIA_MAX_PAGES = 3
 
 
 @dataclass
@@ -39,9 +44,16 @@ class AhmiaResult:
 
 
 async def check_hibp_pastes(
-    email: str, api_key: Optional[str] = None
+    email: str,
+    api_key: Optional[str] = None,
+    rpm: Optional[float] = None,
+    priority: int = PRIORITY_NORMAL,
 ) -> list[PasteResult]:
-    """Check HIBP paste endpoint for email appearances in paste sites."""
+    """Check HIBP paste endpoint for email appearances in paste sites.
+
+    Shares the API key's rate-limit scheduler with breach lookups; cached
+    answers skip it.
+    """
     if not api_key:
         return []
 
@@ -50,13 +62,20 @@ async def check_hibp_pastes(
         "user-agent": "DigitalFootprint-Scanner",
     }
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(
-            f"{HIBP_BASE}/pasteaccount/{email}",
-            headers=headers,
+    url = f"{HIBP_BASE}/pasteaccount/{email}"
+    http = get_http_client()
+    resp = http.cached_response("GET", url)
+    if resp is None:
+        resp = await get_hibp_scheduler(api_key, rpm).request(
+            lambda: http.get(url, headers=headers, use_cache=False),
+            priority=priority,
         )
+        http.store_response(resp)
 
+    if resp.status_code == 404:
+        return []
     if resp.status_code != 200:
+        resp.raise_for_status()
         return []
 
     pastes = resp.json()
@@ -75,32 +94,180 @@ async def check_hibp_pastes(
     ]
 
 
-async def search_ahmia(email: str) -> list[AhmiaResult]:
-    """Search Ahmia.fi (clearnet Tor search engine) for email exposure."""
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        resp = await client.get(
-            f"{AHMIA_BASE}/search/",
-            params={"q": email},
+class AhmiaParser(HTMLParser):
+    """Event-driven parser for Ahmia search result pages.
+
+    Feed the page in any number of chunks; each ``<li class="result">`` is
+    turned into an :class:`AhmiaResult` as soon as its closing tag is seen
+    and handed to ``on_result`` (or queued in ``results``). The link to
+    the next results page, if any, ends up in ``next_page``.
+    """
+
+    def __init__(self, on_result: Optional[Callable[[AhmiaResult], None]] = None):
+        super().__init__(convert_charrefs=True)
+        self.on_result = on_result
+        self.results: list[AhmiaResult] = []
+        self.next_page: Optional[str] = None
+        self._depth = 0  # <li> nesting inside the current result, 0 = outside
+        self._href: Optional[str] = None
+        self._title: list[str] = []
+        self._snippet: list[str] = []
+        self._cite: list[str] = []
+        self._capture: Optional[list[str]] = None
+        self._capture_tag: Optional[str] = None
+        self._anchor_href: Optional[str] = None
+        self._anchor_text: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        attributes = dict(attrs)
+        classes = (attributes.get("class") or "").split()
+        if tag == "li":
+            if self._depth:
+                self._depth += 1
+            elif "result" in classes:
+                self._depth = 1
+                self._href, self._title, self._snippet, self._cite = None, [], [], []
+            return
+        if tag == "a":
+            if self._depth and self._href is None:
+                self._href = attributes.get("href") or ""
+                self._capture, self._capture_tag = self._title, "a"
+            elif not self._depth:
+                self._anchor_href = attributes.get("href")
+                self._anchor_text = []
+                if "next" in (attributes.get("rel") or "").split() and self._anchor_href:
+                    self.next_page = self._anchor_href
+            return
+        if not self._depth:
+            return
+        if self._capture is not None:
+            return
+        if tag == "p" and not self._snippet and "urlinfo" not in classes:
+            self._capture, self._capture_tag = self._snippet, "p"
+        elif tag == "cite":
+            self._capture, self._capture_tag = self._cite, "cite"
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "a" and not self._depth and self._anchor_href:
+            label = "".join(self._anchor_text).strip(" \t\n»›→").lower()
+            if label == "next" and self.next_page is None:
+                self.next_page = self._anchor_href
+            self._anchor_href = None
+        if tag == self._capture_tag:
+            self._capture, self._capture_tag = None, None
+        if tag == "li" and self._depth:
+            self._depth -= 1
+            if not self._depth:
+                self._emit()
+
+    def handle_data(self, data: str) -> None:
+        if self._capture is not None:
+            self._capture.append(data)
+        elif self._anchor_href is not None:
+            self._anchor_text.append(data)
+
+    def _emit(self) -> None:
+        url = _result_url(self._href or "", " ".join("".join(self._cite).split()))
+        if not url:
+            return
+        result = AhmiaResult(
+            title=" ".join("".join(self._title).split()),
+            url=url,
+            snippet=" ".join("".join(self._snippet).split()),
         )
+        if self.on_result is not None:
+            self.on_result(result)
+        else:
+            self.results.append(result)
 
-    if resp.status_code != 200:
-        return []
 
-    return _parse_ahmia_html(resp.text)
+def _result_url(href: str, cite: str) -> str:
+    """The onion URL of a result, unwrapping Ahmia's redirect links."""
+    parsed = urlsplit(href)
+    if parsed.path.rstrip("/").endswith("/redirect"):
+        target = parse_qs(parsed.query).get("redirect_url")
+        if target:
+            return target[0].strip()
+    if href and (parsed.scheme or not cite):
+        return href.strip()
+    return cite or href.strip()
+
+
+def iter_ahmia_results(chunks: Iterable[str], parser: Optional[AhmiaParser] = None) -> Iterator[AhmiaResult]:
+    """Yield results while feeding ``chunks`` of a result page through the parser."""
+    parser = parser or AhmiaParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+        while parser.results:
+            yield parser.results.pop(0)
+    parser.close()
+    yield from parser.results
+    parser.results.clear()
 
 
 def _parse_ahmia_html(html: str) -> list[AhmiaResult]:
     """Parse Ahmia search results HTML."""
-    results = []
-    pattern = re.compile(
-        r'<li\s+class="result">\s*<h4><a\s+href="([^"]+)">([^<]+)</a></h4>\s*<p>([^<]*)</p>',
-        re.DOTALL,
-    )
-    for match in pattern.finditer(html):
-        url, title, snippet = match.groups()
-        results.append(AhmiaResult(
-            title=title.strip(),
-            url=url.strip(),
-            snippet=snippet.strip(),
-        ))
+    return list(iter_ahmia_results([html]))
+
+
+async def _feed_ahmia_page(http, url: str, params: Optional[dict], parser: AhmiaParser) -> bool:
+    """Stream one results page into ``parser`` as it downloads.
+
+    Results are emitted while the rest of the page is still arriving. A
+    cached page is fed in one go; a fresh one is stored once complete.
+    Returns False if the page wasn't served.
+    """
+    cached = http.cached_response("GET", url, params)
+    if cached is not None:
+        if cached.status_code != 200:
+            return False
+        parser.feed(cached.text)
+        return True
+
+    async with http.stream("GET", url, params=params) as resp:
+        if resp.status_code != 200:
+            return False
+        text: list[str] = []
+        async for chunk in resp.aiter_text():
+            text.append(chunk)
+            parser.feed(chunk)
+    http.store_response(httpx.Response(
+        resp.status_code,
+        headers={"content-type": "text/html; charset=utf-8"},
+        content="".join(text).encode("utf-8"),
+        request=resp.request,
+    ))
+    return True
+
+
+async def search_ahmia(email: str, max_pages: int = AHMIA_MAX_PAGES) -> list[AhmiaResult]:
+    """Search Ahmia.fi (clearnet Tor search engine) for email exposure.
+
+    Each page is parsed as it streams in. Follows "next page" links up to
+    ``max_pages`` pages and drops results whose URL was already seen.
+    """
+    results: list[AhmiaResult] = []
+    seen: set[str] = set()
+
+    def _collect(result: AhmiaResult) -> None:
+        if result.url not in seen:
+            seen.add(result.url)
+            results.append(result)
+
+    http = get_http_client()
+    url = f"{AHMIA_BASE}/search/"
+    params: Optional[dict] = {"q": email}
+    visited: set[str] = set()
+    for _ in range(max(1, max_pages)):
+        parser = AhmiaParser(on_result=_collect)
+        if not await _feed_ahmia_page(http, url, params, parser):
+            break
+        parser.close()
+        if not parser.next_page:
+            break
+        url = urljoin(f"{AHMIA_BASE}/search/", parser.next_page)
+        params = None
+        if url in visited:
+            break
+        visited.add(url)
     return results
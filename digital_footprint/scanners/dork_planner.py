@@ -0,0 +1,267 @@
+"""Plan dork queries: prune redundant ones, merge the rest, skip recent ones."""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from digital_footprint.db import Database
+from digital_footprint.models import Person
+from digital_footprint.scanners.google_dorker import (
+    DORK_CONCURRENCY,
+    DORK_MAX_QUERY_LENGTH,
+    DORK_MAX_RESULTS,
+    DorkResult,
+    SearchBackend,
+    build_dork_queries,
+    dedupe_results,
+    run_dork_queries,
+)
+
+# How long a fetched query's results are trusted before it is sent again
+DORK_QUERY_TTL = 7 * 24 * 3600
+
+# An operator ("site:pastebin.com", "-inurl:login") or a term ("phrase" or word)
+TOKEN_RE = re.compile(r'(?P<op>-?[a-z]+:(?:"[^"]*"|\S+))|(?P<term>"[^"]*"|\S+)', re.IGNORECASE)
+BOOLEAN_WORDS = {"OR", "AND", "|"}
+
+
+@dataclass
+class DorkQuery:
+    """A query split into its operators and its (implicitly ANDed) terms.
+
+    ``opaque`` queries already use OR or grouping; they are sent as-is and
+    never pruned or merged.
+    """
+
+    text: str
+    operators: tuple[str, ...] = ()
+    terms: tuple[str, ...] = ()
+    opaque: bool = False
+
+    @property
+    def scope(self) -> frozenset:
+        return frozenset(op.lower() for op in self.operators)
+
+    @property
+    def term_set(self) -> frozenset:
+        return frozenset(t.lower() for t in self.terms)
+
+
+@dataclass
+class PlannedQuery:
+    """One request to send, and the original queries its results cover."""
+
+    query: str
+    covers: list[str] = field(default_factory=list)
+
+
+@dataclass
+class DorkPlan:
+    queries: list[PlannedQuery] = field(default_factory=list)
+    pruned: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": [{"query": p.query, "covers": p.covers} for p in self.queries],
+            "pruned": self.pruned,
+            "skipped_recent": self.skipped,
+        }
+
+
+def parse_dork_query(text: str) -> DorkQuery:
+    operators, terms = [], []
+    opaque = False
+    for match in TOKEN_RE.finditer(text.strip()):
+        if match.group("op"):
+            operators.append(match.group("op"))
+            continue
+        term = match.group("term")
+        if term in BOOLEAN_WORDS or (not term.startswith('"') and ("(" in term or ")" in term)):
+            opaque = True
+        terms.append(term)
+    return DorkQuery(text=" ".join(operators + terms), operators=tuple(operators), terms=tuple(terms), opaque=opaque)
+
+
+def _name_term(name: Optional[str]) -> Optional[str]:
+    return f'"{" ".join(name.split())}"'.lower() if name and name.strip() else None
+
+
+def _name_only(q: DorkQuery, name_term: Optional[str]) -> bool:
+    return name_term is not None and q.term_set == {name_term}
+
+
+def prune_redundant(
+    queries: list[DorkQuery], name: Optional[str] = None
+) -> tuple[list[DorkQuery], list[str]]:
+    """Drop duplicates and queries a broader query already covers.
+
+    A query is redundant when another one with the same operators matches
+    a strict subset of its terms: ``"email"`` returns every page
+    ``"name" "email"`` would. Queries with different operators are never
+    compared, since a ``site:`` or ``filetype:`` query surfaces pages the
+    unscoped query ranks too low to return. The bare ``name`` query never
+    covers anything: a name alone matches so many pages that the
+    identifier-qualified hits would not make its top results.
+    """
+    name_term = _name_term(name)
+    seen: set[tuple] = set()
+    unique = []
+    pruned = []
+    for q in queries:
+        key = (q.scope, q.term_set) if not q.opaque else q.text
+        if key in seen:
+            pruned.append(q.text)
+            continue
+        seen.add(key)
+        unique.append(q)
+
+    kept = []
+    for q in unique:
+        broader = not q.opaque and any(
+            not other.opaque
+            and not _name_only(other, name_term)
+            and other.scope == q.scope
+            and other.term_set < q.term_set
+            for other in unique
+        )
+        if broader:
+            pruned.append(q.text)
+        else:
+            kept.append(q)
+    return kept, pruned
+
+
+def _render(operators: tuple[str, ...], prefix: tuple[str, ...], alternatives: list[str]) -> str:
+    if len(alternatives) == 1:
+        group = alternatives[0]
+    else:
+        group = " OR ".join(alternatives)
+        if operators or prefix:
+            group = f"({group})"
+    return " ".join([*operators, *prefix, group])
+
+
+def merge_queries(
+    queries: list[DorkQuery],
+    max_length: int = DORK_MAX_QUERY_LENGTH,
+    name: Optional[str] = None,
+) -> list[PlannedQuery]:
+    """Merge queries that differ only in their last term into OR groups.
+
+    ``"name" "phone"`` and ``"name" "address"`` become
+    ``"name" ("phone" OR "address")``. Groups are split so no merged query
+    is longer than ``max_length``; a single query over the limit is sent
+    on its own. The bare ``name`` query is always sent on its own, so its
+    generic hits don't crowd specific matches out of a merged request.
+    """
+    name_term = _name_term(name)
+    groups: dict[tuple, list[DorkQuery]] = {}
+    planned = []
+    for q in queries:
+        if q.opaque or not q.terms or _name_only(q, name_term):
+            planned.append(PlannedQuery(query=q.text, covers=[q.text]))
+            continue
+        key = (q.scope, frozenset(t.lower() for t in q.terms[:-1]))
+        groups.setdefault(key, []).append(q)
+
+    for members in groups.values():
+        first = members[0]
+        operators, prefix = first.operators, first.terms[:-1]
+        alternatives: list[str] = []
+        covers: list[str] = []
+        for q in members:
+            candidate = _render(operators, prefix, alternatives + [q.terms[-1]])
+            if alternatives and len(candidate) > max_length:
+                planned.append(PlannedQuery(query=_render(operators, prefix, alternatives), covers=covers))
+                alternatives, covers = [], []
+            alternatives.append(q.terms[-1])
+            covers.append(q.text)
+        planned.append(PlannedQuery(query=_render(operators, prefix, alternatives), covers=covers))
+    return planned
+
+
+def plan_dork_queries(
+    queries: list[str],
+    max_length: int = DORK_MAX_QUERY_LENGTH,
+    recent: Optional[set[str]] = None,
+    name: Optional[str] = None,
+) -> DorkPlan:
+    """Turn raw queries into the fewest requests that cover them.
+
+    Redundant queries are pruned first, so a recently fetched broad query
+    still covers its narrower variants. Queries in ``recent`` (normalized
+    text, see :func:`parse_dork_query`) are then skipped and the rest
+    merged. ``name`` is the person's name, whose bare query neither covers
+    nor merges with identifier-qualified ones.
+    """
+    parsed = [parse_dork_query(q) for q in queries if q.strip()]
+    kept, pruned = prune_redundant(parsed, name=name)
+    recent = recent or set()
+    skipped = [q.text for q in kept if q.text in recent]
+    to_send = [q for q in kept if q.text not in recent]
+    return DorkPlan(queries=merge_queries(to_send, max_length, name=name), pruned=pruned, skipped=skipped)
+
+
+def person_dork_queries(person: Person) -> list[str]:
+    """Dork queries for every email, phone and address on record for ``person``."""
+    queries = build_dork_queries(name=person.name)
+    for email in person.emails:
+        queries += build_dork_queries(name=person.name, email=email)
+    for phone in person.phones:
+        queries += build_dork_queries(name=person.name, phone=phone)
+    for address in person.addresses:
+        queries += build_dork_queries(name=person.name, address=address)
+    return list(dict.fromkeys(queries))
+
+
+def _result_row(r: DorkResult) -> dict:
+    return {"query": r.query, "url": r.url, "title": r.title, "snippet": r.snippet}
+
+
+async def run_planned_dorks(
+    queries: list[str],
+    backend: SearchBackend,
+    db: Optional[Database] = None,
+    ttl: float = DORK_QUERY_TTL,
+    concurrency: int = DORK_CONCURRENCY,
+    max_results: int = DORK_MAX_RESULTS,
+    name: Optional[str] = None,
+) -> dict:
+    """Plan ``queries`` for ``backend`` and run only the planned requests.
+
+    With a ``db``, each query's results are stored when its request
+    succeeds; queries fetched from this backend within ``ttl`` are not
+    sent again and their stored results are returned instead (counted
+    under ``cached``).
+    """
+    normalized = [parse_dork_query(q).text for q in queries if q.strip()]
+    now = time.time()
+    stored: dict[str, dict] = {}
+    if db is not None and ttl > 0:
+        stored = {
+            q: row for q, row in db.get_dork_queries(backend.name, normalized).items()
+            if now - row["fetched_at"] < ttl
+        }
+
+    plan = plan_dork_queries(normalized, max_length=backend.max_query_length, recent=set(stored), name=name)
+    outcome = await run_dork_queries(
+        [p.query for p in plan.queries], backend, concurrency=concurrency, max_results=max_results
+    )
+    if db is not None:
+        fetched = {
+            q: [_result_row(r) for r in outcome["by_query"][p.query]]
+            for p in plan.queries if p.query not in outcome["errors"]
+            for q in p.covers
+        }
+        db.record_dork_queries(backend.name, fetched, now)
+
+    cached = [DorkResult(**row) for q in plan.skipped for row in stored[q]["results"]]
+    results = dedupe_results(outcome["results"] + cached)
+    outcome["cached"] = len(results) - len(dedupe_results(outcome["results"]))
+    outcome["results"] = results
+    outcome["high_risk"] = sum(1 for r in results if r.risk_level == "high")
+    outcome["plan"] = plan.to_dict()
+    outcome["requested"] = len(queries)
+    return outcome
@@ -1,7 +1,25 @@
 """Google dorking scanner for finding exposed personal data."""
 
+import asyncio
+import logging
 from dataclasses import dataclass
 from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from digital_footprint.http_client import get_http_client
+from digital_footprint.scanners.hibp_scheduler import TokenBucket
+
+logger = logging.getLogger("digital_footprint.scanners")
+
+DORK_CONCURRENCY = 4
+DORK_MAX_RESULTS = 20
+# Longest query string sent to a backend by default; upstream engines
+# truncate or reject long queries (Google ignores words past 32)
+DORK_MAX_QUERY_LENGTH = 256
+SEARXNG_RPM = 30
+
+# Query parameters that never change which page a URL points at
+TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "ref", "ref_src", "igshid"}
 
 
 HIGH_RISK_DOMAINS = {
@@ -71,3 +89,122 @@ def parse_search_results(
         )
         for r in raw_results
     ]
+
+
+def canonical_url(url: str) -> str:
+    """Normalize a URL so the same page found by different queries compares equal.
+
+    Lowercases scheme and host, drops ``www.``, default ports, fragments,
+    tracking parameters and a trailing slash, and sorts the query string.
+    """
+    parts = urlsplit(url.strip())
+    scheme = (parts.scheme or "http").lower()
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and (scheme, parts.port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    # http and https copies of a page are the same finding
+    return urlunsplit(("https" if scheme == "http" else scheme, host, path, urlencode(query), ""))
+
+
+def dedupe_results(results: list[DorkResult]) -> list[DorkResult]:
+    """Keep the first result for each canonical URL."""
+    seen: set[str] = set()
+    unique = []
+    for result in results:
+        key = canonical_url(result.url)
+        if key not in seen:
+            seen.add(key)
+            unique.append(result)
+    return unique
+
+
+class SearchBackend:
+    """A search engine the dork executor can send queries to.
+
+    Subclasses implement :meth:`search`, returning raw results as dicts
+    with ``url``, ``title`` and ``snippet`` (the shape
+    :func:`parse_search_results` takes). ``rpm`` caps how many queries per
+    minute the executor sends to the backend, and ``max_query_length``
+    bounds queries the planner merges for it.
+    """
+
+    name = "backend"
+    max_query_length = DORK_MAX_QUERY_LENGTH
+
+    def __init__(self, rpm: float = SEARXNG_RPM):
+        self.rpm = rpm
+
+    async def search(self, query: str, max_results: int = DORK_MAX_RESULTS) -> list[dict]:
+        raise NotImplementedError
+
+
+class SearxngBackend(SearchBackend):
+    """SearXNG (or any server speaking its ``/search?format=json`` API)."""
+
+    name = "searxng"
+
+    def __init__(self, base_url: str, rpm: float = SEARXNG_RPM, categories: str = "general"):
+        super().__init__(rpm=rpm)
+        self.base_url = base_url.rstrip("/")
+        self.categories = categories
+
+    async def search(self, query: str, max_results: int = DORK_MAX_RESULTS) -> list[dict]:
+        resp = await get_http_client().get(
+            f"{self.base_url}/search",
+            params={"q": query, "format": "json", "categories": self.categories},
+        )
+        resp.raise_for_status()
+        results = []
+        for r in resp.json().get("results", []):
+            if r.get("url"):
+                results.append({"url": r["url"], "title": r.get("title", ""), "snippet": r.get("content", "")})
+        return results[:max_results]
+
+
+async def run_dork_queries(
+    queries: list[str],
+    backend: SearchBackend,
+    concurrency: int = DORK_CONCURRENCY,
+    max_results: int = DORK_MAX_RESULTS,
+) -> dict:
+    """Run dork queries concurrently against ``backend`` and merge the results.
+
+    At most ``concurrency`` queries are in flight and they are paced at
+    the backend's ``rpm``. Results are deduped by canonical URL across all
+    queries, keeping the hit from the earliest query; ``by_query`` holds
+    each query's own results before dedup. A failing query is recorded
+    under ``errors`` and doesn't stop the others.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    bucket = TokenBucket(backend.rpm)
+    errors: dict[str, str] = {}
+
+    async def _run(query: str) -> list[DorkResult]:
+        async with semaphore:
+            while (delay := bucket.delay()) > 0:
+                await asyncio.sleep(delay)
+            bucket.take()
+            try:
+                raw = await backend.search(query, max_results=max_results)
+            except Exception as e:
+                logger.warning(f"Dork query failed on {backend.name}: {query!r}: {e}")
+                errors[query] = str(e)
+                return []
+        return parse_search_results(raw, query)
+
+    per_query = await asyncio.gather(*(_run(q) for q in queries))
+    results = dedupe_results([r for batch in per_query for r in batch])
+    return {
+        "queries": len(queries),
+        "results": results,
+        "by_query": dict(zip(queries, per_query)),
+        "high_risk": sum(1 for r in results if r.risk_level == "high"),
+        "errors": errors,
+    }
@@ -0,0 +1,99 @@
+"""Local copy of the HIBP breach catalogue for joining truncated account lookups."""
+
+import logging
+import time
+from typing import Optional
+
+from digital_footprint.db import Database
+from digital_footprint.http_client import get_http_client
+
+logger = logging.getLogger(__name__)
+
+HIBP_BASE = "https://haveibeenpwned.com/api/v3"
+# Refresh the catalogue when the local copy is older than this
+CATALOGUE_MAX_AGE = 24 * 3600
+
+
+class BreachCatalogue:
+    """Copy of ``GET /breaches`` in the ``hibp_catalogue`` table, refreshed with conditional requests.
+
+    Entries are held in memory after the first read so joining hundreds of
+    account lookups costs a dict lookup per breach name.
+    """
+
+    def __init__(self, db: Database, max_age: float = CATALOGUE_MAX_AGE):
+        self.db = db
+        self.max_age = max_age
+        self._entries: Optional[dict[str, dict]] = None
+
+    @property
+    def refreshed_at(self) -> Optional[float]:
+        value = self.db.get_hibp_catalogue_meta("refreshed_at")
+        return float(value) if value else None
+
+    def is_stale(self) -> bool:
+        refreshed = self.refreshed_at
+        return refreshed is None or time.time() - refreshed >= self.max_age
+
+    def entries(self) -> dict[str, dict]:
+        if self._entries is None:
+            self._entries = self.db.get_hibp_catalogue()
+        return self._entries
+
+    def get(self, name: str) -> Optional[dict]:
+        return self.entries().get(name)
+
+    def __len__(self) -> int:
+        return len(self.entries())
+
+    def load(self, breaches: list[dict]) -> None:
+        """Replace the catalogue with HIBP ``/breaches`` JSON."""
+        self.db.replace_hibp_catalogue(breaches)
+        self._entries = None
+
+    async def refresh(self, force: bool = False) -> dict:
+        """Fetch the catalogue if it changed since the last refresh.
+
+        Skipped while the local copy is younger than ``max_age`` unless
+        ``force`` is set. The request carries the stored validators, so an
+        unchanged catalogue costs a 304.
+
+        Returns ``{"status": "updated" | "not_modified" | "fresh", "breaches": n}``.
+        """
+        if not force and not self.is_stale():
+            return {"status": "fresh", "breaches": len(self)}
+
+        headers = {}
+        if len(self):
+            etag = self.db.get_hibp_catalogue_meta("etag")
+            last_modified = self.db.get_hibp_catalogue_meta("last_modified")
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        resp = await get_http_client().get(f"{HIBP_BASE}/breaches", headers=headers)
+        if resp.status_code == 304:
+            status = "not_modified"
+        else:
+            resp.raise_for_status()
+            self.load(resp.json())
+            status = "updated"
+            self.db.set_hibp_catalogue_meta(
+                etag=resp.headers.get("etag"), last_modified=resp.headers.get("last-modified")
+            )
+        self.db.set_hibp_catalogue_meta(refreshed_at=str(time.time()))
+        return {"status": status, "breaches": len(self)}
+
+    async def ensure_fresh(self) -> bool:
+        """Refresh if stale; returns whether the catalogue is usable.
+
+        A failed refresh keeps using the existing copy, so this only returns
+        False when no catalogue has ever been downloaded.
+        """
+        if self.is_stale():
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning("HIBP breach catalogue refresh failed: %s", e)
+        return len(self) > 0
@@ -0,0 +1,168 @@
+"""Rate-limit aware request scheduler for the Have I Been Pwned API."""
+
+import asyncio
+import hashlib
+import heapq
+import itertools
+import random
+import time
+from typing import Awaitable, Callable, Optional
+
+import httpx
+
+# Requests per minute of the lowest paid HIBP subscription (Pwned 1)
+DEFAULT_RPM = 10
+MAX_RETRIES = 4
+MAX_JITTER = 1.0
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 5
+PRIORITY_LOW = 10
+
+
+class HibpRateLimitError(Exception):
+    """HIBP kept answering 429 after all retries."""
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate_per_minute``; can be paused until a deadline."""
+
+    def __init__(self, rate_per_minute: float, capacity: float = 1.0):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self) -> float:
+        """Seconds until a token can be taken (0 if one is available now)."""
+        now = time.monotonic()
+        self._refill(now)
+        wait = max(0.0, self.paused_until - now)
+        if self.tokens < 1:
+            wait = max(wait, (1 - self.tokens) / self.rate)
+        return wait
+
+    def take(self) -> None:
+        self._refill(time.monotonic())
+        self.tokens -= 1
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds`` (e.g. after a 429)."""
+        until = time.monotonic() + seconds
+        self.paused_until = max(self.paused_until, until)
+        self.tokens = min(self.tokens, 0.0)
+
+
+class HibpScheduler:
+    """Queue HIBP requests for one API key and release them at its rate.
+
+    Waiting requests are served by priority, then arrival order. A 429 pauses
+    the whole bucket for ``retry-after`` seconds (plus jitter) and the request
+    is retried, up to ``max_retries`` times, after which
+    :class:`HibpRateLimitError` is raised instead of returning an empty result.
+    """
+
+    def __init__(self, rpm: float = DEFAULT_RPM, max_retries: int = MAX_RETRIES):
+        self.rpm = rpm
+        self.max_retries = max_retries
+        self.bucket = TokenBucket(rpm)
+        self.requests = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._waiters: list = []
+        self._seq = itertools.count()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    async def _acquire(self, priority: int) -> None:
+        entry = (priority, next(self._seq), asyncio.Event())
+        heapq.heappush(self._waiters, entry)
+        started = time.monotonic()
+        try:
+            while True:
+                if self._waiters[0] is entry:
+                    delay = self.bucket.delay()
+                    if delay <= 0:
+                        self.bucket.take()
+                        return
+                    await asyncio.sleep(delay)
+                else:
+                    await entry[2].wait()
+                    entry[2].clear()
+        finally:
+            self._waiters.remove(entry)
+            heapq.heapify(self._waiters)
+            if self._waiters:
+                self._waiters[0][2].set()
+            waited = time.monotonic() - started
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+
+    async def request(
+        self,
+        send: Callable[[], Awaitable[httpx.Response]],
+        priority: int = PRIORITY_NORMAL,
+    ) -> httpx.Response:
+        """Run ``send`` when the rate allows, retrying on 429."""
+        for attempt in range(self.max_retries + 1):
+            await self._acquire(priority)
+            self.requests += 1
+            resp = await send()
+            if resp.status_code != 429:
+                return resp
+            self.rate_limited += 1
+            if attempt == self.max_retries:
+                break
+            self.retries += 1
+            self.bucket.pause(_retry_after(resp, attempt) + random.uniform(0, MAX_JITTER))
+            # Retries go ahead of requests that have not been tried yet
+            priority = min(priority, PRIORITY_HIGH)
+        raise HibpRateLimitError(f"HIBP rate limit still exceeded after {self.max_retries} retries")
+
+    def stats(self) -> dict:
+        return {
+            "rpm": self.rpm,
+            "queue_depth": self.queue_depth,
+            "requests": self.requests,
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "total_wait_seconds": round(self.total_wait, 3),
+            "max_wait_seconds": round(self.max_wait, 3),
+        }
+
+
+def _retry_after(resp: httpx.Response, attempt: int) -> float:
+    value = resp.headers.get("retry-after")
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return float(2 ** attempt)
+
+
+_schedulers: dict[tuple[str, float], HibpScheduler] = {}
+
+
+def get_hibp_scheduler(api_key: str, rpm: Optional[float] = None) -> HibpScheduler:
+    """Process-wide scheduler for an API key at its subscription rate.
+
+    Breach and paste lookups with the same key share one scheduler because
+    HIBP applies the limit per key across endpoints.
+    """
+    key = (hashlib.sha256(api_key.encode()).hexdigest(), float(rpm or DEFAULT_RPM))
+    if key not in _schedulers:
+        _schedulers[key] = HibpScheduler(rpm=key[1])
+    return _schedulers[key]
+
+
+def hibp_stats() -> list[dict]:
+    """Stats for every scheduler created in this process."""
+    return [scheduler.stats() for scheduler in _schedulers.values()]
@@ -1,15 +1,32 @@
-"""Email registration scanner using holehe CLI."""
+"""Email registration scanner using holehe (in-process, or its CLI as a fallback)."""
 
 import asyncio
+import functools
 import os
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable, Optional
+
+import httpx
 
 
 HIGH_RISK_CATEGORIES = {"dating", "adult", "financial", "gambling"}
 MEDIUM_RISK_CATEGORIES = {"social", "photo", "video", "gaming", "forum"}
 
+# holehe.modules.<package>.<site> -> our category
+HOLEHE_PACKAGE_CATEGORIES = {
+    "social_media": "social",
+    "porn": "adult",
+    "payment": "financial",
+    "forum": "forum",
+    "medias": "photo",
+    "music": "video",
+}
+
+HOLEHE_MODULE_TIMEOUT = 10.0
+HOLEHE_CONCURRENCY = 64
+
 
 @dataclass
 class HoleheResult:
@@ -70,16 +87,124 @@ def parse_holehe_output(text: str) -> list[HoleheResult]:
     return results
 
 
+def _holehe_category(module: Callable) -> str:
+    parts = getattr(module, "__module__", "").split(".")
+    package = parts[2] if len(parts) > 3 else ""
+    return HOLEHE_PACKAGE_CATEGORIES.get(package, "other")
+
+
+@functools.lru_cache(maxsize=1)
+def load_holehe_modules() -> tuple:
+    """Import holehe's site checks once per process.
+
+    Raises ``ImportError`` when holehe is not installed.
+    """
+    from holehe.core import get_functions, import_submodules
+
+    return tuple(get_functions(import_submodules("holehe.modules")))
+
+
+def holehe_available() -> bool:
+    try:
+        load_holehe_modules()
+        return True
+    except ImportError:
+        return False
+
+
+def _holehe_rows_to_results(rows: list[dict], category: str) -> list[HoleheResult]:
+    """Same rows ``parse_holehe_output`` keeps from holehe's CSV: used, not rate limited."""
+    return [
+        HoleheResult(service=row.get("domain") or row.get("name", ""), exists=True, category=category)
+        for row in rows
+        if row.get("exists") and not row.get("rateLimit")
+    ]
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Forwards to a pooled transport; closing a client leaves the pool open."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.transport.handle_async_request(request)
+
+
+async def check_email_registrations_many(
+    emails: list[str],
+    timeout: int = 60,
+    concurrency: int = HOLEHE_CONCURRENCY,
+    modules: Optional[tuple] = None,
+) -> dict[str, list[HoleheResult]]:
+    """Run every holehe check for many emails in this process.
+
+    holehe's site modules are imported once and share one connection
+    pool; each email gets its own lightweight client so sign-up flows
+    don't see another email's cookies. At most ``concurrency`` checks are
+    in flight. Each email has ``timeout`` seconds overall and keeps
+    whatever checks finished by then. Falls back to one ``holehe``
+    subprocess per email when holehe can't be imported.
+    """
+    if modules is None:
+        try:
+            modules = load_holehe_modules()
+        except ImportError:
+            results = await asyncio.gather(
+                *(check_email_registrations_subprocess(email, timeout) for email in emails)
+            )
+            return dict(zip(emails, results))
+
+    transport = httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _check(module: Callable, email: str, client: httpx.AsyncClient, found: list) -> None:
+        rows: list[dict] = []
+        async with semaphore:
+            try:
+                await asyncio.wait_for(module(email, client, rows), HOLEHE_MODULE_TIMEOUT)
+            except Exception:
+                return
+        found.extend(_holehe_rows_to_results(rows, _holehe_category(module)))
+
+    async def _email(email: str) -> list[HoleheResult]:
+        found: list[HoleheResult] = []
+        async with httpx.AsyncClient(transport=_SharedTransport(transport), timeout=HOLEHE_MODULE_TIMEOUT) as client:
+            tasks = [asyncio.ensure_future(_check(m, email, client, found)) for m in modules]
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        return sorted(found, key=lambda r: r.service)
+
+    try:
+        results = await asyncio.gather(*(_email(email) for email in emails))
+    finally:
+        await transport.aclose()
+    return dict(zip(emails, results))
+
+
 async def check_email_registrations(
     email: str, timeout: int = 60
 ) -> list[HoleheResult]:
-    """Check which services an email is registered with using holehe.
+    """Check which services an email is registered with using holehe."""
+    results = await check_email_registrations_many([email], timeout=timeout)
+    return results[email]
+
+
+async def check_email_registrations_subprocess(
+    email: str, timeout: int = 60
+) -> list[HoleheResult]:
+    """Check one email by running the holehe CLI.
 
     Holehe's --csv flag writes to a file, so we use a temp file and parse it.
     """
     csv_path = None
     try:
-        csv_path = tempfile.mktemp(suffix=".csv", prefix="holehe_")
+        fd, csv_path = tempfile.mkstemp(suffix=".csv", prefix="holehe_")
+        os.close(fd)
         proc = await asyncio.create_subprocess_exec(
             "holehe", email,
             "--only-used", "--csv", csv_path,
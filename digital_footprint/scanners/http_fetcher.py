@@ -0,0 +1,160 @@
+"""Plain HTTP fetcher for server-rendered broker result pages."""
+
+import html as html_lib
+import random
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+from digital_footprint.http_client import get_http_client
+from digital_footprint.scanners.playwright_scanner import _USER_AGENTS
+
+# Status codes that usually mean a bot wall rather than a real answer
+BLOCK_STATUS_CODES = {401, 403, 429, 503}
+
+# Phrases challenge and interstitial pages show the visitor. Matched against
+# visible text, so a results page that merely loads a reCAPTCHA/hCaptcha
+# script (or says "protected by reCAPTCHA") is not mistaken for a block.
+BLOCK_TEXT_MARKERS = [
+    "just a moment...",
+    "checking your browser",
+    "attention required! | cloudflare",
+    "access denied",
+    "are you a robot",
+    "unusual traffic",
+    "verify you are human",
+    "complete the captcha",
+    "press & hold",
+]
+
+# Markup only challenge interstitials carry (Cloudflare challenge form and
+# its bootstrap object, PerimeterX block page)
+BLOCK_HTML_MARKERS = [
+    'id="challenge-form"',
+    'id="cf-challenge-running"',
+    "window._cf_chl_opt",
+    'id="px-captcha"',
+]
+
+# Empty mount points left by client-rendered apps. "Enable JavaScript"
+# notices are deliberately absent: server-rendered pages carry them too.
+JS_SHELL_MARKERS = [
+    'id="root"></div>',
+    'id="app"></div>',
+    'id="__next"></div>',
+]
+
+# Below this much visible text a page is assumed to be rendered client-side
+MIN_TEXT_CHARS = 200
+
+_STRIP_BLOCKS = re.compile(
+    r"<(script|style|noscript|template|svg)\b[^>]*>.*?</\1\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_TAGS = re.compile(r"<[^>]+>")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class HttpFetchResult:
+    url: str
+    status_code: int
+    html: str
+    text: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status_code == 304
+
+    @property
+    def is_block_page(self) -> bool:
+        return looks_like_block_page(self.status_code, self.html, self.text)
+
+    @property
+    def is_js_shell(self) -> bool:
+        return looks_like_js_shell(self.html, self.text)
+
+    @property
+    def needs_browser(self) -> bool:
+        """True when the response cannot be trusted without a real browser."""
+        if self.not_modified:
+            return False
+        if self.status_code not in (200, 404):
+            return True
+        return self.is_block_page or self.is_js_shell
+
+
+def html_to_text(html: str) -> str:
+    """Approximate ``inner_text("body")`` for a static HTML document."""
+    stripped = _STRIP_BLOCKS.sub(" ", html)
+    stripped = _TAGS.sub(" ", stripped)
+    return _WHITESPACE.sub(" ", html_lib.unescape(stripped)).strip()
+
+
+def has_block_text(text: str) -> bool:
+    """True if visible page text reads like a challenge or access-denied page."""
+    text_lower = text.lower()
+    return any(marker in text_lower for marker in BLOCK_TEXT_MARKERS)
+
+
+def looks_like_block_page(status_code: int, html: str, text: Optional[str] = None) -> bool:
+    """True for block statuses, challenge-page markup, or challenge wording.
+
+    ``text`` is the page's visible text (extracted from ``html`` if omitted).
+    """
+    if status_code in BLOCK_STATUS_CODES:
+        return True
+    html_lower = html.lower()
+    if any(marker in html_lower for marker in BLOCK_HTML_MARKERS):
+        return True
+    return has_block_text(text if text is not None else html_to_text(html))
+
+
+def looks_like_js_shell(html: str, text: str) -> bool:
+    if len(text) < MIN_TEXT_CHARS:
+        return True
+    html_lower = html.lower()
+    return any(marker in html_lower for marker in JS_SHELL_MARKERS)
+
+
+async def fetch_http(
+    url: str,
+    timeout: float = 15.0,
+    client: Optional[httpx.AsyncClient] = None,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> HttpFetchResult:
+    """Fetch a page over plain HTTP and extract its visible text.
+
+    Passing the ``etag``/``last_modified`` validators from a previous fetch
+    makes the request conditional; an unchanged page comes back as a 304
+    with empty text.
+    """
+    headers = {
+        "User-Agent": random.choice(_USER_AGENTS),
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+    }
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    if client is None:
+        resp = await get_http_client().get(url, headers=headers, timeout=timeout, follow_redirects=True)
+    else:
+        resp = await client.get(url, headers=headers, timeout=timeout, follow_redirects=True)
+
+    body = resp.text
+    return HttpFetchResult(
+        url=str(resp.url),
+        status_code=resp.status_code,
+        html=body,
+        text=html_to_text(body),
+        etag=resp.headers.get("etag"),
+        last_modified=resp.headers.get("last-modified"),
+    )
@@ -0,0 +1,205 @@
+"""Compiled multi-variant person name matcher for broker result pages."""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable, Optional
+
+# Formal first name -> common nicknames. Lookups are symmetric: a person
+# registered as "Bill" also matches pages listing "William".
+NICKNAMES = {
+    "alexander": ["alex", "xander"],
+    "alexandra": ["alex", "lexi", "sandra"],
+    "andrew": ["andy", "drew"],
+    "anthony": ["tony"],
+    "barbara": ["barb", "babs"],
+    "benjamin": ["ben", "benny"],
+    "catherine": ["cathy", "kate", "katie", "cat"],
+    "charles": ["charlie", "chuck", "chas"],
+    "christine": ["chris", "chrissy", "tina"],
+    "christopher": ["chris", "topher"],
+    "daniel": ["dan", "danny"],
+    "david": ["dave", "davey"],
+    "deborah": ["deb", "debbie"],
+    "donald": ["don", "donnie"],
+    "dorothy": ["dot", "dottie"],
+    "edward": ["ed", "eddie", "ted", "ned"],
+    "elizabeth": ["liz", "beth", "betty", "eliza", "lizzie", "betsy"],
+    "gregory": ["greg"],
+    "james": ["jim", "jimmy", "jamie"],
+    "jennifer": ["jen", "jenny"],
+    "jessica": ["jess", "jessie"],
+    "john": ["jack", "johnny", "jon"],
+    "jonathan": ["jon", "jonny"],
+    "joseph": ["joe", "joey"],
+    "joshua": ["josh"],
+    "katherine": ["kate", "kathy", "katie", "kat"],
+    "kenneth": ["ken", "kenny"],
+    "kimberly": ["kim"],
+    "margaret": ["maggie", "meg", "peggy", "marge"],
+    "matthew": ["matt"],
+    "michael": ["mike", "mikey", "mick"],
+    "nicholas": ["nick", "nicky"],
+    "patricia": ["pat", "patty", "trish"],
+    "patrick": ["pat", "paddy"],
+    "peter": ["pete"],
+    "rebecca": ["becky", "becca"],
+    "richard": ["rick", "ricky", "rich", "dick"],
+    "robert": ["bob", "bobby", "rob", "robbie", "bert"],
+    "ronald": ["ron", "ronnie"],
+    "samuel": ["sam", "sammy"],
+    "samantha": ["sam", "sammie"],
+    "stephen": ["steve"],
+    "steven": ["steve"],
+    "susan": ["sue", "suzy"],
+    "thomas": ["tom", "tommy"],
+    "timothy": ["tim", "timmy"],
+    "victoria": ["vicky", "tori"],
+    "william": ["bill", "billy", "will", "willy", "liam"],
+}
+
+# First and last name tokens closer than this (in characters) count as a
+# match even when no full-name form was found, e.g. "John A. B. Doe".
+PROXIMITY_WINDOW = 12
+
+
+def first_name_variants(first: str) -> set[str]:
+    first = first.lower()
+    variants = {first}
+    variants.update(NICKNAMES.get(first, []))
+    for formal, nicks in NICKNAMES.items():
+        if first in nicks:
+            variants.add(formal)
+    return variants
+
+
+def last_name_variants(last: str, maiden_names: Iterable[str] = ()) -> set[str]:
+    """Surname forms: as given, hyphen/space swapped, each hyphen part, maiden names."""
+    variants = set()
+    for name in [last, *maiden_names]:
+        name = name.lower().strip()
+        if not name:
+            continue
+        variants.add(name)
+        if "-" in name:
+            variants.add(name.replace("-", " "))
+            variants.update(part for part in name.split("-") if len(part) > 1)
+    return variants
+
+
+def _alternation(words: Iterable[str]) -> str:
+    escaped = [re.escape(w).replace(r"\ ", r"\s+") for w in sorted(words, key=len, reverse=True)]
+    return "(?:" + "|".join(escaped) + ")"
+
+
+@dataclass
+class NameMatch:
+    start: int
+    end: int
+    text: str
+    variant: str  # full, reversed, initial
+
+
+@dataclass
+class NameMatchResult:
+    matches: list[NameMatch] = field(default_factory=list)
+    proximity: Optional[int] = None  # smallest gap between first and last tokens
+
+    @property
+    def found(self) -> bool:
+        if self.matches:
+            return True
+        return self.proximity is not None and self.proximity <= PROXIMITY_WINDOW
+
+
+class NameMatcher:
+    """All accepted spellings of one person's name, compiled into one regex.
+
+    A single ``finditer`` pass over the page finds full forms ("John Doe",
+    "John Q. Doe", "Jack Doe"), reversed forms ("Doe, John"), initial
+    forms ("J. Doe") and loose first/last tokens used for proximity.
+    """
+
+    def __init__(
+        self,
+        first: str,
+        last: str,
+        middle: Optional[str] = None,
+        maiden_names: Iterable[str] = (),
+    ):
+        first, last = first.strip(), last.strip()
+        self.first = first
+        self.last = last
+        if not first and not last:
+            # Nothing to look for; an empty lead class would not compile
+            self.pattern = re.compile(r"(?!)")
+            return
+        first_forms = first_name_variants(first)
+        firsts = _alternation(first_forms)
+        middle_part = r"(?:[a-z]\.?\s+"
+        if middle:
+            middle_part += "|" + re.escape(middle.lower()) + r"\s+"
+        middle_part += ")?"
+
+        if last:
+            last_forms = last_name_variants(last, maiden_names)
+            lasts = _alternation(last_forms)
+            initial = re.escape(first[:1].lower())
+            alternatives = [
+                rf"(?P<full>\b{firsts}\s+{middle_part}{lasts}\b)",
+                rf"(?P<reversed>\b{lasts}\s*,\s*{firsts}\b)",
+                rf"(?P<initial>\b{initial}\.?\s+{middle_part}{lasts}\b)",
+                rf"(?P<first_token>\b{firsts}\b)",
+                rf"(?P<last_token>\b{lasts}\b)",
+            ]
+        else:
+            last_forms = set()
+            alternatives = [rf"(?P<full>\b{firsts}\b)"]
+        # Every form starts with one of these letters; the lookahead lets the
+        # engine reject most positions before trying the alternation.
+        leads = {w[0] for w in first_forms | last_forms if w}
+        lead = "[" + "".join(re.escape(c) for c in sorted(leads)) + "]"
+        self.pattern = re.compile(
+            rf"\b(?={lead})(?:" + "|".join(alternatives) + ")", re.IGNORECASE
+        )
+
+    @classmethod
+    def from_full_name(cls, name: str, maiden_names: Iterable[str] = ()) -> "NameMatcher":
+        parts = name.split()
+        if not parts:
+            return cls("", "")
+        middle = " ".join(parts[1:-1]) or None
+        return cls(parts[0], parts[-1] if len(parts) > 1 else "", middle, maiden_names)
+
+    def search(self, text: str) -> NameMatchResult:
+        result = NameMatchResult()
+        last_first_end = None
+        last_last_end = None
+        for m in self.pattern.finditer(text):
+            kind = m.lastgroup
+            if kind in ("full", "reversed", "initial"):
+                result.matches.append(NameMatch(m.start(), m.end(), m.group(0), kind))
+                continue
+            gap = None
+            if kind == "first_token":
+                if last_last_end is not None:
+                    gap = m.start() - last_last_end
+                last_first_end = m.end()
+            else:
+                if last_first_end is not None:
+                    gap = m.start() - last_first_end
+                last_last_end = m.end()
+            if gap is not None and (result.proximity is None or gap < result.proximity):
+                result.proximity = gap
+        return result
+
+
+@lru_cache(maxsize=256)
+def compile_matcher(
+    first: str,
+    last: str,
+    middle: Optional[str] = None,
+    maiden_names: tuple[str, ...] = (),
+) -> NameMatcher:
+    """Return a cached matcher so repeated checks for a person compile once."""
+    return NameMatcher(first, last, middle, maiden_names)
@@ -0,0 +1,102 @@
+"""On-disk cache of extracted broker page text keyed by search URL."""
+
+import hashlib
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from digital_footprint.sqlite_cache import SqliteCache
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Validators and outcomes per broker search URL; kept in the page cache file
+# but outside the LRU so they survive text eviction and expiry
+STATES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_states (
+    broker_slug TEXT NOT NULL,
+    url TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT,
+    found INTEGER NOT NULL DEFAULT 0,
+    snippet TEXT,
+    checked_at REAL NOT NULL,
+    PRIMARY KEY (broker_slug, url)
+);
+"""
+
+
+@dataclass
+class PageState:
+    """What a broker search URL looked like the last time it was fetched."""
+
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = None
+    found: bool = False
+    snippet: Optional[str] = None
+
+
+def content_hash(text: str) -> str:
+    """Hash of whitespace-normalized page text."""
+    return hashlib.sha256(" ".join(text.split()).encode("utf-8")).hexdigest()
+
+
+def cache_ttl_for(broker: dict) -> int:
+    """TTL in seconds for a broker's pages: ``cache_ttl_hours`` or ``recheck_days``."""
+    hours = broker.get("cache_ttl_hours")
+    if hours is None:
+        hours = broker.get("recheck_days", 30) * 24
+    return int(hours * 3600)
+
+
+class PageCache(SqliteCache):
+    """Compressed, size-bounded LRU cache of page text in a SQLite file.
+
+    Entries are keyed by (render mode, URL) and expire after a per-entry
+    TTL. When the stored (compressed) size exceeds ``max_bytes`` the least
+    recently read entries are evicted.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        super().__init__(
+            path, "pages", max_bytes,
+            extra_columns=("render_mode TEXT NOT NULL",),
+            extra_schema=STATES_SCHEMA,
+        )
+
+    @staticmethod
+    def key(url: str, render_mode: str) -> str:
+        return hashlib.sha256(f"{render_mode}\n{url}".encode()).hexdigest()
+
+    def get(self, url: str, render_mode: str) -> Optional[str]:
+        entry = self.get_entry(self.key(url, render_mode))
+        return entry[0].decode("utf-8") if entry else None
+
+    def put(self, url: str, render_mode: str, text: str, ttl_seconds: int) -> None:
+        self.put_entry(self.key(url, render_mode), url, text.encode("utf-8"), ttl_seconds, render_mode=render_mode)
+
+    def invalidate(self, url: str, render_mode: str) -> None:
+        self.delete(self.key(url, render_mode))
+
+    def get_state(self, broker_slug: str, url: str) -> Optional[PageState]:
+        row = self.conn.execute(
+            """SELECT etag, last_modified, content_hash, found, snippet
+            FROM page_states WHERE broker_slug = ? AND url = ?""",
+            (broker_slug, url),
+        ).fetchone()
+        if row is None:
+            return None
+        return PageState(row[0], row[1], row[2], bool(row[3]), row[4])
+
+    def put_state(self, broker_slug: str, url: str, state: PageState) -> None:
+        """Record validators and outcome; these survive text eviction and expiry."""
+        self.conn.execute(
+            """INSERT OR REPLACE INTO page_states
+            (broker_slug, url, etag, last_modified, content_hash, found, snippet, checked_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            (broker_slug, url, state.etag, state.last_modified, state.content_hash,
+             int(state.found), state.snippet, time.time()),
+        )
+        self.conn.commit()
@@ -22,12 +22,8 @@ _VIEWPORTS = [
 ]
 
 
-async def create_stealth_browser(headless: bool = True):
-    """Create a stealth Playwright browser context with anti-detection."""
-    from playwright.async_api import async_playwright
-
-    pw = await async_playwright().start()
-
+async def launch_stealth_browser(pw, headless: bool = True):
+    """Launch a Chromium browser with automation flags disabled."""
     launch_args = [
         "--disable-blink-features=AutomationControlled",
         "--disable-dev-shm-usage",
@@ -35,11 +31,18 @@ async def create_stealth_browser(headless: bool = True):
         "--no-default-browser-check",
     ]
 
-    browser = await pw.chromium.launch(
+    return await pw.chromium.launch(
         headless=headless,
         args=launch_args,
     )
 
+
+async def new_stealth_context(browser, blocker=None):
+    """Create a browser context with a randomized user agent and viewport.
+
+    When a ``ResourceBlocker`` is given its request routing is installed
+    on the context.
+    """
     ua = random.choice(_USER_AGENTS)
     viewport = random.choice(_VIEWPORTS)
 
@@ -74,6 +77,19 @@ async def create_stealth_browser(headless: bool = True):
     except ImportError:
         pass  # Stealth not available, init_script above provides baseline
 
+    if blocker is not None:
+        await blocker.install(context)
+
+    return context
+
+
+async def create_stealth_browser(headless: bool = True, blocker=None):
+    """Create a stealth Playwright browser context with anti-detection."""
+    from playwright.async_api import async_playwright
+
+    pw = await async_playwright().start()
+    browser = await launch_stealth_browser(pw, headless=headless)
+    context = await new_stealth_context(browser, blocker=blocker)
     return pw, browser, context
 
 
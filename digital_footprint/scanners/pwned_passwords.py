@@ -0,0 +1,317 @@
+"""Offline Pwned Passwords range store with memory-mapped prefix lookups.
+
+The Pwned Passwords API is k-anonymous: a client sends the first five hex
+characters of a SHA-1 hash and receives every known suffix in that range
+with its count. This module keeps downloaded (or bulk-loaded) ranges on
+disk so later checks need no network access.
+
+On-disk layout (one directory):
+
+``index.bin``
+    2**20 little-endian uint64 data offsets followed by 2**20 uint32
+    record counts, one slot per five-hex prefix. A count slot holds
+    ``records + 1`` so that 0 means "range not stored". The file is
+    created sparse, so unused prefixes cost no disk space.
+``ranges.bin``
+    Append-only records of a 35-hex suffix packed into 18 bytes plus a
+    uint32 occurrence count, sorted by suffix within each range.
+
+Both files are memory-mapped; a lookup is one index read and a binary
+search over a few hundred 22-byte records.
+"""
+
+import asyncio
+import hashlib
+import mmap
+import os
+import re
+import struct
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from digital_footprint.http_client import get_http_client
+
+PWNED_PASSWORDS_BASE = "https://api.pwnedpasswords.com"
+
+PREFIX_LEN = 5
+PREFIX_COUNT = 16 ** PREFIX_LEN
+SUFFIX_BYTES = 18
+RECORD = struct.Struct("<18sI")
+RECORD_SIZE = RECORD.size
+OFFSETS_SIZE = PREFIX_COUNT * 8
+INDEX_SIZE = OFFSETS_SIZE + PREFIX_COUNT * 4
+MAX_COUNT = 2 ** 32 - 1
+
+SHA1_RE = re.compile(r"^[0-9A-Fa-f]{40}$")
+PREFIX_RE = re.compile(r"^[0-9A-Fa-f]{5}$")
+
+
+def sha1_hex(password: str) -> str:
+    return hashlib.sha1(password.encode("utf-8")).hexdigest().upper()
+
+
+def is_sha1(value: Optional[str]) -> bool:
+    return bool(value) and bool(SHA1_RE.match(value))
+
+
+def _pack_suffix(suffix: str) -> bytes:
+    # 35 hex digits, left-padded to 36 so they fill 18 bytes exactly
+    return bytes.fromhex("0" + suffix)
+
+
+def _unpack_suffix(packed: bytes) -> str:
+    return packed.hex().upper()[1:]
+
+
+def parse_range(text: str) -> dict[str, int]:
+    """Parse a ``SUFFIX:COUNT`` range body, dropping padding entries (count 0)."""
+    entries = {}
+    for line in text.splitlines():
+        suffix, _, count = line.strip().partition(":")
+        if len(suffix) == 35 and count.strip().isdigit() and int(count) > 0:
+            entries[suffix.upper()] = int(count)
+    return entries
+
+
+class PwnedPasswordsStore:
+    """Local copy of Pwned Passwords ranges.
+
+    Ranges are added one at a time with :meth:`put_range` (API downloads)
+    or in bulk with :meth:`load_dump`. Replacing a range appends new
+    records and leaves the old ones unreferenced; :meth:`compact`
+    rewrites the data file without them. Not safe for concurrent writers.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        index_path = self.directory / "index.bin"
+        with open(index_path, "ab") as f:
+            if f.tell() < INDEX_SIZE:
+                f.truncate(INDEX_SIZE)
+        self._index_file = open(index_path, "r+b")
+        self._index = mmap.mmap(self._index_file.fileno(), INDEX_SIZE)
+        self._data_path = self.directory / "ranges.bin"
+        self._data_file = open(self._data_path, "a+b")
+        self._data: Optional[mmap.mmap] = None
+        self._data_size = 0
+
+    def _slot(self, prefix: str) -> int:
+        if not PREFIX_RE.match(prefix):
+            raise ValueError(f"Invalid range prefix: {prefix!r}")
+        return int(prefix, 16)
+
+    def _entry(self, slot: int) -> tuple[int, int]:
+        (offset,) = struct.unpack_from("<Q", self._index, slot * 8)
+        (stored,) = struct.unpack_from("<I", self._index, OFFSETS_SIZE + slot * 4)
+        return offset, stored
+
+    def _data_view(self) -> Optional[mmap.mmap]:
+        size = os.fstat(self._data_file.fileno()).st_size
+        if size != self._data_size:
+            if self._data is not None:
+                self._data.close()
+            self._data = mmap.mmap(self._data_file.fileno(), size, access=mmap.ACCESS_READ) if size else None
+            self._data_size = size
+        return self._data
+
+    def has_range(self, prefix: str) -> bool:
+        return self._entry(self._slot(prefix))[1] > 0
+
+    def _records(self, prefix: str) -> Optional[tuple[mmap.mmap, int, int]]:
+        offset, stored = self._entry(self._slot(prefix))
+        if stored == 0:
+            return None
+        return self._data_view(), offset, stored - 1
+
+    def range(self, prefix: str) -> Optional[dict[str, int]]:
+        """All suffixes stored for ``prefix``, or None if the range is not stored."""
+        located = self._records(prefix.upper())
+        if located is None:
+            return None
+        data, offset, n = located
+        if n == 0:
+            return {}
+        return {
+            _unpack_suffix(suffix): count
+            for suffix, count in RECORD.iter_unpack(data[offset:offset + n * RECORD_SIZE])
+        }
+
+    def lookup(self, sha1: str) -> Optional[int]:
+        """Times the hash appears in breaches: 0 if not pwned, None if its range is not stored."""
+        sha1 = sha1.upper()
+        located = self._records(sha1[:PREFIX_LEN])
+        if located is None:
+            return None
+        data, offset, n = located
+        target = _pack_suffix(sha1[PREFIX_LEN:])
+        lo, hi = 0, n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = offset + mid * RECORD_SIZE
+            key = data[start:start + SUFFIX_BYTES]
+            if key < target:
+                lo = mid + 1
+            elif key > target:
+                hi = mid
+            else:
+                return RECORD.unpack_from(data, start)[1]
+        return 0
+
+    def _write_range(self, slot: int, entries: Iterable[tuple[str, int]]) -> int:
+        records = sorted((_pack_suffix(s), min(c, MAX_COUNT)) for s, c in entries)
+        self._data_file.seek(0, os.SEEK_END)
+        offset = self._data_file.tell()
+        self._data_file.write(b"".join(RECORD.pack(s, c) for s, c in records))
+        struct.pack_into("<Q", self._index, slot * 8, offset)
+        struct.pack_into("<I", self._index, OFFSETS_SIZE + slot * 4, len(records) + 1)
+        return len(records)
+
+    def put_range(self, prefix: str, entries: dict[str, int]) -> None:
+        """Store (or replace) one downloaded range."""
+        self._write_range(self._slot(prefix.upper()), entries.items())
+        self.flush()
+
+    def load_dump(self, path: Union[str, Path]) -> int:
+        """Bulk-load a local Pwned Passwords dump; returns the number of ranges.
+
+        ``path`` is either a directory of ``ABCDE.txt`` range files (as
+        written by the official downloader) or a single ``HASH:COUNT`` file
+        ordered by hash. A file ordered by prevalence raises ValueError.
+        """
+        path = Path(path)
+        loaded = 0
+        if path.is_dir():
+            for file in sorted(path.iterdir()):
+                if file.suffix.lower() == ".txt" and PREFIX_RE.match(file.stem):
+                    entries = parse_range(file.read_text())
+                    self._write_range(int(file.stem, 16), entries.items())
+                    loaded += 1
+        else:
+            for prefix, entries in _group_dump(path):
+                self._write_range(int(prefix, 16), entries)
+                loaded += 1
+        self.flush()
+        return loaded
+
+    def compact(self) -> None:
+        """Rewrite the data file keeping only the records the index points at."""
+        tmp_path = self.directory / "ranges.bin.tmp"
+        data = self._data_view()
+        new_index = bytearray(INDEX_SIZE)
+        with open(tmp_path, "wb") as out:
+            for slot in range(PREFIX_COUNT):
+                offset, stored = self._entry(slot)
+                if stored == 0:
+                    continue
+                struct.pack_into("<Q", new_index, slot * 8, out.tell())
+                struct.pack_into("<I", new_index, OFFSETS_SIZE + slot * 4, stored)
+                if stored > 1:
+                    out.write(data[offset:offset + (stored - 1) * RECORD_SIZE])
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+        self._data_file.close()
+        os.replace(tmp_path, self._data_path)
+        self._data_file = open(self._data_path, "a+b")
+        self._data_size = 0
+        self._index[:] = new_index
+        self._index.flush()
+
+    def stats(self) -> dict:
+        counts = memoryview(self._index)[OFFSETS_SIZE:]
+        ranges = hashes = 0
+        for (stored,) in struct.iter_unpack("<I", counts):
+            if stored:
+                ranges += 1
+                hashes += stored - 1
+        counts.release()
+        return {
+            "ranges": ranges,
+            "hashes": hashes,
+            "data_bytes": os.fstat(self._data_file.fileno()).st_size,
+            "complete": ranges == PREFIX_COUNT,
+        }
+
+    def flush(self) -> None:
+        self._data_file.flush()
+        self._index.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+        self._index.close()
+        self._index_file.close()
+        self._data_file.close()
+
+
+def _group_dump(path: Path) -> Iterator[tuple[str, list[tuple[str, int]]]]:
+    """Yield ``(prefix, [(suffix, count), ...])`` from a hash-ordered dump file.
+
+    Raises ValueError when a prefix sorts before the previous one, as in
+    the prevalence-ordered dumps: a later run of a prefix would replace
+    the earlier one in the store.
+    """
+    current = None
+    entries: list[tuple[str, int]] = []
+    with open(path, "r", encoding="ascii", errors="ignore") as f:
+        for line in f:
+            sha1, _, count = line.strip().partition(":")
+            if len(sha1) != 40 or not count.isdigit():
+                continue
+            sha1 = sha1.upper()
+            prefix = sha1[:PREFIX_LEN]
+            if prefix != current:
+                if current is not None:
+                    if prefix < current:
+                        raise ValueError(
+                            f"{path} is not ordered by hash ({prefix} follows {current}); "
+                            "use the ordered-by-hash dump"
+                        )
+                    yield current, entries
+                current, entries = prefix, []
+            entries.append((sha1[PREFIX_LEN:], int(count)))
+    if current is not None:
+        yield current, entries
+
+
+async def fetch_range(prefix: str) -> dict[str, int]:
+    """Download one range from the API (with padding, which is dropped)."""
+    resp = await get_http_client().get(
+        f"{PWNED_PASSWORDS_BASE}/range/{prefix.upper()}",
+        headers={"Add-Padding": "true"},
+    )
+    resp.raise_for_status()
+    return parse_range(resp.text)
+
+
+async def check_hashes(
+    hashes: Iterable[str],
+    store: Optional[PwnedPasswordsStore] = None,
+    offline: bool = False,
+) -> dict[str, Optional[int]]:
+    """Pwned counts for SHA-1 hashes, downloading missing ranges into ``store``.
+
+    Values that are not SHA-1 hex digests (e.g. bcrypt hashes from DeHashed)
+    are skipped. With ``offline=True`` no requests are made and hashes whose
+    range is not stored map to None.
+    """
+    wanted = list(dict.fromkeys(h.upper() for h in hashes if is_sha1(h)))
+    results: dict[str, Optional[int]] = {
+        sha1: store.lookup(sha1) if store is not None else None for sha1 in wanted
+    }
+    if offline:
+        return results
+
+    missing = sorted({sha1[:PREFIX_LEN] for sha1, count in results.items() if count is None})
+    ranges = await asyncio.gather(*(fetch_range(prefix) for prefix in missing))
+    fetched = dict(zip(missing, ranges))
+    if store is not None:
+        for prefix, entries in fetched.items():
+            store.put_range(prefix, entries)
+    for sha1, count in results.items():
+        if count is None:
+            results[sha1] = fetched[sha1[:PREFIX_LEN]].get(sha1[PREFIX_LEN:], 0)
+    return results
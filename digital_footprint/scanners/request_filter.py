@@ -0,0 +1,96 @@
+"""Request interception that drops assets we never read from broker pages."""
+
+from dataclasses import dataclass, field
+from typing import Optional
+from urllib.parse import urlparse
+
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+TRACKER_DOMAINS = {
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+    "googlesyndication.com", "googleadservices.com", "adservice.google.com",
+    "facebook.net", "connect.facebook.net", "bat.bing.com", "clarity.ms",
+    "hotjar.com", "segment.com", "segment.io", "mixpanel.com", "amplitude.com",
+    "fullstory.com", "quantserve.com", "scorecardresearch.com", "criteo.com",
+    "adnxs.com", "taboola.com", "outbrain.com", "pubmatic.com", "rubiconproject.com",
+    "nr-data.net", "newrelic.com",
+}
+
+# Aborted requests never report a size, so savings are estimated from
+# typical transfer sizes per category.
+ESTIMATED_BYTES = {
+    "image": 40_000,
+    "font": 30_000,
+    "media": 250_000,
+    "tracker": 15_000,
+}
+
+# Broker slugs whose result pages break when assets are blocked
+DEFAULT_ALLOWLIST: set[str] = set()
+
+
+def is_tracker(url: str, tracker_domains: set[str] = TRACKER_DOMAINS) -> bool:
+    host = (urlparse(url).hostname or "").lower()
+    return any(host == d or host.endswith("." + d) for d in tracker_domains)
+
+
+@dataclass
+class BlockStats:
+    blocked_requests: int = 0
+    allowed_requests: int = 0
+    estimated_bytes_saved: int = 0
+    by_category: dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            "blocked_requests": self.blocked_requests,
+            "allowed_requests": self.allowed_requests,
+            "estimated_bytes_saved": self.estimated_bytes_saved,
+            "by_category": dict(self.by_category),
+        }
+
+
+class ResourceBlocker:
+    """Abort image, font, media and tracker requests in a browser context.
+
+    One blocker can be shared across many contexts; its ``stats``
+    accumulate over all of them. Brokers in ``allowlist`` are loaded
+    without interception.
+    """
+
+    def __init__(
+        self,
+        resource_types: Optional[set[str]] = None,
+        tracker_domains: Optional[set[str]] = None,
+        allowlist: Optional[set[str]] = None,
+    ):
+        self.resource_types = BLOCKED_RESOURCE_TYPES if resource_types is None else set(resource_types)
+        self.tracker_domains = TRACKER_DOMAINS if tracker_domains is None else set(tracker_domains)
+        self.allowlist = DEFAULT_ALLOWLIST | set(allowlist or ())
+        self.stats = BlockStats()
+
+    def applies_to(self, broker_slug: Optional[str]) -> bool:
+        return broker_slug not in self.allowlist
+
+    def block_reason(self, resource_type: str, url: str) -> Optional[str]:
+        """Return the block category for a request, or None to let it through."""
+        if resource_type in self.resource_types:
+            return resource_type
+        if is_tracker(url, self.tracker_domains):
+            return "tracker"
+        return None
+
+    async def install(self, context) -> None:
+        await context.route("**/*", self._handle)
+
+    async def _handle(self, route) -> None:
+        request = route.request
+        reason = self.block_reason(request.resource_type, request.url)
+        if reason is None:
+            self.stats.allowed_requests += 1
+            await route.continue_()
+            return
+        self.stats.blocked_requests += 1
+        self.stats.estimated_bytes_saved += ESTIMATED_BYTES.get(reason, 0)
+        self.stats.by_category[reason] = self.stats.by_category.get(reason, 0) + 1
+        await route.abort()
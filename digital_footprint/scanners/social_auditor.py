@@ -4,6 +4,7 @@ import re
 from dataclasses import dataclass, field
 from typing import Optional
 
+from digital_footprint.scanners.browser_pool import BrowserPool
 from digital_footprint.scanners.playwright_scanner import create_stealth_browser
 
 
@@ -79,30 +80,40 @@ def compute_privacy_score(result: SocialAuditResult) -> int:
     return max(score, 0)
 
 
-async def audit_profile(url: str, timeout: int = 15000) -> SocialAuditResult:
+async def _audit_page(context, url: str, platform: str, timeout: int) -> SocialAuditResult:
+    page = await context.new_page()
+    try:
+        await page.goto(url, timeout=timeout)
+        await page.wait_for_load_state("networkidle", timeout=timeout)
+        html = await page.content()
+        meta_tags = extract_meta_tags(html)
+        page_text = await page.inner_text("body")
+    finally:
+        await page.close()
+    visible_fields = {}
+    if meta_tags.get("og:title"):
+        visible_fields["name"] = meta_tags["og:title"]
+    if meta_tags.get("og:description"):
+        visible_fields["description"] = meta_tags["og:description"]
+    all_text = " ".join([page_text, meta_tags.get("og:title", ""), meta_tags.get("og:description", "")])
+    pii_flags = _detect_pii(all_text)
+    name = visible_fields.get("name", "")
+    if " " in name and name[0].isupper():
+        pii_flags.append("real_name_visible")
+    result = SocialAuditResult(platform=platform, url=url, visible_fields=visible_fields, pii_flags=pii_flags)
+    result.privacy_score = compute_privacy_score(result)
+    return result
+
+
+async def audit_profile(url: str, timeout: int = 15000, pool=None, blocker=None) -> SocialAuditResult:
     platform = detect_platform(url)
     try:
-        pw, browser, context = await create_stealth_browser()
-        page = await context.new_page()
+        if pool is not None:
+            async with pool.context(blocker=blocker) as context:
+                return await _audit_page(context, url, platform, timeout)
+        pw, browser, context = await create_stealth_browser(blocker=blocker)
         try:
-            await page.goto(url, timeout=timeout)
-            await page.wait_for_load_state("networkidle", timeout=timeout)
-            html = await page.content()
-            meta_tags = extract_meta_tags(html)
-            page_text = await page.inner_text("body")
-            visible_fields = {}
-            if meta_tags.get("og:title"):
-                visible_fields["name"] = meta_tags["og:title"]
-            if meta_tags.get("og:description"):
-                visible_fields["description"] = meta_tags["og:description"]
-            all_text = " ".join([page_text, meta_tags.get("og:title", ""), meta_tags.get("og:description", "")])
-            pii_flags = _detect_pii(all_text)
-            name = visible_fields.get("name", "")
-            if " " in name and name[0].isupper():
-                pii_flags.append("real_name_visible")
-            result = SocialAuditResult(platform=platform, url=url, visible_fields=visible_fields, pii_flags=pii_flags)
-            result.privacy_score = compute_privacy_score(result)
-            return result
+            return await _audit_page(context, url, platform, timeout)
         finally:
             await browser.close()
             await pw.stop()
@@ -110,9 +121,16 @@ async def audit_profile(url: str, timeout: int = 15000) -> SocialAuditResult:
         return SocialAuditResult(platform=platform, url=url, error=str(e))
 
 
-async def audit_profiles(urls: list[str]) -> list[SocialAuditResult]:
+async def audit_profiles(urls: list[str], pool=None, blocker=None) -> list[SocialAuditResult]:
+    owns_pool = pool is None
+    if owns_pool:
+        pool = BrowserPool()
     results = []
-    for url in urls:
-        result = await audit_profile(url)
-        results.append(result)
+    try:
+        for url in urls:
+            result = await audit_profile(url, pool=pool, blocker=blocker)
+            results.append(result)
+    finally:
+        if owns_pool:
+            await pool.close()
     return results
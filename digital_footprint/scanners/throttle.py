@@ -0,0 +1,43 @@
+"""Per-host request spacing for polite concurrent scanning."""
+
+import asyncio
+import random
+import time
+from urllib.parse import urlparse
+
+
+def host_key(url: str) -> str:
+    """Normalize a URL to the host used for politeness accounting."""
+    host = (urlparse(url).hostname or url).lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return host
+
+
+class HostThrottle:
+    """Enforce a randomized minimum spacing between requests to the same host.
+
+    Requests to different hosts never wait on each other; requests to the
+    same host are serialized and spaced by ``min_interval``-``max_interval``
+    seconds.
+    """
+
+    def __init__(self, min_interval: float = 2.0, max_interval: float = 5.0):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._next_allowed: dict[str, float] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def wait(self, url: str) -> float:
+        """Wait until ``url``'s host may be contacted again. Returns seconds slept."""
+        host = host_key(url)
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            now = time.monotonic()
+            delay = max(0.0, self._next_allowed.get(host, now) - now)
+            if delay:
+                await asyncio.sleep(delay)
+            self._next_allowed[host] = time.monotonic() + random.uniform(
+                self.min_interval, self.max_interval
+            )
+            return delay
@@ -0,0 +1,106 @@
+"""Worker pool that drains the queue of Maigret username scans."""
+
+import asyncio
+import logging
+from dataclasses import asdict
+from typing import Optional
+
+from digital_footprint.db import Database
+from digital_footprint.http_client import run_async
+from digital_footprint.scanners.username_scanner import UsernameScan, scan_username
+
+logger = logging.getLogger("digital_footprint.scanners")
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_TIMEOUT = 120
+CANCEL_POLL_INTERVAL = 2.0
+
+
+def enqueue_usernames(
+    db: Database,
+    usernames: Optional[list[str]] = None,
+    person_id: Optional[int] = None,
+    tier: str = "full",
+) -> list[int]:
+    """Queue scans for ``usernames``, or for the usernames of one or all persons.
+
+    A username already queued or running in the same tier is not queued twice.
+    """
+    if usernames:
+        pairs = [(u, person_id) for u in usernames]
+    else:
+        persons = [db.get_person(person_id)] if person_id is not None else db.list_persons()
+        pairs = [(u, p.id) for p in persons if p for u in p.usernames]
+    job_ids = []
+    for username, owner in pairs:
+        job_id = db.enqueue_username_job(username, person_id=owner, tier=tier)
+        if job_id not in job_ids:
+            job_ids.append(job_id)
+    return job_ids
+
+
+class UsernameScanPool:
+    """Run queued username jobs with at most ``concurrency`` Maigret processes.
+
+    Each job gets its own scratch directory and a hard ``deadline`` (see
+    :func:`scan_username`). Workers poll the job row while it runs, so a
+    cancel issued from the CLI or an MCP tool kills the process and stores
+    the partial results.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: int = DEFAULT_TIMEOUT,
+        deadline: Optional[float] = None,
+        poll_interval: float = CANCEL_POLL_INTERVAL,
+    ):
+        self.db = db
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.deadline = deadline
+        self.poll_interval = poll_interval
+        self.counts: dict[str, int] = {}
+
+    async def run(self) -> dict[str, int]:
+        """Work until the queue is empty; returns finished jobs per status."""
+        await asyncio.gather(*(self._worker() for _ in range(self.concurrency)))
+        return dict(self.counts)
+
+    async def _worker(self) -> None:
+        while True:
+            job = self.db.claim_username_job()
+            if job is None:
+                return
+            scan = await self._run_job(job)
+            self.db.finish_username_job(
+                job["id"], scan.status, [asdict(r) for r in scan.results], scan.error,
+            )
+            self.counts[scan.status] = self.counts.get(scan.status, 0) + 1
+            logger.info(
+                f"Username job {job['id']} ({job['username']}, {job['tier']}): "
+                f"{scan.status}, {len(scan.results)} sites"
+            )
+
+    async def _run_job(self, job: dict) -> UsernameScan:
+        cancel = asyncio.Event()
+        task = asyncio.ensure_future(
+            scan_username(
+                job["username"], timeout=self.timeout, deadline=self.deadline, cancel=cancel,
+                tier=job.get("tier") or "full",
+            )
+        )
+        while not task.done():
+            await asyncio.wait([task], timeout=self.poll_interval)
+            if not task.done() and self.db.username_job_cancel_requested(job["id"]):
+                cancel.set()
+        try:
+            return task.result()
+        except Exception as e:
+            return UsernameScan(username=job["username"], status="failed", error=str(e))
+
+
+def run_username_jobs(db: Database, **kwargs) -> dict[str, int]:
+    """Sync wrapper: drain the username job queue."""
+    return run_async(UsernameScanPool(db, **kwargs).run())
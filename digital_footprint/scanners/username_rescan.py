@@ -0,0 +1,138 @@
+"""Differential Maigret re-scans backed by the per-site result cache."""
+
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from digital_footprint.db import Database
+from digital_footprint.scanners.username_scanner import (
+    FAST_TIER_TAGS,
+    FAST_TIER_TOP_SITES,
+    TIERS,
+    UsernameResult,
+    load_maigret_sites,
+    scan_username,
+    split_site_tiers,
+    write_site_db,
+)
+
+# How long a (username, site) result is trusted before the site is re-checked
+USERNAME_SITE_TTL = 7 * 24 * 3600
+
+
+@dataclass
+class UsernameDiff:
+    """Result of a differential re-scan.
+
+    ``accounts`` is every site currently claimed (fresh cache entries plus
+    the sites just checked); ``new`` and ``gone`` are the changes since the
+    previous scan, ready for alerting.
+    """
+
+    username: str
+    status: str = "completed"
+    accounts: list[UsernameResult] = field(default_factory=list)
+    new: list[UsernameResult] = field(default_factory=list)
+    gone: list[str] = field(default_factory=list)
+    checked: int = 0
+    cached: int = 0
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        def _account(r: UsernameResult) -> dict:
+            return {"site": r.site_name, "url": r.url, "risk": r.risk_level}
+
+        return {
+            "username": self.username,
+            "status": self.status,
+            "accounts": [_account(r) for r in self.accounts],
+            "new_since_last_scan": [_account(r) for r in self.new],
+            "gone_since_last_scan": self.gone,
+            "sites_checked": self.checked,
+            "sites_cached": self.cached,
+            "error": self.error,
+        }
+
+
+def stale_sites(cached: dict[str, dict], sites: list[str], ttl: float, now: float) -> list[str]:
+    """Sites never checked for this username, or checked more than ``ttl`` ago."""
+    return [
+        name for name in sites
+        if name not in cached or now - cached[name]["last_checked_at"] >= ttl
+    ]
+
+
+async def rescan_username(
+    db: Database,
+    username: str,
+    ttl: float = USERNAME_SITE_TTL,
+    timeout: int = 120,
+    deadline: Optional[float] = None,
+    sites_data: Optional[dict] = None,
+    tier: Optional[str] = None,
+    top_sites: int = FAST_TIER_TOP_SITES,
+) -> UsernameDiff:
+    """Re-check only the sites whose cached result is missing or stale.
+
+    Needs Maigret's site database to pick sites; without it a default run
+    is made and only the sites it reports on are compared. A run that was
+    killed early updates only the sites it confirmed as claimed.
+
+    ``tier`` (``fast`` or ``tail``, see :func:`split_site_tiers`) limits
+    the candidates to that tier's sites; by default every enabled site is
+    considered, which on a first scan means all of them.
+    """
+    if tier is not None and tier not in TIERS:
+        raise ValueError(f"unknown tier {tier!r}")
+    data = sites_data if sites_data is not None else load_maigret_sites()
+    cached = db.get_username_sites(username)
+    now = time.time()
+    diff = UsernameDiff(username=username)
+
+    to_check: Optional[list[str]] = None
+    if data is not None:
+        enabled = {name: site for name, site in data.get("sites", {}).items() if not site.get("disabled")}
+        if tier in ("fast", "tail"):
+            fast, tail = split_site_tiers(data, top_sites, FAST_TIER_TAGS)
+            enabled = fast if tier == "fast" else tail
+        to_check = stale_sites(cached, sorted(enabled), ttl, now)
+        diff.cached = len(enabled) - len(to_check)
+
+    claimed: dict[str, UsernameResult] = {}
+    if to_check is None or to_check:
+        with tempfile.TemporaryDirectory(prefix="maigret_sites_") as tmp:
+            sites_db = None
+            if to_check is not None:
+                sites_db = write_site_db(data, {n: enabled[n] for n in to_check}, Path(tmp) / "sites.json")
+            scan = await scan_username(
+                username, timeout=timeout, deadline=deadline, sites_db=sites_db, tier=tier, top_sites=top_sites,
+            )
+        diff.status, diff.error = scan.status, scan.error
+        claimed = {r.site_name: r for r in scan.results}
+
+        if scan.status != "completed":
+            checked = set(claimed)
+        elif to_check is not None:
+            checked = set(to_check)
+        elif tier in (None, "full"):
+            checked = set(claimed) | {name for name, site in cached.items() if site["claimed"]}
+        else:
+            # A tier run without the site database can't say which cached sites it covered
+            checked = set(claimed)
+        diff.checked = len(checked)
+        diff.new = [r for name, r in sorted(claimed.items()) if not cached.get(name, {}).get("claimed")]
+        diff.gone = sorted(name for name in checked - set(claimed) if cached.get(name, {}).get("claimed"))
+        db.update_username_sites(
+            username,
+            claimed=[{"site_name": r.site_name, "url": r.url, "tags": r.tags} for r in claimed.values()],
+            unclaimed=sorted(checked - set(claimed)),
+            checked_at=now,
+        )
+
+    diff.accounts = [
+        UsernameResult(site_name=site["site_name"], url=site["url"], tags=site["tags"])
+        for site in db.get_username_sites(username, claimed_only=True).values()
+    ]
+    return diff
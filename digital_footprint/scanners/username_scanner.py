@@ -1,12 +1,32 @@
 """Username scanner using Maigret."""
 
 import asyncio
+import functools
 import json
+import os
+import re
+import shutil
+import sys
 import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+# Extra wall-clock time past Maigret's per-request --timeout before the run is killed
+MAIGRET_GRACE = 60
+
+# Maigret prints "[+] Site: url" for every claimed account as it goes
+CLAIMED_LINE_RE = re.compile(r"^\[\+\]\s+(?P<site>[^:]+?):\s+(?P<url>https?://\S+)")
+
+HIGH_RISK_TAGS = {"dating", "adult", "financial", "gambling"}
+MEDIUM_RISK_TAGS = {"social", "photo", "video", "gaming", "forum"}
+
+# Scan tiers: "fast" = top-ranked sites plus every site tagged with a
+# high/medium risk tag; "tail" = every other site; "full" = all sites.
+FAST_TIER_TOP_SITES = 200
+FAST_TIER_TAGS = HIGH_RISK_TAGS | MEDIUM_RISK_TAGS
+TIERS = ("fast", "tail", "full")
+
 
 @dataclass
 class UsernameResult:
@@ -16,19 +36,35 @@ class UsernameResult:
 
     @property
     def risk_level(self) -> str:
-        high_risk_tags = {"dating", "adult", "financial", "gambling"}
-        if high_risk_tags & set(self.tags):
+        if HIGH_RISK_TAGS & set(self.tags):
             return "high"
-        medium_risk_tags = {"social", "photo", "video", "gaming", "forum"}
-        if medium_risk_tags & set(self.tags):
+        if MEDIUM_RISK_TAGS & set(self.tags):
             return "medium"
         return "low"
 
 
+@dataclass
+class UsernameScan:
+    """Outcome of one Maigret run.
+
+    ``status`` is ``completed``, ``timeout``, ``cancelled`` or ``failed``;
+    for the latter three ``results`` holds whatever was recovered before
+    the run stopped.
+    """
+
+    username: str
+    status: str = "completed"
+    results: list[UsernameResult] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def partial(self) -> bool:
+        return self.status != "completed"
+
+
 def _get_output_dir() -> Path:
-    output_dir = Path(tempfile.gettempdir()) / "maigret_output"
-    output_dir.mkdir(parents=True, exist_ok=True)
-    return output_dir
+    """A fresh scratch directory, so concurrent runs never share report files."""
+    return Path(tempfile.mkdtemp(prefix="maigret_"))
 
 
 def parse_maigret_results(data: dict) -> list[UsernameResult]:
@@ -50,27 +86,158 @@ def parse_maigret_results(data: dict) -> list[UsernameResult]:
     return results
 
 
-async def search_username(
-    username: str, timeout: int = 120
-) -> list[UsernameResult]:
-    """Search for a username across sites using Maigret."""
-    output_dir = _get_output_dir()
+def load_maigret_sites(path: Optional[Path] = None) -> Optional[dict]:
+    """Maigret's site database (its bundled ``resources/data.json`` by default).
+
+    Returns None when maigret isn't installed or the file can't be read.
+    """
+    try:
+        if path is None:
+            from importlib.resources import files
+
+            return json.loads((files("maigret") / "resources" / "data.json").read_text())
+        return json.loads(Path(path).read_text())
+    except (ImportError, OSError, ValueError):
+        return None
+
 
-    proc = await asyncio.create_subprocess_exec(
-        "maigret", username,
-        "-J", "simple",
-        "--folderoutput", str(output_dir),
-        "--timeout", str(timeout),
-        "--no-color",
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
+def split_site_tiers(data: dict, top_n: int, tags: set[str]) -> tuple[dict, dict]:
+    """Split enabled sites into (fast, tail) by rank and tags."""
+    sites = {name: site for name, site in data.get("sites", {}).items() if not site.get("disabled")}
+    ranked = sorted(sites, key=lambda name: sites[name].get("alexaRank") or sys.maxsize)
+    fast = set(ranked[:top_n])
+    fast.update(name for name, site in sites.items() if tags & set(site.get("tags", [])))
+    return (
+        {name: site for name, site in sites.items() if name in fast},
+        {name: site for name, site in sites.items() if name not in fast},
     )
-    await proc.communicate()
 
-    # Maigret writes report_<username>_simple.json
-    output_file = output_dir / f"report_{username}_simple.json"
-    if not output_file.exists():
-        return []
 
-    data = json.loads(output_file.read_text())
-    return parse_maigret_results(data)
+def write_site_db(data: dict, sites: dict, path: Path) -> Path:
+    """Write ``sites`` as a Maigret database file (engines and tags kept from ``data``)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(dict(data, sites=sites)))
+    os.replace(tmp, path)
+    return path
+
+
+@functools.lru_cache(maxsize=8)
+def _tier_db(tier: str, top_n: int) -> Optional[Path]:
+    """Write the site subset for a tier as a Maigret database file (once per process)."""
+    data = load_maigret_sites()
+    if data is None:
+        return None
+    fast, tail = split_site_tiers(data, top_n, FAST_TIER_TAGS)
+    directory = Path(tempfile.gettempdir()) / "digital_footprint_maigret"
+    return write_site_db(data, fast if tier == "fast" else tail, directory / f"{tier}_{top_n}.json")
+
+
+def tier_args(tier: str, top_n: int = FAST_TIER_TOP_SITES) -> list[str]:
+    """Maigret arguments that restrict a run to one tier's sites."""
+    if tier not in TIERS:
+        raise ValueError(f"unknown tier {tier!r}")
+    if tier == "full":
+        return ["-a"]
+    db_path = _tier_db(tier, top_n)
+    if db_path is not None:
+        return ["--db", str(db_path), "-a"]
+    # No readable site database: rank-only fast tier, and a full run for the tail
+    return ["--top-sites", str(top_n)] if tier == "fast" else ["-a"]
+
+
+def parse_claimed_line(line: str) -> Optional[UsernameResult]:
+    """Parse one "[+] Site: url" progress line from Maigret's stdout."""
+    match = CLAIMED_LINE_RE.match(line.strip())
+    if not match:
+        return None
+    return UsernameResult(site_name=match.group("site").strip(), url=match.group("url"))
+
+
+async def _stream_claims(proc, found: dict[str, UsernameResult]) -> None:
+    async for raw in proc.stdout:
+        result = parse_claimed_line(raw.decode(errors="replace"))
+        if result:
+            found[result.site_name] = result
+    await proc.wait()
+
+
+async def scan_username(
+    username: str,
+    timeout: int = 120,
+    deadline: Optional[float] = None,
+    cancel: Optional[asyncio.Event] = None,
+    tier: Optional[str] = None,
+    top_sites: int = FAST_TIER_TOP_SITES,
+    sites_db: Optional[Path] = None,
+) -> UsernameScan:
+    """Run Maigret for one username with a hard wall-clock ``deadline``.
+
+    ``timeout`` is Maigret's per-request timeout; the whole run is killed
+    after ``deadline`` seconds (default ``timeout + MAIGRET_GRACE``) or
+    when ``cancel`` is set. Claimed sites are read from stdout as Maigret
+    prints them, so a killed run still returns what it found; a finished
+    run uses the JSON report, which also carries site tags.
+
+    ``tier`` limits the run to the ``fast`` or ``tail`` site subset (or
+    ``full`` for every site), and ``sites_db`` to exactly the sites in a
+    Maigret database file; by default Maigret's own top-500 is checked.
+    """
+    deadline = deadline if deadline is not None else timeout + MAIGRET_GRACE
+    output_dir = _get_output_dir()
+    streamed: dict[str, UsernameResult] = {}
+    scan = UsernameScan(username=username)
+    proc = None
+    waiters: list[asyncio.Future] = []
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "maigret", username,
+            "-J", "simple",
+            "--folderoutput", str(output_dir),
+            "--timeout", str(timeout),
+            "--no-color",
+            "--no-progressbar",
+            *(["--db", str(sites_db), "-a"] if sites_db else tier_args(tier, top_sites) if tier else []),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        run = asyncio.ensure_future(_stream_claims(proc, streamed))
+        waiters.append(run)
+        if cancel is not None:
+            waiters.append(asyncio.ensure_future(cancel.wait()))
+        done, _ = await asyncio.wait(waiters, timeout=deadline, return_when=asyncio.FIRST_COMPLETED)
+        if run not in done:
+            scan.status = "cancelled" if done else "timeout"
+        else:
+            run.result()
+
+        # Maigret writes report_<username>_simple.json
+        output_file = output_dir / f"report_{username}_simple.json"
+        if scan.status == "completed" and output_file.exists():
+            scan.results = parse_maigret_results(json.loads(output_file.read_text()))
+        else:
+            scan.results = list(streamed.values())
+    except FileNotFoundError:
+        scan.status, scan.error = "failed", "maigret is not installed"
+    except Exception as e:
+        scan.status, scan.error = "failed", str(e)
+        scan.results = list(streamed.values())
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        if proc is not None and proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+        shutil.rmtree(output_dir, ignore_errors=True)
+    return scan
+
+
+async def search_username(
+    username: str, timeout: int = 120
+) -> list[UsernameResult]:
+    """Search for a username across sites using Maigret."""
+    return (await scan_username(username, timeout=timeout)).results
@@ -1,6 +1,5 @@
 """Scheduled job definitions for Digital Footprint."""
 
-import asyncio
 import json
 import logging
 from dataclasses import dataclass, field
@@ -8,9 +7,16 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+from digital_footprint.broker_registry import load_all_brokers
 from digital_footprint.config import Config
 from digital_footprint.db import Database
-from digital_footprint.scanners.breach_scanner import scan_breaches
+from digital_footprint.http_client import run_async
+from digital_footprint.removers.verification import RemovalVerifier
+from digital_footprint.scanners.breach_scanner import save_breach_results, scan_breaches_many
+from digital_footprint.scanners.broker_health import BrokerHealth
+from digital_footprint.scanners.broker_scanner import split_name
+from digital_footprint.scanners.hibp_catalogue import BreachCatalogue
+from digital_footprint.scanners.hibp_scheduler import PRIORITY_LOW, hibp_stats
 from digital_footprint.monitors.dark_web_monitor import run_dark_web_scan
 from digital_footprint.reporters.exposure_report import generate_exposure_report
 from digital_footprint.pipeline.alerter import check_and_alert
@@ -23,6 +29,7 @@ JOB_INTERVALS = {
     "dark_web_monitor": 3,
     "verify_removals": 1,
     "generate_report": 7,
+    "refresh_breach_catalogue": 1,
 }
 
 
@@ -36,18 +43,17 @@ class JobResult:
     error: Optional[str] = None
 
 
-def _run_async(coro):
-    """Run an async function from sync context."""
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                return pool.submit(asyncio.run, coro).result()
-        else:
-            return loop.run_until_complete(coro)
-    except RuntimeError:
-        return asyncio.run(coro)
+async def _total_dark_web_findings(emails: list[str], config: Config) -> int:
+    total = 0
+    for email in emails:
+        try:
+            results = await run_dark_web_scan(
+                email, hibp_api_key=config.hibp_api_key, hibp_rpm=config.hibp_rpm, priority=PRIORITY_LOW,
+            )
+            total += results.get("total", 0)
+        except Exception as e:
+            logger.error(f"Dark web scan failed for {email}: {e}")
+    return total
 
 
 def job_breach_recheck(db: Database, config: Config) -> JobResult:
@@ -65,34 +71,35 @@ def job_breach_recheck(db: Database, config: Config) -> JobResult:
             details={"persons_checked": 0, "new_breaches": 0},
         )
 
-    previous_total = 0  # First run baseline
-    last_run = db.get_last_run("breach_recheck")
-    if last_run and last_run.get("details"):
-        try:
-            prev_details = json.loads(last_run["details"]) if isinstance(last_run["details"], str) else last_run["details"]
-            previous_total = prev_details.get("new_breaches", 0)
-        except (json.JSONDecodeError, TypeError):
-            pass
-
+    catalogue = BreachCatalogue(db) if config.hibp_api_key else None
+    batch = run_async(scan_breaches_many(
+        [p.emails[0] for p in persons_with_email],
+        hibp_api_key=config.hibp_api_key,
+        dehashed_api_key=config.dehashed_api_key,
+        hibp_rpm=config.hibp_rpm,
+        priority=PRIORITY_LOW,
+        catalogue=catalogue,
+        keep_dehashed_records=False,
+    ))
+    provider_errors = {provider: len(failures) for provider, failures in batch["errors"].items() if failures}
+    for provider, failures in batch["errors"].items():
+        for email, message in failures.items():
+            logger.error(f"Breach check ({provider}) failed for {email}: {message}")
+
+    # Persist per person and alert only on breaches not recorded before
+    results_by_email = {r["email"]: r for r in batch["results"]}
     total_new = 0
     for person in persons_with_email:
-        email = person.emails[0]
-        try:
-            results = _run_async(scan_breaches(
-                email=email,
-                hibp_api_key=config.hibp_api_key,
-                dehashed_api_key=config.dehashed_api_key,
-            ))
-            total_new += results.get("total", 0)
-        except Exception as e:
-            logger.error(f"Breach check failed for {email}: {e}")
-
-    # Alert if new findings
-    for person in persons_with_email:
+        result = results_by_email.get(person.emails[0])
+        if result is None:
+            continue
+        diff = save_breach_results(db, person.id, result)
+        new_count = len(diff["new"])
+        total_new += new_count
         check_and_alert(
             job_name="breach_recheck",
-            new_count=total_new,
-            previous_count=previous_total,
+            new_count=diff["known"] + new_count,
+            previous_count=diff["known"],
             person_name=person.name,
             config=config,
         )
@@ -102,7 +109,12 @@ def job_breach_recheck(db: Database, config: Config) -> JobResult:
         started_at=started,
         completed_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         status="success",
-        details={"persons_checked": len(persons_with_email), "new_breaches": total_new},
+        details={
+            "persons_checked": len(persons_with_email),
+            "new_breaches": total_new,
+            "provider_errors": provider_errors,
+            "hibp": hibp_stats(),
+        },
     )
 
 
@@ -130,14 +142,7 @@ def job_dark_web_monitor(db: Database, config: Config) -> JobResult:
         except (json.JSONDecodeError, TypeError):
             pass
 
-    total_findings = 0
-    for person in persons_with_email:
-        email = person.emails[0]
-        try:
-            results = _run_async(run_dark_web_scan(email, hibp_api_key=config.hibp_api_key))
-            total_findings += results.get("total", 0)
-        except Exception as e:
-            logger.error(f"Dark web scan failed for {email}: {e}")
+    total_findings = run_async(_total_dark_web_findings([p.emails[0] for p in persons_with_email], config))
 
     # Alert if new findings
     for person in persons_with_email:
@@ -154,12 +159,21 @@ def job_dark_web_monitor(db: Database, config: Config) -> JobResult:
         started_at=started,
         completed_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         status="success",
-        details={"persons_checked": len(persons_with_email), "total_findings": total_findings},
+        details={"persons_checked": len(persons_with_email), "total_findings": total_findings, "hibp": hibp_stats()},
     )
 
 
+async def _verify_all(verifier: RemovalVerifier, removals: list[dict]) -> list[dict]:
+    return [await verifier.verify_single(removal) for removal in removals]
+
+
 def job_verify_removals(db: Database, config: Config) -> JobResult:
-    """Verify pending removal requests."""
+    """Re-scan brokers to verify pending removal requests.
+
+    Brokers whose circuit breaker is open are skipped and re-checked on
+    the next run; a scan that fails only counts as an attempt and never
+    confirms a removal.
+    """
     started = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     pending = db.get_pending_verifications()
 
@@ -172,20 +186,66 @@ def job_verify_removals(db: Database, config: Config) -> JobResult:
             details={"pending_count": 0, "message": "No removals due for verification"},
         )
 
-    verified = 0
+    # Search URL patterns live only in the broker YAML files
+    registry = {b.slug: b for b in load_all_brokers(config.brokers_dir)}
+    brokers = {b.id: b for b in db.list_brokers()}
+    removals = []
     for removal in pending:
-        db.update_removal(removal["id"], last_checked_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        verified += 1
+        broker = brokers.get(removal["broker_id"])
+        person = db.get_person(removal["person_id"])
+        first_name, last_name = split_name(person.name) if person else ("", "")
+        entry = registry.get(broker.slug) if broker else None
+        removals.append({
+            **removal,
+            "broker_slug": broker.slug if broker else "",
+            "broker_name": broker.name if broker else "",
+            "person_first_name": first_name,
+            "person_last_name": last_name,
+            "search_url_pattern": entry.search_url_pattern if entry else "",
+        })
+
+    # Breaker state and latencies persist in the database across runs
+    verifier = RemovalVerifier(health=BrokerHealth(db))
+    results = run_async(_verify_all(verifier, removals))
+
+    counts: dict[str, int] = {}
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    for result in results:
+        status = result["status"]
+        counts[status] = counts.get(status, 0) + 1
+        updates = {"last_checked_at": now}
+        if status == "confirmed":
+            updates.update(status="confirmed", confirmed_at=now)
+        elif status == "failed":
+            updates.update(status="failed", attempts=result["attempts"])
+        elif status in ("still_found", "error"):
+            updates["attempts"] = result["attempts"]
+        db.update_removal(result["removal_id"], **updates)
 
     return JobResult(
         job_name="verify_removals",
         started_at=started,
         completed_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         status="success",
-        details={"pending_count": len(pending), "verified": verified},
+        details={"pending_count": len(pending), "verified": len(results), "outcomes": counts},
     )
 
 
+def _stored_breach_results(db: Database, person_id: int) -> dict:
+    """Report input from the breaches table; unreported rows are flagged new."""
+    hibp, dehashed = [], []
+    for b in db.get_breaches(person_id):
+        new = b["reported_at"] is None
+        if b["source"] == "dehashed":
+            dehashed.append({"database_name": b["breach_name"], "severity": b["severity"], "new": new})
+        else:
+            hibp.append({
+                "name": b["breach_name"], "breach_date": b["breach_date"],
+                "data_classes": b["data_types"], "severity": b["severity"], "new": new,
+            })
+    return {"hibp_breaches": hibp, "dehashed_records": dehashed, "total": len(hibp) + len(dehashed)}
+
+
 def job_generate_report(db: Database, config: Config) -> JobResult:
     """Generate exposure reports for all persons."""
     started = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -207,10 +267,11 @@ def job_generate_report(db: Database, config: Config) -> JobResult:
         report = generate_exposure_report(
             person_name=person.name,
             broker_results=[],
-            breach_results={"hibp_breaches": [], "dehashed_records": [], "total": 0},
+            breach_results=_stored_breach_results(db, person.id),
             username_results=[],
             dork_results=[],
         )
+        db.mark_breaches_reported(person.id)
         date_str = datetime.now().strftime("%Y-%m-%d")
         report_path = reports_dir / f"{date_str}-{person.name.lower().replace(' ', '-')}.md"
         report_path.write_text(report)
@@ -223,3 +284,25 @@ def job_generate_report(db: Database, config: Config) -> JobResult:
         status="success",
         details={"persons_reported": len(persons)},
     )
+
+
+def job_refresh_breach_catalogue(db: Database, config: Config) -> JobResult:
+    """Refresh the local HIBP breach catalogue (conditional request)."""
+    started = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if not config.hibp_api_key:
+        # Only keyed account lookups are joined against the catalogue
+        return JobResult(
+            job_name="refresh_breach_catalogue",
+            started_at=started,
+            completed_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            status="skipped",
+            details={"reason": "no HIBP API key"},
+        )
+    details = run_async(BreachCatalogue(db).refresh(force=True))
+    return JobResult(
+        job_name="refresh_breach_catalogue",
+        started_at=started,
+        completed_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        status="success",
+        details=details,
+    )
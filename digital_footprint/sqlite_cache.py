@@ -0,0 +1,121 @@
+"""Compressed, size-bounded LRU store with per-entry TTLs in a SQLite file."""
+
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from typing import Optional
+
+
+class SqliteCache:
+    """Base for the on-disk caches (page text, HTTP responses).
+
+    Each entry lives in one row of ``table`` keyed by ``key``, with its
+    zlib-compressed body, an expiry time and a last-read time. Expired
+    entries are dropped when read or on the next write; when the stored
+    (compressed) size exceeds ``max_bytes`` the least recently read
+    entries are evicted. ``extra_columns`` are column definitions stored
+    alongside each entry and ``extra_schema`` is run after the table is
+    created, for subclasses that keep other tables in the same file.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        table: str,
+        max_bytes: int,
+        extra_columns: tuple[str, ...] = (),
+        extra_schema: str = "",
+    ):
+        self.path = Path(path)
+        self.table = table
+        self.max_bytes = max_bytes
+        self.extra_names = tuple(column.split()[0] for column in extra_columns)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if str(self.path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        extras = "".join(f"    {column},\n" for column in extra_columns)
+        self.conn.executescript(f"""
+CREATE TABLE IF NOT EXISTS {table} (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+{extras}    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_{table}_last_access ON {table}(last_access);
+""" + extra_schema)
+        self.conn.commit()
+
+    def get_entry(self, key: str) -> Optional[tuple[bytes, dict]]:
+        """``(body, extra columns)`` for a live entry, counting the hit or miss."""
+        now = time.time()
+        columns = ", ".join(("body", "expires_at") + self.extra_names)
+        row = self.conn.execute(f"SELECT {columns} FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        if row is None or row[1] <= now:
+            if row is not None:
+                self.delete(key)
+            self.misses += 1
+            return None
+        self.conn.execute(f"UPDATE {self.table} SET last_access = ? WHERE key = ?", (now, key))
+        self.conn.commit()
+        self.hits += 1
+        return zlib.decompress(row[0]), dict(zip(self.extra_names, row[2:]))
+
+    def put_entry(self, key: str, url: str, body: bytes, ttl_seconds: float, **extra) -> None:
+        compressed = zlib.compress(body, 6)
+        now = time.time()
+        columns = ("key", "url") + self.extra_names + ("body", "size", "stored_at", "expires_at", "last_access")
+        values = (key, url, *(extra[name] for name in self.extra_names),
+                  compressed, len(compressed), now, now + ttl_seconds, now)
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO {self.table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            values,
+        )
+        self._evict()
+        self.conn.commit()
+
+    def delete(self, key: str) -> None:
+        self.conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+        self.conn.commit()
+
+    def _evict(self) -> None:
+        self.conn.execute(f"DELETE FROM {self.table} WHERE expires_at <= ?", (time.time(),))
+        total = self.conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.table}").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self.conn.execute(f"SELECT key, size FROM {self.table} ORDER BY last_access").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self.conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            total -= size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self.conn.execute(f"DELETE FROM {self.table}")
+        self.conn.commit()
+
+    def stats(self) -> dict:
+        entries, size = self.conn.execute(
+            f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.table}"
+        ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": entries,
+            "stored_bytes": size,
+            "max_bytes": self.max_bytes,
+        }
+
+    def close(self) -> None:
+        self.conn.close()
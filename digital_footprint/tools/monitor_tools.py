@@ -1,28 +1,23 @@
 """MCP monitoring tool helpers."""
 
-import asyncio
 import json
 from typing import Optional
 
 from digital_footprint.db import Database
+from digital_footprint.http_client import run_async
 from digital_footprint.monitors.dark_web_monitor import run_dark_web_scan, format_dark_web_report
 
 
-def do_dark_web_monitor_sync(email: str, hibp_api_key: Optional[str] = None) -> str:
+def do_dark_web_monitor_sync(
+    email: str,
+    hibp_api_key: Optional[str] = None,
+    hibp_rpm: Optional[float] = None,
+) -> str:
     """Run dark web monitoring (sync wrapper for MCP tool)."""
     if not email:
         return json.dumps({"status": "error", "message": "Provide an email address."})
 
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                results = pool.submit(asyncio.run, run_dark_web_scan(email, hibp_api_key=hibp_api_key)).result()
-        else:
-            results = loop.run_until_complete(run_dark_web_scan(email, hibp_api_key=hibp_api_key))
-    except RuntimeError:
-        results = asyncio.run(run_dark_web_scan(email, hibp_api_key=hibp_api_key))
+    results = run_async(run_dark_web_scan(email, hibp_api_key=hibp_api_key, hibp_rpm=hibp_rpm))
 
     return format_dark_web_report(results)
 
@@ -14,6 +14,7 @@ def do_protect(person_id: int, db: Database, config: Config) -> str:
         "person_id": result.person_id,
         "status": result.status,
         "breaches_found": result.breaches_found,
+        "new_breaches": result.new_breaches,
         "dark_web_findings": result.dark_web_findings,
         "accounts_found": result.accounts_found,
         "removals_submitted": result.removals_submitted,
@@ -5,6 +5,9 @@ from typing import Optional
 
 from digital_footprint.db import Database
 from digital_footprint.scanners.breach_scanner import scan_breaches
+from digital_footprint.scanners.dork_planner import person_dork_queries, plan_dork_queries, run_planned_dorks
+from digital_footprint.scanners.google_dorker import SEARXNG_RPM, SearxngBackend, build_dork_queries
+from digital_footprint.scanners.hibp_scheduler import PRIORITY_HIGH
 from digital_footprint.reporters.exposure_report import generate_exposure_report
 
 
@@ -12,6 +15,7 @@ async def do_breach_check(
     email: str,
     hibp_api_key: Optional[str] = None,
     dehashed_api_key: Optional[str] = None,
+    hibp_rpm: Optional[float] = None,
 ) -> str:
     """Run breach check and return JSON results."""
     if not hibp_api_key and not dehashed_api_key:
@@ -24,6 +28,8 @@ async def do_breach_check(
         email=email,
         hibp_api_key=hibp_api_key,
         dehashed_api_key=dehashed_api_key,
+        hibp_rpm=hibp_rpm,
+        priority=PRIORITY_HIGH,
     )
 
     # Serialize dataclass objects
@@ -50,10 +56,64 @@ async def do_breach_check(
             for r in results["dehashed_records"]
         ],
     }
+    if results.get("errors"):
+        output["errors"] = results["errors"]
 
     return json.dumps(output, indent=2)
 
 
+async def do_google_dork(
+    name: str = "",
+    email: Optional[str] = None,
+    phone: Optional[str] = None,
+    person_id: Optional[int] = None,
+    db: Optional[Database] = None,
+    searxng_url: str = "",
+    searxng_rpm: float = SEARXNG_RPM,
+) -> str:
+    """Plan dork queries and, with a SearXNG endpoint configured, run them.
+
+    With ``person_id`` the queries cover every email, phone and address on
+    record. Redundant queries are pruned and the rest merged into as few
+    requests as possible; with ``db`` set, queries fetched recently are
+    answered from their stored results instead of being sent again.
+    """
+    if person_id is not None and db is not None:
+        person = db.get_person(person_id)
+        if not person:
+            return f"Person with id {person_id} not found."
+        name = person.name
+        queries = person_dork_queries(person)
+    else:
+        queries = build_dork_queries(name=name, email=email, phone=phone)
+
+    if not searxng_url:
+        plan = plan_dork_queries(queries, name=name)
+        return json.dumps({
+            "name": name,
+            "queries": [p.query for p in plan.queries],
+            "count": len(plan.queries),
+            "plan": plan.to_dict(),
+            "message": "Set SEARXNG_URL in .env to run these queries automatically.",
+        }, indent=2)
+
+    backend = SearxngBackend(searxng_url, rpm=searxng_rpm)
+    outcome = await run_planned_dorks(queries, backend, db=db, name=name)
+    return json.dumps({
+        "name": name,
+        "queries": [p["query"] for p in outcome["plan"]["requests"]],
+        "plan": outcome["plan"],
+        "results": [
+            {"url": r.url, "title": r.title, "snippet": r.snippet, "query": r.query, "risk": r.risk_level}
+            for r in outcome["results"]
+        ],
+        "count": len(outcome["results"]),
+        "cached": outcome["cached"],
+        "high_risk": outcome["high_risk"],
+        "errors": outcome["errors"],
+    }, indent=2)
+
+
 def do_exposure_report(
     person_id: int,
     db: Database,
@@ -23,6 +23,7 @@ def register_status_tools(mcp, db: Database):
             f"  Active:           {s['findings']['active']}",
             f"  Removal pending:  {s['findings']['removal_pending']}",
             f"  Removed:          {s['findings']['removed']}",
+            f"  Disappeared:      {s['findings']['disappeared']}",
             "",
             "Removals:",
             f"  Pending:          {s['removals']['pending']}",
@@ -0,0 +1,50 @@
+"""MCP username scan job tool helpers."""
+
+import json
+from typing import Optional
+
+from digital_footprint.db import Database
+from digital_footprint.scanners.username_pool import enqueue_usernames
+
+
+def _job_summary(job: dict) -> dict:
+    return {
+        "id": job["id"],
+        "username": job["username"],
+        "person_id": job["person_id"],
+        "tier": job["tier"],
+        "status": job["status"],
+        "sites_found": len(job["results"]),
+        "cancel_requested": job["cancel_requested"],
+        "created_at": job["created_at"],
+        "completed_at": job["completed_at"],
+        "error": job["error"],
+    }
+
+
+def do_username_queue(
+    db: Database,
+    usernames: Optional[list[str]] = None,
+    person_id: Optional[int] = None,
+) -> str:
+    """Queue username scans and return the job ids as JSON."""
+    job_ids = enqueue_usernames(db, usernames=usernames, person_id=person_id)
+    if not job_ids:
+        return json.dumps({"status": "error", "message": "No usernames to scan. Add usernames to a person first."})
+    return json.dumps({"queued": job_ids}, indent=2)
+
+
+def do_username_jobs(db: Database, job_id: Optional[int] = None, status: Optional[str] = None) -> str:
+    """List username jobs, or show one job with its results."""
+    if job_id is not None:
+        job = db.get_username_job(job_id)
+        if not job:
+            return json.dumps({"status": "error", "message": f"Job {job_id} not found."})
+        return json.dumps(dict(_job_summary(job), results=job["results"]), indent=2)
+    return json.dumps([_job_summary(j) for j in db.list_username_jobs(status=status)], indent=2)
+
+
+def do_username_cancel(db: Database, job_id: Optional[int] = None) -> str:
+    """Cancel one username job, or all pending ones."""
+    cancelled = db.cancel_username_jobs(job_id)
+    return json.dumps({"cancelled": cancelled})
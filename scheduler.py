@@ -19,6 +19,8 @@ from pathlib import Path
 
 from digital_footprint.config import get_config
 from digital_footprint.db import Database
+from digital_footprint.http_cache import open_response_cache
+from digital_footprint.http_client import configure_http_cache
 from digital_footprint.broker_registry import load_all_brokers
 from digital_footprint.scheduler import runner
 
@@ -49,6 +51,7 @@ def main() -> int:
     config = get_config()
     db = Database(config)
     db.initialize()
+    configure_http_cache(open_response_cache(config))
 
     # Load brokers
     brokers = load_all_brokers(config.brokers_dir)
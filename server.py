@@ -4,13 +4,18 @@ Digital Footprint MCP Server
 Personal data removal and privacy protection.
 """
 
+import asyncio
 import json
+from contextlib import asynccontextmanager
+from typing import Optional
 
 from fastmcp import FastMCP
 
 from digital_footprint.config import get_config
 from digital_footprint.db import Database
 from digital_footprint.broker_registry import load_all_brokers
+from digital_footprint.http_cache import open_response_cache
+from digital_footprint.http_client import aclose_http_client, configure_http_cache
 from digital_footprint.tools.person_tools import register_person_tools
 from digital_footprint.tools.broker_tools import register_broker_tools
 from digital_footprint.tools.status_tools import register_status_tools
@@ -19,14 +24,32 @@ from digital_footprint.tools.status_tools import register_status_tools
 config = get_config()
 db = Database(config)
 db.initialize()
+configure_http_cache(open_response_cache(config))
 
 # Load broker registry into database
 brokers = load_all_brokers(config.brokers_dir)
 for broker in brokers:
     db.insert_broker(broker)
 
+# Background worker pool started by footprint_username_queue
+_username_pool: Optional[asyncio.Task] = None
+
+
+@asynccontextmanager
+async def _lifespan(server):
+    try:
+        yield {}
+    finally:
+        if _username_pool is not None and not _username_pool.done():
+            _username_pool.cancel()
+            await asyncio.gather(_username_pool, return_exceptions=True)
+            db.requeue_running_username_jobs()
+        # Async tools share the server loop's pooled HTTP client
+        await aclose_http_client()
+
+
 # Create MCP server
-mcp = FastMCP("digital-footprint")
+mcp = FastMCP("digital-footprint", lifespan=_lifespan)
 
 # Register implemented tools
 register_person_tools(mcp, db)
@@ -36,7 +59,7 @@ register_status_tools(mcp, db)
 
 # --- Phase 2: Discovery tools ---
 
-from digital_footprint.tools.scan_tools import do_breach_check, do_exposure_report
+from digital_footprint.tools.scan_tools import do_breach_check, do_exposure_report, do_google_dork
 
 @mcp.tool()
 async def footprint_scan(person_id: int = None, email: str = None) -> str:
@@ -56,6 +79,7 @@ async def footprint_scan(person_id: int = None, email: str = None) -> str:
             email=email,
             hibp_api_key=config.hibp_api_key,
             dehashed_api_key=config.dehashed_api_key,
+            hibp_rpm=config.hibp_rpm,
         )
         results["breach_check"] = breach_result
 
@@ -70,18 +94,21 @@ async def footprint_breach_check(email: str = None, username: str = None) -> str
         email=email,
         hibp_api_key=config.hibp_api_key,
         dehashed_api_key=config.dehashed_api_key,
+        hibp_rpm=config.hibp_rpm,
     )
 
 @mcp.tool()
 async def footprint_username_search(username: str) -> str:
-    """Search for a username across 3,000+ sites using Maigret."""
+    """Search for a username on Maigret's fast tier (top-ranked and high-risk sites).
+
+    Only sites not checked within the last week are re-checked; the result
+    lists new and gone accounts since the previous scan. Use
+    `dfp usernames rescan` for all 3,000+ sites.
+    """
     import json as _json
-    from digital_footprint.scanners.username_scanner import search_username
-    results = await search_username(username)
-    return _json.dumps([
-        {"site": r.site_name, "url": r.url, "risk": r.risk_level}
-        for r in results
-    ], indent=2)
+    from digital_footprint.scanners.username_rescan import rescan_username
+    diff = await rescan_username(db, username, tier="fast")
+    return _json.dumps(diff.to_dict(), indent=2)
 
 @mcp.tool()
 def footprint_exposure_report(person_id: int = 1) -> str:
@@ -89,12 +116,23 @@ def footprint_exposure_report(person_id: int = 1) -> str:
     return do_exposure_report(person_id=person_id, db=db)
 
 @mcp.tool()
-def footprint_google_dork(name: str, additional_terms: str = None) -> str:
-    """Build Google dork queries to find exposed personal data. Returns queries to run manually."""
-    import json as _json
-    from digital_footprint.scanners.google_dorker import build_dork_queries
-    queries = build_dork_queries(name=name, email=additional_terms)
-    return _json.dumps({"name": name, "queries": queries, "count": len(queries)}, indent=2)
+async def footprint_google_dork(name: str = "", additional_terms: str = None, person_id: int = None) -> str:
+    """Find exposed personal data with Google-style dork queries.
+
+    Pass person_id to cover all of a person's emails, phones and addresses.
+    Overlapping queries are pruned and merged, and queries fetched in the
+    last week return their stored results instead of being re-sent. Runs
+    through SearXNG when SEARXNG_URL is set;
+    otherwise returns the planned queries to run manually.
+    """
+    return await do_google_dork(
+        name=name,
+        email=additional_terms,
+        person_id=person_id,
+        db=db,
+        searxng_url=config.searxng_url,
+        searxng_rpm=config.searxng_rpm,
+    )
 
 @mcp.tool()
 def footprint_broker_check(broker_slug: str, person_id: int = 1) -> str:
@@ -139,7 +177,7 @@ def footprint_dark_web_monitor(email: str = None) -> str:
     """Monitor dark web sources for exposed personal data (paste sites, Ahmia.fi, holehe)."""
     if not email:
         return "Provide an email address to monitor."
-    return do_dark_web_monitor_sync(email=email, hibp_api_key=config.hibp_api_key)
+    return do_dark_web_monitor_sync(email=email, hibp_api_key=config.hibp_api_key, hibp_rpm=config.hibp_rpm)
 
 @mcp.tool()
 def footprint_social_audit(person_id: int = 1) -> str:
@@ -147,6 +185,29 @@ def footprint_social_audit(person_id: int = 1) -> str:
     return do_social_audit(person_id=person_id, db=db)
 
 
+from digital_footprint.scanners.username_pool import UsernameScanPool
+from digital_footprint.tools.username_tools import do_username_cancel, do_username_jobs, do_username_queue
+
+@mcp.tool()
+async def footprint_username_queue(usernames: list[str] = None, person_id: int = None) -> str:
+    """Queue Maigret username scans (default: every person's usernames) and run them in the background."""
+    global _username_pool
+    result = do_username_queue(db, usernames=usernames, person_id=person_id)
+    if _username_pool is None or _username_pool.done():
+        _username_pool = asyncio.create_task(UsernameScanPool(db).run())
+    return result
+
+@mcp.tool()
+def footprint_username_jobs(job_id: int = None, status: str = None) -> str:
+    """List queued/running/finished username scan jobs, or show one job's results."""
+    return do_username_jobs(db, job_id=job_id, status=status)
+
+@mcp.tool()
+def footprint_username_cancel(job_id: int = None) -> str:
+    """Cancel a username scan job (or all pending jobs); running scans are killed and keep partial results."""
+    return do_username_cancel(db, job_id=job_id)
+
+
 # --- Phase 5: Scheduling tools ---
 
 from digital_footprint.tools.schedule_tools import do_schedule_status
@@ -24,3 +24,26 @@ def make_test_db() -> Database:
     db = Database(config)
     db.initialize()
     return db
+
+
+@pytest.fixture(autouse=True)
+def _reset_hibp_schedulers():
+    """Keep HIBP rate-limit state from leaking between tests."""
+    from digital_footprint.scanners import hibp_scheduler
+    hibp_scheduler._schedulers.clear()
+    yield
+    hibp_scheduler._schedulers.clear()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_home(tmp_path, monkeypatch):
+    """Point default Config paths at a temp dir so tests never touch ~/.digital-footprint."""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+
+
+@pytest.fixture(autouse=True)
+def _reset_http_cache():
+    """Detach any response cache a test (or CLI invocation) attached."""
+    yield
+    from digital_footprint.http_client import configure_http_cache
+    configure_http_cache(None)
@@ -7,9 +7,12 @@ import pytest
 from digital_footprint.scanners.breach_scanner import (
     check_hibp,
     check_dehashed,
+    iter_dehashed,
     scan_breaches,
+    scan_breaches_many,
     HibpBreach,
     DehashedRecord,
+    DehashedSummary,
 )
 
 
@@ -58,12 +61,12 @@ async def test_check_hibp_found(hibp_response):
     mock_response.status_code = 200
     mock_response.json.return_value = hibp_response
 
-    with patch("digital_footprint.scanners.breach_scanner.httpx.AsyncClient") as mock_client_cls:
+    with patch("digital_footprint.scanners.breach_scanner.get_http_client") as mock_get_client:
         mock_client = AsyncMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
+        mock_client.cached_response = MagicMock(return_value=None)
+        mock_client.store_response = MagicMock()
         mock_client.get.return_value = mock_response
-        mock_client_cls.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         results = await check_hibp("test@example.com", api_key="test-key")
 
@@ -79,12 +82,12 @@ async def test_check_hibp_not_found():
     mock_response = AsyncMock()
     mock_response.status_code = 404
 
-    with patch("digital_footprint.scanners.breach_scanner.httpx.AsyncClient") as mock_client_cls:
+    with patch("digital_footprint.scanners.breach_scanner.get_http_client") as mock_get_client:
         mock_client = AsyncMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
+        mock_client.cached_response = MagicMock(return_value=None)
+        mock_client.store_response = MagicMock()
         mock_client.get.return_value = mock_response
-        mock_client_cls.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         results = await check_hibp("clean@example.com", api_key="test-key")
 
@@ -103,12 +106,10 @@ async def test_check_dehashed_found(dehashed_response):
     mock_response.status_code = 200
     mock_response.json.return_value = dehashed_response
 
-    with patch("digital_footprint.scanners.breach_scanner.httpx.AsyncClient") as mock_client_cls:
+    with patch("digital_footprint.scanners.breach_scanner.get_http_client") as mock_get_client:
         mock_client = AsyncMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
         mock_client.get.return_value = mock_response
-        mock_client_cls.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         results = await check_dehashed("test@example.com", api_key="test-key")
 
@@ -134,12 +135,12 @@ async def test_scan_breaches_combines_sources(hibp_response, dehashed_response):
     mock_dh_resp.status_code = 200
     mock_dh_resp.json.return_value = dehashed_response
 
-    with patch("digital_footprint.scanners.breach_scanner.httpx.AsyncClient") as mock_client_cls:
+    with patch("digital_footprint.scanners.breach_scanner.get_http_client") as mock_get_client:
         mock_client = AsyncMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
+        mock_client.cached_response = MagicMock(return_value=None)
+        mock_client.store_response = MagicMock()
         mock_client.get.side_effect = [mock_hibp_resp, mock_dh_resp]
-        mock_client_cls.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         results = await scan_breaches(
             "test@example.com",
@@ -150,3 +151,195 @@ async def test_scan_breaches_combines_sources(hibp_response, dehashed_response):
     assert results["hibp_count"] == 2
     assert results["dehashed_count"] == 1
     assert results["total"] == 3
+
+
+@pytest.mark.asyncio
+async def test_scan_breaches_reports_provider_errors():
+    async def bad_hibp(email, api_key=None, rpm=None, priority=None, catalogue=None):
+        raise RuntimeError("401 Unauthorized")
+
+    async def fake_dehashed(email, api_key=None):
+        return [DehashedRecord(email=email, database_name="SomeDB")]
+
+    with patch("digital_footprint.scanners.breach_scanner.check_hibp", side_effect=bad_hibp), \
+         patch("digital_footprint.scanners.breach_scanner.check_dehashed", side_effect=fake_dehashed):
+        results = await scan_breaches("test@example.com", hibp_api_key="bad", dehashed_api_key="k")
+
+    assert results["errors"] == {"hibp": "401 Unauthorized"}
+    assert results["hibp_count"] == 0
+    assert results["dehashed_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_scan_breaches_many_separates_provider_errors(hibp_response):
+    async def fake_hibp(email, api_key=None, rpm=None, priority=None, catalogue=None):
+        if email == "bad@example.com":
+            raise RuntimeError("HIBP rate limit still exceeded")
+        return [HibpBreach(name="LinkedIn", title="LinkedIn", domain="", breach_date="2012-05-05")]
+
+    async def fake_dehashed(email, api_key=None, max_pages=None):
+        return [DehashedRecord(email=email, database_name="SomeDB")]
+
+    with patch("digital_footprint.scanners.breach_scanner.check_hibp", side_effect=fake_hibp), \
+         patch("digital_footprint.scanners.breach_scanner.check_dehashed", side_effect=fake_dehashed):
+        batch = await scan_breaches_many(
+            ["a@example.com", "bad@example.com", "a@example.com"],
+            hibp_api_key="k",
+            dehashed_api_key="k",
+        )
+
+    assert [r["email"] for r in batch["results"]] == ["a@example.com", "bad@example.com"]
+    assert batch["results"][0]["total"] == 2
+    assert batch["results"][1]["hibp_count"] == 0
+    assert batch["results"][1]["dehashed_count"] == 1
+    assert batch["errors"] == {"hibp": {"bad@example.com": "HIBP rate limit still exceeded"}, "dehashed": {}}
+    assert batch["total"] == 3
+
+
+@pytest.mark.asyncio
+async def test_scan_breaches_many_runs_emails_concurrently():
+    import asyncio
+
+    in_flight = 0
+    peak = 0
+
+    async def slow_dehashed(email, api_key=None, max_pages=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return []
+
+    with patch("digital_footprint.scanners.breach_scanner.check_dehashed", side_effect=slow_dehashed):
+        await scan_breaches_many(
+            [f"user{i}@example.com" for i in range(6)],
+            dehashed_api_key="k",
+            dehashed_concurrency=3,
+        )
+
+    assert peak == 3
+
+
+def _dehashed_pages(total: int, page_size: int, report_total: bool = True):
+    """MockTransport-backed client serving ``total`` records ``page_size`` at a time."""
+    import httpx
+    from digital_footprint.http_client import HttpClientManager
+
+    requested = []
+
+    def handler(request):
+        page = int(request.url.params["page"])
+        requested.append(page)
+        start = (page - 1) * page_size
+        entries = [
+            {"email": "a@example.com", "database_name": f"DB{i % 3}", "password": "x" if i % 2 else None}
+            for i in range(start, min(total, start + page_size))
+        ]
+        body = {"total": total, "entries": entries} if report_total else {"entries": entries}
+        return httpx.Response(200, json=body)
+
+    return HttpClientManager(transport=httpx.MockTransport(handler)), requested
+
+
+@pytest.mark.asyncio
+async def test_iter_dehashed_walks_all_pages():
+    manager, requested = _dehashed_pages(total=25, page_size=10)
+    with patch("digital_footprint.scanners.breach_scanner.get_http_client", return_value=manager):
+        batches = [b async for b in iter_dehashed("a@example.com", api_key="k", page_size=10)]
+
+    assert [len(b) for b in batches] == [10, 10, 5]
+    assert requested == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_iter_dehashed_walks_pages_without_total():
+    manager, requested = _dehashed_pages(total=25, page_size=10, report_total=False)
+    with patch("digital_footprint.scanners.breach_scanner.get_http_client", return_value=manager):
+        batches = [b async for b in iter_dehashed("a@example.com", api_key="k", page_size=10)]
+
+    assert [len(b) for b in batches] == [10, 10, 5]
+    assert requested == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_iter_dehashed_max_pages():
+    manager, requested = _dehashed_pages(total=100, page_size=10)
+    with patch("digital_footprint.scanners.breach_scanner.get_http_client", return_value=manager):
+        batches = [b async for b in iter_dehashed("a@example.com", api_key="k", page_size=10, max_pages=2)]
+
+    assert sum(len(b) for b in batches) == 20
+    assert requested == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_iter_dehashed_applies_backpressure():
+    import asyncio
+
+    manager, requested = _dehashed_pages(total=100, page_size=10)
+    with patch("digital_footprint.scanners.breach_scanner.get_http_client", return_value=manager):
+        pages = iter_dehashed("a@example.com", api_key="k", page_size=10, prefetch=1)
+        await pages.__anext__()
+        await asyncio.sleep(0.01)
+        # One page consumed, one buffered, one waiting to be queued
+        assert len(requested) <= 3
+        await pages.aclose()
+
+    assert len(requested) < 10
+
+
+@pytest.mark.asyncio
+async def test_scan_breaches_many_reports_dehashed_http_errors():
+    import httpx
+    from digital_footprint.http_client import HttpClientManager
+
+    statuses = {"denied@example.com": 401, "down@example.com": 500}
+
+    def handler(request):
+        email = request.url.params["query"].removeprefix("email:")
+        if email in statuses:
+            return httpx.Response(statuses[email])
+        return httpx.Response(200, json={"total": 1, "entries": [{"email": email, "database_name": "DB"}]})
+
+    manager = HttpClientManager(transport=httpx.MockTransport(handler))
+    with patch("digital_footprint.scanners.breach_scanner.get_http_client", return_value=manager):
+        batch = await scan_breaches_many(
+            ["ok@example.com", "denied@example.com", "down@example.com"], dehashed_api_key="k"
+        )
+    await manager.aclose()
+
+    errors = batch["errors"]["dehashed"]
+    assert set(errors) == {"denied@example.com", "down@example.com"}
+    assert "401" in errors["denied@example.com"]
+    assert "500" in errors["down@example.com"]
+    assert batch["results"][0]["dehashed_count"] == 1
+
+
+def test_dehashed_summary_counts_and_worst_severity():
+    summary = DehashedSummary()
+    summary.add([
+        DehashedRecord(database_name="A"),
+        DehashedRecord(database_name="A", password="p"),
+        DehashedRecord(database_name="B", hashed_password="h"),
+    ])
+    other = DehashedSummary()
+    other.add([DehashedRecord(database_name="B", password="p")])
+    summary.merge(other)
+
+    assert summary.total == 4
+    assert summary.severities == {"medium": 1, "critical": 2, "high": 1}
+    assert summary.databases["A"] == {"count": 2, "severity": "critical"}
+    assert summary.databases["B"] == {"count": 2, "severity": "critical"}
+
+
+@pytest.mark.asyncio
+async def test_scan_breaches_many_can_summarize_without_records():
+    manager, _ = _dehashed_pages(total=30, page_size=1000)
+    with patch("digital_footprint.scanners.breach_scanner.get_http_client", return_value=manager):
+        batch = await scan_breaches_many(["a@example.com"], dehashed_api_key="k", keep_dehashed_records=False)
+
+    result = batch["results"][0]
+    assert result["dehashed_records"] == []
+    assert result["dehashed_count"] == 30
+    assert result["dehashed_summary"].severities == {"medium": 15, "critical": 15}
+    assert batch["total"] == 30
@@ -0,0 +1,128 @@
+"""Tests for persisting and diffing breach results."""
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from digital_footprint.config import Config
+from digital_footprint.db import Database
+from digital_footprint.scanners.breach_scanner import (
+    DehashedRecord,
+    HibpBreach,
+    _summarize,
+    breach_rows,
+    save_breach_results,
+)
+from digital_footprint.scheduler.jobs import job_breach_recheck, job_generate_report
+from tests.conftest import make_test_db
+
+LINKEDIN = {"source": "hibp", "breach_name": "LinkedIn", "breach_date": "2012-05-05",
+            "data_types": ["Passwords"], "severity": "critical"}
+ADOBE = {"source": "hibp", "breach_name": "Adobe", "severity": "high"}
+
+
+def test_upsert_breaches_returns_only_new(tmp_db):
+    person_id = tmp_db.insert_person(name="John Doe")
+    first = tmp_db.upsert_breaches(person_id, [LINKEDIN])
+    second = tmp_db.upsert_breaches(person_id, [LINKEDIN, ADOBE, ADOBE])
+
+    assert first == {"new": [LINKEDIN], "known": 0}
+    assert second == {"new": [ADOBE], "known": 1}
+    stored = tmp_db.get_breaches(person_id)
+    assert [b["breach_name"] for b in stored] == ["LinkedIn", "Adobe"]
+    assert stored[0]["data_types"] == ["Passwords"]
+
+
+def test_same_breach_is_new_per_person_and_source(tmp_db):
+    john = tmp_db.insert_person(name="John Doe")
+    jane = tmp_db.insert_person(name="Jane Doe")
+    tmp_db.upsert_breaches(john, [LINKEDIN])
+
+    assert len(tmp_db.upsert_breaches(jane, [LINKEDIN])["new"]) == 1
+    dehashed = dict(LINKEDIN, source="dehashed")
+    assert len(tmp_db.upsert_breaches(john, [dehashed])["new"]) == 1
+
+
+def test_mark_breaches_reported(tmp_db):
+    person_id = tmp_db.insert_person(name="John Doe")
+    tmp_db.upsert_breaches(person_id, [LINKEDIN])
+    assert tmp_db.mark_breaches_reported(person_id) == 1
+    tmp_db.upsert_breaches(person_id, [LINKEDIN, ADOBE])
+
+    unreported = tmp_db.get_breaches(person_id, unreported_only=True)
+    assert [b["breach_name"] for b in unreported] == ["Adobe"]
+
+
+def test_initialize_dedupes_breaches_before_unique_index(tmp_path):
+    db_path = tmp_path / "old.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.execute(
+        """CREATE TABLE breaches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, person_id INTEGER NOT NULL,
+            breach_name TEXT NOT NULL, breach_date TEXT, data_types TEXT DEFAULT '[]',
+            source TEXT NOT NULL, severity TEXT DEFAULT 'medium',
+            discovered_at TEXT DEFAULT (datetime('now')), action_taken TEXT)"""
+    )
+    for _ in range(2):
+        conn.execute("INSERT INTO breaches (person_id, breach_name, source) VALUES (1, 'LinkedIn', 'hibp')")
+    conn.commit()
+    conn.close()
+
+    db = Database(Config(db_path=db_path, brokers_dir=Path(__file__).parent.parent / "digital_footprint" / "brokers"))
+    db.initialize()
+    assert db.conn.execute("SELECT COUNT(*) FROM breaches").fetchone()[0] == 1
+    columns = {row[1] for row in db.conn.execute("PRAGMA table_info(breaches)")}
+    assert {"last_seen_at", "reported_at"} <= columns
+    db.close()
+
+
+def test_breach_rows_collapse_dehashed_by_database():
+    result = _summarize(
+        "a@example.com",
+        [HibpBreach(name="LinkedIn", title="LinkedIn", domain="", breach_date="2012-05-05",
+                    data_classes=["Passwords"])],
+        [DehashedRecord(database_name="Collection1"), DehashedRecord(database_name="Collection1", password="x")],
+    )
+    rows = breach_rows(result)
+    assert rows[0]["severity"] == "critical"
+    assert rows[1] == {"source": "dehashed", "breach_name": "Collection1", "severity": "critical"}
+
+
+def _batch(*names):
+    return {"results": [{
+        "email": "test@example.com",
+        "hibp_breaches": [{"name": n, "severity": "high"} for n in names],
+        "hibp_count": len(names), "dehashed_records": [], "dehashed_count": 0, "total": len(names),
+    }], "errors": {"hibp": {}, "dehashed": {}}}
+
+
+def test_breach_recheck_alerts_on_diff_only():
+    db = make_test_db()
+    person_id = db.insert_person(name="Test User", emails=["test@example.com"])
+    config = Config()
+
+    with patch("digital_footprint.scheduler.jobs.scan_breaches_many", new_callable=AsyncMock) as mock_scan, \
+         patch("digital_footprint.scheduler.jobs.check_and_alert") as mock_alert:
+        mock_scan.return_value = _batch("Breach1", "Breach2")
+        first = job_breach_recheck(db, config)
+        mock_scan.return_value = _batch("Breach1", "Breach2", "Breach3")
+        second = job_breach_recheck(db, config)
+        third = job_breach_recheck(db, config)
+
+    assert [first.details["new_breaches"], second.details["new_breaches"], third.details["new_breaches"]] == [2, 1, 0]
+    calls = [(c.kwargs["new_count"], c.kwargs["previous_count"]) for c in mock_alert.call_args_list]
+    assert calls == [(2, 0), (3, 2), (3, 3)]
+    assert len(db.get_breaches(person_id)) == 3
+
+
+def test_generate_report_uses_stored_breaches(tmp_path):
+    db = make_test_db()
+    person_id = db.insert_person(name="Test User", emails=["test@example.com"])
+    save_breach_results(db, person_id, _batch("LinkedIn")["results"][0])
+    config = Config()
+    config.db_path = tmp_path / "test.db"
+
+    job_generate_report(db, config)
+    report = next((tmp_path / "reports").glob("*.md")).read_text()
+    assert "**LinkedIn** (NEW)" in report
+    assert db.get_breaches(person_id, unreported_only=True) == []
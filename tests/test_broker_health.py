@@ -0,0 +1,112 @@
+"""Tests for adaptive broker timeouts and the circuit breaker."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from digital_footprint.config import Config
+from digital_footprint.db import Database
+from digital_footprint.scanners.broker_health import (
+    DEFAULT_TIMEOUT_MS,
+    MIN_TIMEOUT_MS,
+    BrokerHealth,
+)
+from digital_footprint.scanners.broker_scanner import PageFetch, scan_broker
+from digital_footprint.removers.verification import RemovalVerifier
+
+
+@pytest.fixture
+def health(tmp_db):
+    return BrokerHealth(tmp_db, failure_threshold=2, cooldown_seconds=3600)
+
+
+def test_timeout_defaults_until_enough_samples(health):
+    health.record_success("spokeo", 1000)
+    assert health.timeout_for("spokeo") == DEFAULT_TIMEOUT_MS
+
+
+def test_timeout_tracks_p95(health):
+    for ms in [1000] * 19 + [4000]:
+        health.record_success("spokeo", ms)
+    assert health.p95("spokeo") == 1000
+    assert health.timeout_for("spokeo") == MIN_TIMEOUT_MS
+
+    for ms in [9000] * 5:
+        health.record_success("slow", ms)
+    assert health.timeout_for("slow") == 18000
+
+
+def test_breaker_opens_after_consecutive_failures(health):
+    assert health.record_failure("spokeo", "timeout") is False
+    assert health.is_open("spokeo") is False
+    assert health.record_failure("spokeo", "block page") is True
+    assert health.is_open("spokeo") is True
+    status = health.status()[0]
+    assert status["open"] is True
+    assert status["last_error"] == "block page"
+
+
+def test_success_resets_failures(health):
+    health.record_failure("spokeo", "timeout")
+    health.record_success("spokeo", 500)
+    assert health.record_failure("spokeo", "timeout") is False
+
+
+def test_breaker_state_persists_across_instances(tmp_path):
+    config = Config(db_path=tmp_path / "test.db")
+    first = Database(config)
+    first.initialize()
+    BrokerHealth(first, failure_threshold=1).record_failure("spokeo", "timeout")
+    first.close()
+
+    second = Database(config)
+    second.initialize()
+    assert BrokerHealth(second, failure_threshold=1).is_open("spokeo") is True
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_scan_broker_feeds_breaker_and_skips(health):
+    args = ("spokeo", "Spokeo", "https://spokeo.com/{first}-{last}", "John", "Doe")
+    with patch("digital_footprint.scanners.broker_scanner._fetch_page_text", new_callable=AsyncMock) as mock_fetch, \
+         patch("digital_footprint.scanners.playwright_scanner.random_delay", new_callable=AsyncMock):
+        mock_fetch.side_effect = TimeoutError("Timeout 30000ms exceeded")
+        first = await scan_broker(*args, health=health)
+        mock_fetch.side_effect = None
+        mock_fetch.return_value = PageFetch("Please complete the CAPTCHA to continue", "browser")
+        second = await scan_broker(*args, health=health)
+        third = await scan_broker(*args, health=health)
+
+    assert first.outcome == "error"
+    assert second.error == "Blocked by bot protection"
+    assert third.outcome == "skipped"
+    assert mock_fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_scan_broker_uses_adaptive_timeout(health):
+    for _ in range(5):
+        health.record_success("spokeo", 3000)
+    with patch("digital_footprint.scanners.broker_scanner._fetch_page_text", new_callable=AsyncMock) as mock_fetch, \
+         patch("digital_footprint.scanners.playwright_scanner.random_delay", new_callable=AsyncMock):
+        mock_fetch.return_value = PageFetch("John Doe, Austin TX", "browser")
+        result = await scan_broker("spokeo", "Spokeo", "https://spokeo.com/{first}-{last}", "John", "Doe", health=health)
+
+    assert result.found is True
+    assert mock_fetch.call_args.args[2] == 6000
+
+
+@pytest.mark.asyncio
+async def test_verifier_does_not_confirm_skipped_broker(health):
+    health.record_failure("spokeo", "timeout")
+    health.record_failure("spokeo", "timeout")
+    verifier = RemovalVerifier(health=health)
+    result = await verifier.verify_single({
+        "id": 1,
+        "broker_slug": "spokeo",
+        "broker_name": "Spokeo",
+        "person_first_name": "John",
+        "person_last_name": "Doe",
+        "search_url_pattern": "https://spokeo.com/{first}-{last}",
+        "attempts": 0,
+    })
+    assert result["status"] == "skipped"
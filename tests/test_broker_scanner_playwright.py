@@ -3,14 +3,18 @@
 from unittest.mock import AsyncMock, patch, MagicMock
 import pytest
 
+from digital_footprint.models import Person
 from digital_footprint.scanners.broker_scanner import (
     BrokerScanResult,
     build_search_url,
     check_name_in_results,
+    scan_brokers_for_persons,
+    split_name,
 )
 from digital_footprint.scanners.playwright_scanner import (
     create_stealth_browser,
 )
+from digital_footprint.scanners.throttle import HostThrottle
 
 
 def test_build_search_url_simple():
@@ -74,3 +78,46 @@ def test_broker_scan_result_properties():
         found=False,
     )
     assert not_found.risk_level == "low"
+
+
+def test_split_name():
+    assert split_name("John Doe") == ("John", "Doe")
+    assert split_name("Mary Ann Smith") == ("Mary", "Smith")
+    assert split_name("Cher") == ("Cher", "")
+
+
+@pytest.mark.asyncio
+async def test_scan_brokers_for_persons_groups_by_broker():
+    persons = [
+        Person(id=1, name="John Doe"),
+        Person(id=2, name="Jane Roe"),
+        Person(id=3, name="Max Moe"),
+    ]
+    brokers = [
+        {"slug": "spokeo", "name": "Spokeo", "search_url_pattern": "https://spokeo.com/{first}-{last}"},
+        {"slug": "radaris", "name": "Radaris", "search_url_pattern": "https://radaris.com/{first}/{last}"},
+        {"slug": "acxiom", "name": "Acxiom"},
+    ]
+
+    pool = MagicMock()
+    pool.acquire = AsyncMock(side_effect=lambda blocker=None: (MagicMock(), MagicMock()))
+    pool.release = AsyncMock()
+    pool.reuse.return_value = True
+
+    async def fake_load(context, url, timeout):
+        return "Listing for John Doe" if "John" in url else "No results"
+
+    with patch("digital_footprint.scanners.broker_scanner._load_page_text", side_effect=fake_load):
+        pairs = [
+            pair async for pair in scan_brokers_for_persons(
+                persons, brokers, pool=pool, throttle=HostThrottle(0, 0),
+            )
+        ]
+
+    assert len(pairs) == 6
+    assert all(isinstance(r, BrokerScanResult) for _, r in pairs)
+    found = {(pid, r.broker_slug) for pid, r in pairs if r.found}
+    assert found == {(1, "spokeo"), (1, "radaris")}
+    # One warmed context per broker, reused for every person
+    assert pool.acquire.await_count == 2
+    assert pool.release.await_count == 2
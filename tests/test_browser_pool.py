@@ -0,0 +1,131 @@
+"""Tests for the shared Chromium browser pool."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from digital_footprint.scanners.browser_pool import BrowserPool
+from digital_footprint.models import Person
+from digital_footprint.scanners.broker_scanner import scan_broker, scan_brokers_for_persons
+from digital_footprint.scanners.throttle import HostThrottle
+
+
+def _patch_launchers():
+    launched = []
+
+    async def fake_launch(pw, headless=True):
+        browser = AsyncMock()
+        launched.append(browser)
+        return browser
+
+    async def fake_context(browser, blocker=None):
+        return AsyncMock()
+
+    return (
+        launched,
+        patch("digital_footprint.scanners.browser_pool._start_playwright", new_callable=AsyncMock),
+        patch("digital_footprint.scanners.browser_pool.launch_stealth_browser", side_effect=fake_launch),
+        patch("digital_footprint.scanners.browser_pool.new_stealth_context", side_effect=fake_context),
+    )
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_browser_across_contexts():
+    launched, p_pw, p_launch, p_ctx = _patch_launchers()
+    with p_pw, p_launch, p_ctx:
+        async with BrowserPool(max_pages_per_browser=10) as pool:
+            for _ in range(5):
+                async with pool.context() as context:
+                    assert context is not None
+
+    assert pool.browsers_launched == 1
+    assert pool.contexts_served == 5
+    assert len(launched) == 1
+    launched[0].close.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_pool_recycles_browser_after_max_pages():
+    launched, p_pw, p_launch, p_ctx = _patch_launchers()
+    with p_pw, p_launch, p_ctx:
+        pool = BrowserPool(max_pages_per_browser=2)
+        for _ in range(5):
+            async with pool.context():
+                pass
+        assert pool.browsers_launched == 3
+        # Retired browsers are closed as soon as their contexts are released
+        launched[0].close.assert_awaited_once()
+        launched[1].close.assert_awaited_once()
+        launched[2].close.assert_not_awaited()
+        await pool.close()
+
+    launched[2].close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_pool_keeps_retired_browser_until_contexts_released():
+    launched, p_pw, p_launch, p_ctx = _patch_launchers()
+    with p_pw, p_launch, p_ctx:
+        pool = BrowserPool(max_pages_per_browser=1)
+        first_browser, first_ctx = await pool.acquire()
+        second_browser, second_ctx = await pool.acquire()
+        assert first_browser is not second_browser
+        first_browser.close.assert_not_awaited()
+
+        await pool.release(first_browser, first_ctx)
+        first_browser.close.assert_awaited_once()
+
+        await pool.release(second_browser, second_ctx)
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_broker_sweep_recycles_shared_context_browser():
+    launched, p_pw, p_launch, p_ctx = _patch_launchers()
+    persons = [Person(id=i, name=f"Person{i} Doe") for i in range(5)]
+    brokers = [{"slug": "spokeo", "name": "Spokeo", "search_url_pattern": "https://spokeo.com/{first}-{last}"}]
+
+    async def fake_load(context, url, timeout):
+        return "No results"
+
+    with p_pw, p_launch, p_ctx, \
+         patch("digital_footprint.scanners.broker_scanner._load_page_text", side_effect=fake_load):
+        async with BrowserPool(max_pages_per_browser=2) as pool:
+            pairs = [
+                pair async for pair in scan_brokers_for_persons(
+                    persons, brokers, pool=pool, throttle=HostThrottle(0, 0),
+                )
+            ]
+            # Five pages at two per browser: recycled twice mid-sweep
+            assert pool.browsers_launched == 3
+            launched[0].close.assert_awaited_once()
+            launched[1].close.assert_awaited_once()
+
+    assert len(pairs) == 5
+
+
+@pytest.mark.asyncio
+async def test_scan_broker_uses_pool_context():
+    mock_page = AsyncMock()
+    mock_page.inner_text = AsyncMock(return_value="John Doe, age 35, San Francisco")
+    mock_context = AsyncMock()
+    mock_context.new_page = AsyncMock(return_value=mock_page)
+
+    pool = MagicMock()
+    pool.context.return_value.__aenter__ = AsyncMock(return_value=mock_context)
+    pool.context.return_value.__aexit__ = AsyncMock(return_value=False)
+
+    with patch("digital_footprint.scanners.playwright_scanner.create_stealth_browser") as mock_create, \
+         patch("digital_footprint.scanners.playwright_scanner.random_delay", new_callable=AsyncMock):
+        result = await scan_broker(
+            broker_slug="spokeo",
+            broker_name="Spokeo",
+            url_pattern="https://spokeo.com/{first}-{last}",
+            first_name="John",
+            last_name="Doe",
+            pool=pool,
+        )
+
+    assert result.found is True
+    assert result.url == "https://spokeo.com/John-Doe"
+    mock_create.assert_not_called()
+    mock_page.close.assert_awaited_once()
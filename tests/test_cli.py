@@ -1,6 +1,6 @@
 """Tests for the dfp CLI."""
 
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from click.testing import CliRunner
 from digital_footprint.cli import cli
 from digital_footprint.models import Person
@@ -116,3 +116,38 @@ def test_broker_list(mock_db):
     result = runner.invoke(cli, ["broker", "list"])
     assert result.exit_code == 0
     assert "Test Broker" in result.output
+
+
+def test_response_cache_opened_only_for_api_commands(tmp_path):
+    from digital_footprint.config import Config
+    from digital_footprint.http_client import get_http_client
+
+    config = Config(db_path=tmp_path / "dfp.db", http_cache_path=tmp_path / "http_cache.db")
+    runner = CliRunner()
+    with patch("digital_footprint.cli.get_config", return_value=config), \
+         patch("digital_footprint.tools.scan_tools.do_breach_check", new_callable=AsyncMock) as mock_check:
+        mock_check.return_value = "{}"
+        assert runner.invoke(cli, ["person", "list"]).exit_code == 0
+        assert get_http_client().cache is None
+
+        assert runner.invoke(cli, ["scan", "breach", "a@example.com"]).exit_code == 0
+        assert get_http_client().cache.path == tmp_path / "http_cache.db"
+
+        assert runner.invoke(cli, ["--no-cache", "scan", "breach", "a@example.com"]).exit_code == 0
+        assert get_http_client().cache is None
+
+
+def test_scan_dorks_lists_queries():
+    runner = CliRunner()
+    result = runner.invoke(cli, ["scan", "dorks", "John Doe", "-e", "john@test.com"])
+    assert result.exit_code == 0
+    assert '"John Doe"' in result.output
+    assert "site:pastebin.com" in result.output
+
+
+def test_scan_dorks_run_requires_searxng(monkeypatch):
+    monkeypatch.delenv("SEARXNG_URL", raising=False)
+    runner = CliRunner()
+    result = runner.invoke(cli, ["scan", "dorks", "John Doe", "--run"])
+    assert result.exit_code != 0
+    assert "SEARXNG_URL" in result.output
@@ -1,5 +1,6 @@
 """Tests for dark web monitoring orchestrator."""
 
+import httpx
 import pytest
 from unittest.mock import patch, AsyncMock
 from digital_footprint.monitors.dark_web_monitor import run_dark_web_scan, format_dark_web_report
@@ -39,6 +40,26 @@ async def test_run_dark_web_scan_no_results(mock_pastes, mock_ahmia, mock_holehe
     assert results["total"] == 0
 
 
+@pytest.mark.asyncio
+@patch("digital_footprint.monitors.dark_web_monitor.check_email_registrations")
+@patch("digital_footprint.monitors.dark_web_monitor.search_ahmia")
+@patch("digital_footprint.monitors.dark_web_monitor.check_hibp_pastes")
+async def test_run_dark_web_scan_survives_hibp_failure(mock_pastes, mock_ahmia, mock_holehe):
+    from digital_footprint.scanners.dark_web_scanner import AhmiaResult
+
+    request = httpx.Request("GET", "https://haveibeenpwned.com/api/v3/pasteaccount/test@example.com")
+    mock_pastes.side_effect = httpx.HTTPStatusError(
+        "401 Unauthorized", request=request, response=httpx.Response(401, request=request)
+    )
+    mock_ahmia.return_value = [AhmiaResult(title="Leak Forum", url="http://example.onion/leak")]
+    mock_holehe.return_value = []
+
+    results = await run_dark_web_scan("test@example.com", hibp_api_key="bad-key")
+    assert results["paste_count"] == 0
+    assert results["ahmia_count"] == 1
+    assert results["total"] == 1
+
+
 def test_format_dark_web_report():
     results = {
         "email": "test@example.com",
@@ -1,15 +1,30 @@
 """Tests for dark web scanner (HIBP pastes + Ahmia.fi)."""
 
+import httpx
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
+from digital_footprint.http_client import HttpClientManager
 from digital_footprint.scanners.dark_web_scanner import (
     PasteResult,
+    AhmiaParser,
     AhmiaResult,
     check_hibp_pastes,
     search_ahmia,
 )
 
 
+def _ahmia_manager(*pages):
+    """MockTransport-backed client serving ``pages`` in order; records request URLs."""
+    requested = []
+    remaining = list(pages)
+
+    def handler(request):
+        requested.append(str(request.url))
+        return httpx.Response(200, text=remaining.pop(0))
+
+    return HttpClientManager(transport=httpx.MockTransport(handler)), requested
+
+
 @pytest.mark.asyncio
 async def test_check_hibp_pastes_found():
     mock_resp = MagicMock()
@@ -31,12 +46,12 @@ async def test_check_hibp_pastes_found():
         },
     ]
 
-    with patch("digital_footprint.scanners.dark_web_scanner.httpx.AsyncClient") as mock_client_cls:
+    with patch("digital_footprint.scanners.dark_web_scanner.get_http_client") as mock_get_client:
         mock_client = AsyncMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
+        mock_client.cached_response = MagicMock(return_value=None)
+        mock_client.store_response = MagicMock()
         mock_client.get.return_value = mock_resp
-        mock_client_cls.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         results = await check_hibp_pastes("test@example.com", api_key="test-key")
 
@@ -51,12 +66,12 @@ async def test_check_hibp_pastes_not_found():
     mock_resp = MagicMock()
     mock_resp.status_code = 404
 
-    with patch("digital_footprint.scanners.dark_web_scanner.httpx.AsyncClient") as mock_client_cls:
+    with patch("digital_footprint.scanners.dark_web_scanner.get_http_client") as mock_get_client:
         mock_client = AsyncMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
+        mock_client.cached_response = MagicMock(return_value=None)
+        mock_client.store_response = MagicMock()
         mock_client.get.return_value = mock_resp
-        mock_client_cls.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         results = await check_hibp_pastes("clean@example.com", api_key="test-key")
 
@@ -90,18 +105,10 @@ async def test_search_ahmia_found():
     </li>
     </body></html>
     """
-    mock_resp = MagicMock()
-    mock_resp.status_code = 200
-    mock_resp.text = html
-
-    with patch("digital_footprint.scanners.dark_web_scanner.httpx.AsyncClient") as mock_client_cls:
-        mock_client = AsyncMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
-        mock_client.get.return_value = mock_resp
-        mock_client_cls.return_value = mock_client
-
+    manager, _ = _ahmia_manager(html)
+    with patch("digital_footprint.scanners.dark_web_scanner.get_http_client", return_value=manager):
         results = await search_ahmia("test@example.com")
+    await manager.aclose()
 
     assert len(results) == 2
     assert results[0].title == "Leaked Database Dump"
@@ -111,17 +118,107 @@ async def test_search_ahmia_found():
 @pytest.mark.asyncio
 async def test_search_ahmia_no_results():
     html = "<html><body><p>No results found</p></body></html>"
-    mock_resp = MagicMock()
-    mock_resp.status_code = 200
-    mock_resp.text = html
-
-    with patch("digital_footprint.scanners.dark_web_scanner.httpx.AsyncClient") as mock_client_cls:
-        mock_client = AsyncMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
-        mock_client.get.return_value = mock_resp
-        mock_client_cls.return_value = mock_client
-
+    manager, _ = _ahmia_manager(html)
+    with patch("digital_footprint.scanners.dark_web_scanner.get_http_client", return_value=manager):
         results = await search_ahmia("clean@example.com")
+    await manager.aclose()
 
     assert results == []
+
+
+AHMIA_PAGE = """
+<ol class="searchResults">
+<li class="result">
+  <h4><a href="/search/redirect?search_term=x&amp;redirect_url=http://leak.onion/dump">
+    Leaked <b>Database</b> Dump</a></h4>
+  <p>Contains <b>test@example.com</b> and passwords</p>
+  <p class="urlinfo"><cite>http://leak.onion/dump</cite> 2 days ago</p>
+</li>
+<li class="result">
+  <h4><a href="http://other.onion/">Other</a></h4>
+  <p>Email list</p>
+</li>
+<li class="result">
+  <h4><a href="http://leak.onion/dump">Leaked Database Dump (mirror)</a></h4>
+  <p>Duplicate</p>
+</li>
+</ol>
+"""
+
+
+def test_ahmia_parser_unwraps_redirects_and_nested_markup():
+    from digital_footprint.scanners.dark_web_scanner import _parse_ahmia_html
+
+    results = _parse_ahmia_html(AHMIA_PAGE)
+    assert results[0] == AhmiaResult(
+        title="Leaked Database Dump",
+        url="http://leak.onion/dump",
+        snippet="Contains test@example.com and passwords",
+    )
+    assert results[1].url == "http://other.onion/"
+
+
+def test_ahmia_parser_emits_results_incrementally():
+    from digital_footprint.scanners.dark_web_scanner import iter_ahmia_results
+
+    fed = 0
+
+    def chunks():
+        nonlocal fed
+        for i in range(0, len(AHMIA_PAGE), 37):
+            fed += 1
+            yield AHMIA_PAGE[i:i + 37]
+
+    total_chunks = len(range(0, len(AHMIA_PAGE), 37))
+    results = []
+    fed_at_first = None
+    for result in iter_ahmia_results(chunks()):
+        if fed_at_first is None:
+            fed_at_first = fed
+        results.append(result)
+    assert fed_at_first < total_chunks
+    assert [r.url for r in results] == ["http://leak.onion/dump", "http://other.onion/", "http://leak.onion/dump"]
+
+
+@pytest.mark.asyncio
+async def test_search_ahmia_follows_pages_and_dedupes():
+    page1 = AHMIA_PAGE + '<div class="pagination"><a href="/search/?q=test&amp;page=2">Next &raquo;</a></div>'
+    page2 = """
+    <li class="result"><h4><a href="http://other.onion/">Other again</a></h4><p>dup</p></li>
+    <li class="result"><h4><a href="http://third.onion/">Third</a></h4><p>new</p></li>
+    <a href="/search/?q=test&amp;page=2" rel="next">2</a>
+    """
+    manager, requested = _ahmia_manager(page1, page2)
+    with patch("digital_footprint.scanners.dark_web_scanner.get_http_client", return_value=manager):
+        results = await search_ahmia("test@example.com")
+    await manager.aclose()
+
+    assert [r.url for r in results] == ["http://leak.onion/dump", "http://other.onion/", "http://third.onion/"]
+    assert requested == ["https://ahmia.fi/search/?q=test%40example.com", "https://ahmia.fi/search/?q=test&page=2"]
+
+
+@pytest.mark.asyncio
+async def test_search_ahmia_parses_while_streaming():
+    first = '<li class="result"><h4><a href="http://one.onion/">One</a></h4><p>a</p></li>'
+    second = '<li class="result"><h4><a href="http://two.onion/">Two</a></h4><p>b</p></li>'
+    emitted = []
+    emitted_before_second_chunk = []
+    original_emit = AhmiaParser._emit
+
+    def spy_emit(parser):
+        original_emit(parser)
+        emitted.append(parser._href)
+
+    async def body():
+        yield first.encode()
+        emitted_before_second_chunk.append(len(emitted))
+        yield second.encode()
+
+    manager = HttpClientManager(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body())))
+    with patch("digital_footprint.scanners.dark_web_scanner.get_http_client", return_value=manager), \
+         patch.object(AhmiaParser, "_emit", spy_emit):
+        results = await search_ahmia("test@example.com")
+    await manager.aclose()
+
+    assert emitted_before_second_chunk == [1]
+    assert [r.url for r in results] == ["http://one.onion/", "http://two.onion/"]
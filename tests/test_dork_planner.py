@@ -0,0 +1,143 @@
+"""Tests for the dork query planner."""
+
+import time
+
+import pytest
+
+from digital_footprint.models import Person
+from digital_footprint.scanners.dork_planner import (
+    merge_queries,
+    parse_dork_query,
+    person_dork_queries,
+    plan_dork_queries,
+    prune_redundant,
+    run_planned_dorks,
+)
+from digital_footprint.scanners.google_dorker import SearchBackend
+
+
+def test_parse_dork_query_splits_operators_and_terms():
+    q = parse_dork_query('site:pastebin.com  "John Doe"   "john@x.com"')
+    assert q.operators == ("site:pastebin.com",)
+    assert q.terms == ('"John Doe"', '"john@x.com"')
+    assert q.text == 'site:pastebin.com "John Doe" "john@x.com"'
+    assert not q.opaque
+    assert parse_dork_query('"a" OR "b"').opaque
+
+
+def test_prune_redundant_drops_narrower_and_duplicate_queries():
+    queries = [parse_dork_query(q) for q in [
+        '"John Doe"',
+        '"John Doe" "john@x.com"',
+        '"john@x.com"',
+        '"JOHN DOE"',
+        'site:pastebin.com "john@x.com"',
+        'filetype:pdf "John Doe"',
+    ]]
+    kept, pruned = prune_redundant(queries)
+    assert [q.text for q in kept] == [
+        '"John Doe"', '"john@x.com"', 'site:pastebin.com "john@x.com"', 'filetype:pdf "John Doe"',
+    ]
+    assert sorted(pruned) == ['"JOHN DOE"', '"John Doe" "john@x.com"']
+
+
+def test_merge_queries_builds_or_groups_within_length():
+    queries = [parse_dork_query(q) for q in [
+        'site:pastebin.com "a@x.com"',
+        'site:pastebin.com "b@x.com"',
+        'site:pastebin.com "c@x.com"',
+        '"John Doe"',
+    ]]
+    planned = merge_queries(queries, max_length=200)
+    assert [p.query for p in planned] == [
+        'site:pastebin.com ("a@x.com" OR "b@x.com" OR "c@x.com")',
+        '"John Doe"',
+    ]
+    assert planned[0].covers == [q.text for q in queries[:3]]
+
+    split = merge_queries(queries[:3], max_length=50)
+    assert [p.query for p in split] == [
+        'site:pastebin.com ("a@x.com" OR "b@x.com")',
+        'site:pastebin.com "c@x.com"',
+    ]
+    assert all(len(p.query) <= 50 for p in split)
+
+
+def test_plan_for_person_uses_fewer_requests():
+    person = Person(name="John Doe", emails=["a@x.com", "b@y.com"], phones=["555-0100"], addresses=["1 Main St"])
+    queries = person_dork_queries(person)
+    plan = plan_dork_queries(queries, name=person.name)
+
+    assert len(plan.queries) < len(queries)
+    covered = {q for p in plan.queries for q in p.covers}
+    assert covered | set(plan.pruned) == {parse_dork_query(q).text for q in queries}
+
+
+def test_name_only_query_neither_covers_nor_merges():
+    queries = ['"John Doe"', '"John Doe" "a@x.com"', '"a@x.com"', '"555-0100"', '"John Doe" "1 Main St"']
+    plan = plan_dork_queries(queries, name="John Doe")
+
+    # The address has no standalone query, so the qualified one must survive
+    assert plan.pruned == ['"John Doe" "a@x.com"']
+    assert [p.query for p in plan.queries] == [
+        '"John Doe"',
+        '"a@x.com" OR "555-0100"',
+        '"John Doe" "1 Main St"',
+    ]
+
+
+def test_plan_skips_recent_queries():
+    plan = plan_dork_queries(['"a@x.com"', '"b@x.com"'], recent={'"a@x.com"'})
+    assert plan.skipped == ['"a@x.com"']
+    assert [p.query for p in plan.queries] == ['"b@x.com"']
+
+
+class RecordingBackend(SearchBackend):
+    name = "recording"
+
+    def __init__(self, fail=()):
+        super().__init__(rpm=6000)
+        self.sent = []
+        self.fail = set(fail)
+
+    async def search(self, query, max_results=20):
+        self.sent.append(query)
+        if query in self.fail:
+            raise RuntimeError("backend down")
+        return [{"url": f"https://example.com/r?q={query}", "title": "", "snippet": ""}]
+
+
+@pytest.mark.asyncio
+async def test_run_planned_dorks_reuses_recent_results(tmp_db):
+    queries = ['"John Doe"', '"John Doe" "a@x.com"', '"a@x.com"', '"555-0100"', 'filetype:pdf "John Doe"']
+    backend = RecordingBackend()
+
+    first = await run_planned_dorks(queries, backend, db=tmp_db, name="John Doe")
+    assert sorted(backend.sent) == ['"John Doe"', '"a@x.com" OR "555-0100"', 'filetype:pdf "John Doe"']
+    assert first["requested"] == 5
+    assert len(first["results"]) == 3
+    assert first["cached"] == 0
+
+    backend.sent.clear()
+    second = await run_planned_dorks(queries + ['"b@x.com"'], backend, db=tmp_db, name="John Doe")
+    assert backend.sent == ['"b@x.com"']
+    assert len(second["plan"]["skipped_recent"]) == 4
+    # Skipped queries come back with the results stored on the first run
+    assert {r.url for r in first["results"]} < {r.url for r in second["results"]}
+    assert second["cached"] == 3
+
+    backend.sent.clear()
+    await run_planned_dorks(queries, backend, db=tmp_db, ttl=0, name="John Doe")
+    assert len(backend.sent) == 3
+
+
+@pytest.mark.asyncio
+async def test_run_planned_dorks_does_not_record_failed_requests(tmp_db):
+    backend = RecordingBackend(fail={'filetype:pdf "John Doe"'})
+    outcome = await run_planned_dorks(['"John Doe"', 'filetype:pdf "John Doe"'], backend, db=tmp_db)
+    assert list(outcome["errors"]) == ['filetype:pdf "John Doe"']
+
+    fetched = tmp_db.get_dork_queries("recording", ['"John Doe"', 'filetype:pdf "John Doe"'])
+    assert list(fetched) == ['"John Doe"']
+    assert time.time() - fetched['"John Doe"']["fetched_at"] < 60
+    assert [r["url"] for r in fetched['"John Doe"']["results"]] == ['https://example.com/r?q="John Doe"']
@@ -93,3 +93,24 @@ def test_generate_exposure_report_with_findings():
     assert "LinkedIn" in report
     assert "GitHub" in report
     assert "Risk Score:" in report
+
+
+def test_generate_exposure_report_aggregated_dehashed_records():
+    breach_results = {
+        "hibp_breaches": [],
+        "dehashed_records": [
+            {"database_name": "Collection1", "severity": "critical", "count": 1200},
+            {"database_name": "SmallDB", "severity": "medium"},
+        ],
+        "total": 1201,
+    }
+    report = generate_exposure_report(
+        person_name="John Doe",
+        broker_results=[],
+        breach_results=breach_results,
+        username_results=[],
+        dork_results=[],
+    )
+    assert "(0 breaches, 1201 records)" in report
+    assert "**Collection1**: 1200 exposed records" in report
+    assert "**SmallDB**: Exposed record found" in report
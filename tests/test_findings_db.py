@@ -0,0 +1,115 @@
+"""Tests for fingerprinted findings persistence."""
+
+import sqlite3
+from pathlib import Path
+
+from digital_footprint.config import Config
+from digital_footprint.db import Database
+from digital_footprint.models import Broker
+from digital_footprint.scanners.broker_scanner import (
+    BrokerScanResult,
+    finding_fingerprint,
+    normalize_snippet,
+    save_broker_results,
+)
+
+
+def _setup(db):
+    person_id = db.insert_person("John Doe")
+    for slug in ("spokeo", "radaris"):
+        db.insert_broker(Broker(slug=slug, name=slug.title(), url=f"https://{slug}.com", category="people_search"))
+    return person_id
+
+
+def _result(slug, found=True, text="John Doe, age 35, Austin TX", error=None):
+    return BrokerScanResult(
+        broker_slug=slug,
+        broker_name=slug.title(),
+        url=f"https://{slug}.com/John-Doe",
+        found=found,
+        page_text=text,
+        error=error,
+    )
+
+
+def test_fingerprint_ignores_digits_and_whitespace():
+    assert normalize_snippet("John  Doe, Age 35\n") == "john doe, age"
+    a = finding_fingerprint(1, _result("spokeo", text="John Doe, age 35"))
+    b = finding_fingerprint(1, _result("spokeo", text="john doe,  age 36"))
+    assert a == b
+    assert a != finding_fingerprint(2, _result("spokeo", text="John Doe, age 35"))
+
+
+def test_save_broker_results_new_then_unchanged(tmp_db):
+    person_id = _setup(tmp_db)
+    results = [_result("spokeo"), _result("radaris", found=False)]
+
+    assert save_broker_results(tmp_db, person_id, results) == {"new": 1, "unchanged": 0, "disappeared": 0}
+    assert save_broker_results(tmp_db, person_id, results) == {"new": 0, "unchanged": 1, "disappeared": 0}
+
+    findings = tmp_db.get_findings(person_id)
+    assert len(findings) == 1
+    assert findings[0]["source"] == "broker_scan"
+    assert findings[0]["broker_id"] == tmp_db.get_broker_by_slug("spokeo").id
+
+
+def test_save_broker_results_marks_disappeared(tmp_db):
+    person_id = _setup(tmp_db)
+    save_broker_results(tmp_db, person_id, [_result("spokeo"), _result("radaris")])
+
+    # radaris errored this run, so its finding is left alone
+    counts = save_broker_results(
+        tmp_db, person_id,
+        [_result("spokeo", found=False), _result("radaris", found=False, error="timeout")],
+    )
+    assert counts == {"new": 0, "unchanged": 0, "disappeared": 1}
+    assert len(tmp_db.get_findings(person_id, status="active")) == 1
+    assert len(tmp_db.get_findings(person_id, status="disappeared")) == 1
+    # Churn is not counted as a removal we achieved
+    assert tmp_db.get_status()["findings"]["removed"] == 0
+    assert tmp_db.get_status()["findings"]["disappeared"] == 1
+
+    # Reappearing listing is reactivated rather than duplicated
+    counts = save_broker_results(tmp_db, person_id, [_result("spokeo")])
+    assert counts["unchanged"] == 1
+    assert len(tmp_db.get_findings(person_id)) == 2
+
+
+def test_save_broker_results_leaves_skipped_broker_findings(tmp_db):
+    person_id = _setup(tmp_db)
+    save_broker_results(tmp_db, person_id, [_result("spokeo")])
+
+    # Circuit breaker open: no request was made, so nothing is known about the listing
+    skipped = BrokerScanResult(broker_slug="spokeo", broker_name="Spokeo", url="", found=False, skipped=True)
+    counts = save_broker_results(tmp_db, person_id, [skipped])
+    assert counts == {"new": 0, "unchanged": 0, "disappeared": 0}
+    assert len(tmp_db.get_findings(person_id, status="active")) == 1
+
+
+def test_insert_broker_keeps_id_on_reload(tmp_db):
+    broker = Broker(slug="spokeo", name="Spokeo", url="https://spokeo.com", category="people_search")
+    first_id = tmp_db.insert_broker(broker)
+    broker.notes = "updated"
+    assert tmp_db.insert_broker(broker) == first_id
+    assert tmp_db.get_broker_by_slug("spokeo").notes == "updated"
+
+
+def test_initialize_migrates_findings_without_fingerprint(tmp_path):
+    db_path = tmp_path / "old.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.execute(
+        """CREATE TABLE findings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, person_id INTEGER NOT NULL,
+            broker_id INTEGER, source TEXT NOT NULL, finding_type TEXT NOT NULL,
+            data_found TEXT DEFAULT '{}', risk_level TEXT DEFAULT 'medium', url TEXT,
+            screenshot_path TEXT, status TEXT DEFAULT 'active',
+            discovered_at TEXT DEFAULT (datetime('now')), updated_at TEXT DEFAULT (datetime('now')))"""
+    )
+    conn.commit()
+    conn.close()
+
+    db = Database(Config(db_path=db_path, brokers_dir=Path(__file__).parent.parent / "digital_footprint" / "brokers"))
+    db.initialize()
+    columns = {row[1] for row in db.conn.execute("PRAGMA table_info(findings)")}
+    assert "fingerprint" in columns
+    db.close()
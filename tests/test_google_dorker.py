@@ -1,11 +1,21 @@
 """Tests for Google dorking scanner."""
 
+import asyncio
+from unittest.mock import patch
+
+import httpx
 import pytest
 
+from digital_footprint.http_client import HttpClientManager
 from digital_footprint.scanners.google_dorker import (
     build_dork_queries,
+    canonical_url,
+    dedupe_results,
     DorkResult,
     parse_search_results,
+    run_dork_queries,
+    SearchBackend,
+    SearxngBackend,
 )
 
 
@@ -62,3 +72,92 @@ def test_parse_search_results():
     assert len(results) == 2
     assert all(isinstance(r, DorkResult) for r in results)
     assert results[0].query == '"John Doe"'
+
+
+def test_canonical_url_collapses_variants():
+    base = canonical_url("https://example.com/profile?id=7")
+    assert canonical_url("http://www.Example.com:80/profile/?id=7#top") == base
+    assert canonical_url("https://example.com/profile?utm_source=x&id=7&fbclid=abc") == base
+    assert canonical_url("https://example.com/profile?id=8") != base
+
+
+def test_dedupe_results_keeps_first_hit():
+    results = [
+        DorkResult(query="q1", url="https://www.example.com/a/", title="A", snippet=""),
+        DorkResult(query="q2", url="https://example.com/a?utm_medium=email", title="A", snippet=""),
+        DorkResult(query="q2", url="https://example.com/b", title="B", snippet=""),
+    ]
+    unique = dedupe_results(results)
+    assert [r.url for r in unique] == ["https://www.example.com/a/", "https://example.com/b"]
+    assert unique[0].query == "q1"
+
+
+class FakeBackend(SearchBackend):
+    name = "fake"
+
+    def __init__(self, responses):
+        super().__init__(rpm=6000)
+        self.responses = responses
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def search(self, query, max_results=20):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        response = self.responses[query]
+        if isinstance(response, Exception):
+            raise response
+        return response[:max_results]
+
+
+@pytest.mark.asyncio
+async def test_run_dork_queries_dedupes_across_queries():
+    backend = FakeBackend({
+        "q1": [{"url": "https://pastebin.com/abc", "title": "Paste", "snippet": ""}],
+        "q2": [
+            {"url": "http://www.pastebin.com/abc/", "title": "Paste", "snippet": ""},
+            {"url": "https://example.com/page", "title": "Page", "snippet": ""},
+        ],
+    })
+    outcome = await run_dork_queries(["q1", "q2"], backend)
+    assert outcome["queries"] == 2
+    assert [r.url for r in outcome["results"]] == ["https://pastebin.com/abc", "https://example.com/page"]
+    assert outcome["results"][0].query == "q1"
+    assert outcome["high_risk"] == 1
+    assert outcome["errors"] == {}
+
+
+@pytest.mark.asyncio
+async def test_run_dork_queries_bounds_concurrency_and_records_errors():
+    responses = {f"q{i}": [{"url": f"https://example.com/{i}", "title": "", "snippet": ""}] for i in range(8)}
+    responses["q3"] = RuntimeError("rate limited")
+    backend = FakeBackend(responses)
+    outcome = await run_dork_queries(list(responses), backend, concurrency=2)
+    assert backend.max_in_flight <= 2
+    assert len(outcome["results"]) == 7
+    assert outcome["errors"] == {"q3": "rate limited"}
+
+
+@pytest.mark.asyncio
+async def test_searxng_backend_maps_json_results():
+    seen = []
+
+    def handler(request):
+        seen.append(request.url)
+        return httpx.Response(200, json={"results": [
+            {"url": "https://example.com/a", "title": "A", "content": "snippet a"},
+            {"title": "no url"},
+            {"url": "https://example.com/b", "title": "B", "content": "snippet b"},
+        ]})
+
+    manager = HttpClientManager(transport=httpx.MockTransport(handler))
+    with patch("digital_footprint.scanners.google_dorker.get_http_client", return_value=manager):
+        results = await SearxngBackend("http://searx.local/", rpm=60).search('"John Doe"', max_results=1)
+    await manager.aclose()
+
+    assert results == [{"url": "https://example.com/a", "title": "A", "snippet": "snippet a"}]
+    assert seen[0].path == "/search"
+    assert seen[0].params["q"] == '"John Doe"'
+    assert seen[0].params["format"] == "json"
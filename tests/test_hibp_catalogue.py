@@ -0,0 +1,154 @@
+"""Tests for the local HIBP breach catalogue and truncated lookups."""
+
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from digital_footprint.config import Config
+from digital_footprint.db import Database
+from digital_footprint.http_client import HttpClientManager
+from digital_footprint.scanners.breach_scanner import check_hibp, scan_breaches_many
+from digital_footprint.scanners.hibp_catalogue import BreachCatalogue
+
+CATALOGUE = [
+    {
+        "Name": "LinkedIn",
+        "Title": "LinkedIn",
+        "Domain": "linkedin.com",
+        "BreachDate": "2012-05-05",
+        "DataClasses": ["Email addresses", "Passwords"],
+        "IsVerified": True,
+    },
+    {
+        "Name": "Gravatar",
+        "Title": "Gravatar",
+        "Domain": "gravatar.com",
+        "BreachDate": "2020-10-03",
+        "DataClasses": ["Email addresses", "Names", "Usernames"],
+        "IsVerified": True,
+    },
+]
+
+
+class FakeHibp:
+    """MockTransport handler serving /breaches with an ETag and truncated account lookups."""
+
+    def __init__(self, account_breaches=("LinkedIn", "Gravatar")):
+        self.account_breaches = list(account_breaches)
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path.endswith("/breaches"):
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=CATALOGUE, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json=[{"Name": name} for name in self.account_breaches])
+
+    def paths(self) -> list[str]:
+        return [r.url.path for r in self.requests]
+
+
+@pytest.fixture
+def hibp():
+    fake = FakeHibp()
+    manager = HttpClientManager(transport=httpx.MockTransport(fake))
+    with patch("digital_footprint.scanners.hibp_catalogue.get_http_client", return_value=manager), \
+         patch("digital_footprint.scanners.breach_scanner.get_http_client", return_value=manager):
+        yield fake
+
+
+@pytest.fixture
+def catalogue(tmp_db):
+    return BreachCatalogue(tmp_db)
+
+
+@pytest.mark.asyncio
+async def test_refresh_downloads_then_revalidates(hibp, catalogue):
+    first = await catalogue.refresh()
+    assert first == {"status": "updated", "breaches": 2}
+    assert catalogue.get("LinkedIn")["data_classes"] == ["Email addresses", "Passwords"]
+
+    assert (await catalogue.refresh())["status"] == "fresh"
+    second = await catalogue.refresh(force=True)
+    assert second == {"status": "not_modified", "breaches": 2}
+    assert hibp.requests[-1].headers["if-none-match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_catalogue_persists_across_instances(hibp, tmp_path):
+    config = Config(db_path=tmp_path / "test.db")
+    first = Database(config)
+    first.initialize()
+    await BreachCatalogue(first).refresh()
+    first.close()
+
+    second = Database(config)
+    second.initialize()
+    catalogue = BreachCatalogue(second)
+    assert len(catalogue) == 2
+    assert not catalogue.is_stale()
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_check_hibp_joins_truncated_response(hibp, catalogue):
+    await catalogue.refresh()
+    breaches = await check_hibp("a@example.com", api_key="k", catalogue=catalogue)
+
+    account_request = hibp.requests[-1]
+    assert "truncateResponse" not in account_request.url.params
+    by_name = {b.name: b for b in breaches}
+    assert by_name["LinkedIn"].severity == "critical"
+    assert by_name["Gravatar"].domain == "gravatar.com"
+    assert by_name["Gravatar"].severity == "medium"
+
+
+@pytest.mark.asyncio
+async def test_unknown_breach_falls_back_to_name(hibp, catalogue):
+    await catalogue.refresh()
+    hibp.account_breaches = ["BrandNew"]
+    breaches = await check_hibp("a@example.com", api_key="k", catalogue=catalogue)
+    assert breaches[0].name == "BrandNew"
+    assert breaches[0].title == "BrandNew"
+    assert breaches[0].data_classes == []
+
+
+@pytest.mark.asyncio
+async def test_batch_refreshes_stale_catalogue_once(hibp, catalogue):
+    batch = await scan_breaches_many(
+        ["a@example.com", "b@example.com"], hibp_api_key="k", hibp_rpm=6000, catalogue=catalogue
+    )
+    assert hibp.paths().count("/api/v3/breaches") == 1
+    assert batch["results"][0]["hibp_breaches"][0].data_classes == ["Email addresses", "Passwords"]
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_existing_copy(catalogue):
+    catalogue.load(CATALOGUE)
+    catalogue.db.set_hibp_catalogue_meta(refreshed_at=str(time.time() - 2 * catalogue.max_age))
+    manager = HttpClientManager(transport=httpx.MockTransport(lambda request: httpx.Response(503)))
+    with patch("digital_footprint.scanners.hibp_catalogue.get_http_client", return_value=manager):
+        assert await catalogue.ensure_fresh() is True
+    assert catalogue.get("LinkedIn") is not None
+
+
+@pytest.mark.asyncio
+async def test_empty_catalogue_falls_back_to_full_responses(catalogue):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.path.endswith("/breaches"):
+            return httpx.Response(503)
+        return httpx.Response(200, json=CATALOGUE[:1])
+
+    manager = HttpClientManager(transport=httpx.MockTransport(handler))
+    with patch("digital_footprint.scanners.hibp_catalogue.get_http_client", return_value=manager), \
+         patch("digital_footprint.scanners.breach_scanner.get_http_client", return_value=manager):
+        batch = await scan_breaches_many(["a@example.com"], hibp_api_key="k", catalogue=catalogue)
+
+    assert requests[-1].url.params["truncateResponse"] == "false"
+    assert batch["results"][0]["hibp_breaches"][0].severity == "critical"
@@ -0,0 +1,103 @@
+"""Tests for the HIBP rate-limit aware request scheduler."""
+
+import asyncio
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from digital_footprint.scanners.breach_scanner import check_hibp
+from digital_footprint.scanners.hibp_scheduler import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    HibpRateLimitError,
+    HibpScheduler,
+    TokenBucket,
+    get_hibp_scheduler,
+)
+
+
+def _response(status, headers=None):
+    return httpx.Response(status, headers=headers or {}, request=httpx.Request("GET", "https://haveibeenpwned.com/"))
+
+
+def test_token_bucket_spacing():
+    bucket = TokenBucket(rate_per_minute=60)
+    assert bucket.delay() == 0
+    bucket.take()
+    assert 0.9 < bucket.delay() <= 1.0
+
+
+def test_token_bucket_pause():
+    bucket = TokenBucket(rate_per_minute=6000)
+    bucket.pause(2.0)
+    assert bucket.delay() > 1.9
+
+
+def test_scheduler_shared_per_key_and_rate():
+    assert get_hibp_scheduler("k1", 10) is get_hibp_scheduler("k1", 10)
+    assert get_hibp_scheduler("k1", 10) is not get_hibp_scheduler("k1", 50)
+    assert get_hibp_scheduler("k1", 10) is not get_hibp_scheduler("k2", 10)
+
+
+@pytest.mark.asyncio
+async def test_priority_order():
+    scheduler = HibpScheduler(rpm=600)  # one token every 0.1 s
+    order = []
+
+    async def send(tag):
+        order.append(tag)
+        return _response(200)
+
+    await scheduler.request(lambda: send("first"))
+    tasks = [
+        asyncio.create_task(scheduler.request(lambda: send("low"), priority=PRIORITY_LOW)),
+        asyncio.create_task(scheduler.request(lambda: send("high"), priority=PRIORITY_HIGH)),
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.queue_depth == 2
+    await asyncio.gather(*tasks)
+
+    assert order == ["first", "high", "low"]
+    stats = scheduler.stats()
+    assert stats["requests"] == 3
+    assert stats["queue_depth"] == 0
+    assert stats["total_wait_seconds"] > 0.1
+
+
+@pytest.mark.asyncio
+async def test_retries_after_429_honoring_retry_after():
+    scheduler = HibpScheduler(rpm=6000)
+    send = AsyncMock(side_effect=[_response(429, {"retry-after": "0.2"}), _response(200)])
+    with patch("digital_footprint.scanners.hibp_scheduler.random.uniform", return_value=0.0):
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        resp = await scheduler.request(send)
+        elapsed = loop.time() - started
+
+    assert resp.status_code == 200
+    assert elapsed >= 0.2
+    assert scheduler.stats()["retries"] == 1
+    assert scheduler.stats()["rate_limited"] == 1
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries():
+    scheduler = HibpScheduler(rpm=6000, max_retries=1)
+    send = AsyncMock(return_value=_response(429, {"retry-after": "0"}))
+    with patch("digital_footprint.scanners.hibp_scheduler.MAX_JITTER", 0.0), \
+         pytest.raises(HibpRateLimitError):
+        await scheduler.request(send)
+    assert send.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_check_hibp_no_longer_swallows_429():
+    client = MagicMock()
+    client.cached_response.return_value = None
+    client.get = AsyncMock(return_value=_response(429, {"retry-after": "0"}))
+    with patch("digital_footprint.scanners.breach_scanner.get_http_client", return_value=client), \
+         patch("digital_footprint.scanners.hibp_scheduler.MAX_JITTER", 0.0):
+        get_hibp_scheduler("key", 6000).max_retries = 0
+        with pytest.raises(HibpRateLimitError):
+            await check_hibp("test@example.com", api_key="key", rpm=6000)
@@ -1,15 +1,24 @@
 """Tests for holehe email registration scanner."""
 
 import asyncio
+import os
 import pytest
 from unittest.mock import patch, AsyncMock
 from digital_footprint.scanners.holehe_scanner import (
     HoleheResult,
     parse_holehe_output,
     check_email_registrations,
+    check_email_registrations_many,
 )
 
 
+@pytest.fixture
+def no_holehe_module():
+    """Force the subprocess fallback, as when holehe isn't importable."""
+    with patch("digital_footprint.scanners.holehe_scanner.load_holehe_modules", side_effect=ImportError):
+        yield
+
+
 def test_parse_holehe_output_legacy_format():
     stdout = "twitter.com,Used,social\ninstagram.com,Used,social\nnetflix.com,Used,streaming\nadobe.com,Used,software\ndating-site.com,Used,dating\nunknown.com,Not Used,other\n"
     results = parse_holehe_output(stdout)
@@ -49,7 +58,7 @@ def test_holehe_result_risk_level_low():
 
 @pytest.mark.asyncio
 @patch("digital_footprint.scanners.holehe_scanner.asyncio.create_subprocess_exec")
-async def test_check_email_registrations(mock_exec, tmp_path):
+async def test_check_email_registrations(mock_exec, tmp_path, no_holehe_module):
     csv_file = tmp_path / "holehe_test.csv"
     csv_file.write_text("twitter.com,Used,social\ninstagram.com,Used,social\n")
 
@@ -58,7 +67,8 @@ async def test_check_email_registrations(mock_exec, tmp_path):
     mock_proc.returncode = 0
     mock_exec.return_value = mock_proc
 
-    with patch("digital_footprint.scanners.holehe_scanner.tempfile.mktemp", return_value=str(csv_file)):
+    fd = os.open(csv_file, os.O_RDONLY)
+    with patch("digital_footprint.scanners.holehe_scanner.tempfile.mkstemp", return_value=(fd, str(csv_file))):
         results = await check_email_registrations("test@example.com")
 
     assert len(results) == 2
@@ -67,20 +77,100 @@ async def test_check_email_registrations(mock_exec, tmp_path):
 
 @pytest.mark.asyncio
 @patch("digital_footprint.scanners.holehe_scanner.asyncio.create_subprocess_exec")
-async def test_check_email_registrations_holehe_not_installed(mock_exec):
+async def test_check_email_registrations_holehe_not_installed(mock_exec, no_holehe_module):
     mock_exec.side_effect = FileNotFoundError("holehe not found")
     results = await check_email_registrations("test@example.com")
     assert results == []
 
 
 @pytest.mark.asyncio
-@patch("digital_footprint.scanners.holehe_scanner.asyncio.wait_for", side_effect=asyncio.TimeoutError)
 @patch("digital_footprint.scanners.holehe_scanner.asyncio.create_subprocess_exec")
-async def test_check_email_registrations_timeout(mock_exec, mock_wait_for):
+async def test_check_email_registrations_timeout(mock_exec, no_holehe_module):
+    killed = []
+
+    async def communicate():
+        # Hangs until the process is killed
+        if not killed:
+            await asyncio.sleep(10)
+        return b"", b""
+
     mock_proc = AsyncMock()
-    mock_proc.kill = lambda: None
-    mock_proc.communicate = AsyncMock(return_value=(b"", b""))
+    mock_proc.kill = lambda: killed.append(True)
+    mock_proc.communicate = communicate
     mock_exec.return_value = mock_proc
 
-    results = await check_email_registrations("test@example.com", timeout=1)
+    results = await check_email_registrations("test@example.com", timeout=0.05)
     assert results == []
+    assert killed == [True]
+
+
+def _fake_module(name, package, domain, used_by=(), delay=0.0, fail=False):
+    async def check(email, client, out):
+        if delay:
+            await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError("site changed")
+        out.append({"name": name, "domain": domain, "rateLimit": False,
+                    "exists": email in used_by, "emailrecovery": None, "phoneNumber": None, "others": None})
+    check.__name__ = name
+    check.__module__ = f"holehe.modules.{package}.{name}"
+    return check
+
+
+@pytest.mark.asyncio
+async def test_check_email_registrations_many_in_process():
+    modules = (
+        _fake_module("twitter", "social_media", "twitter.com", used_by={"a@example.com", "b@example.com"}),
+        _fake_module("pornhub", "porn", "pornhub.com", used_by={"b@example.com"}),
+        _fake_module("adobe", "software", "adobe.com", used_by={"a@example.com"}),
+        _fake_module("broken", "shopping", "broken.com", fail=True),
+    )
+    with patch("digital_footprint.scanners.holehe_scanner.asyncio.create_subprocess_exec") as mock_exec:
+        results = await check_email_registrations_many(["a@example.com", "b@example.com"], modules=modules)
+    mock_exec.assert_not_called()
+
+    assert [(r.service, r.category) for r in results["a@example.com"]] == [
+        ("adobe.com", "other"), ("twitter.com", "social"),
+    ]
+    assert [r.risk_level for r in results["b@example.com"]] == ["high", "medium"]
+
+
+@pytest.mark.asyncio
+async def test_check_email_registrations_many_closes_per_email_clients():
+    clients = []
+
+    async def check(email, client, out):
+        clients.append(client)
+
+    check.__module__ = "holehe.modules.social_media.twitter"
+    await check_email_registrations_many(["a@example.com", "b@example.com"], modules=(check,))
+    assert len({id(c) for c in clients}) == 2
+    assert all(c.is_closed for c in clients)
+
+
+@pytest.mark.asyncio
+async def test_in_process_matches_csv_parsing():
+    modules = (_fake_module("twitter", "social_media", "twitter.com", used_by={"a@example.com"}),)
+    results = await check_email_registrations_many(["a@example.com"], modules=modules)
+    csv = "Name,Domain,Exists,Rate Limit,Others\nTwitter,twitter.com,True,False,\n"
+    assert [r.service for r in results["a@example.com"]] == [r.service for r in parse_holehe_output(csv)]
+
+
+@pytest.mark.asyncio
+async def test_check_email_registrations_many_keeps_partial_results_on_timeout():
+    modules = (
+        _fake_module("twitter", "social_media", "twitter.com", used_by={"a@example.com"}),
+        _fake_module("slow", "forum", "slow.com", used_by={"a@example.com"}, delay=5),
+    )
+    results = await check_email_registrations_many(["a@example.com"], timeout=0.2, modules=modules)
+    assert [r.service for r in results["a@example.com"]] == ["twitter.com"]
+
+
+@pytest.mark.asyncio
+async def test_check_email_registrations_many_falls_back_to_subprocess(no_holehe_module):
+    with patch("digital_footprint.scanners.holehe_scanner.check_email_registrations_subprocess",
+               new_callable=AsyncMock) as mock_sub:
+        mock_sub.return_value = [HoleheResult(service="twitter.com", exists=True)]
+        results = await check_email_registrations_many(["a@example.com", "b@example.com"])
+    assert mock_sub.await_count == 2
+    assert results["b@example.com"][0].service == "twitter.com"
@@ -0,0 +1,169 @@
+"""Tests for the SQLite-backed HTTP response cache."""
+
+import random
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from digital_footprint.config import Config
+from digital_footprint.http_cache import (
+    REDACTED,
+    ResponseCache,
+    open_response_cache,
+    parse_duration,
+    parse_ttl_overrides,
+    redact_url,
+)
+from digital_footprint.http_client import HttpClientManager
+from digital_footprint.scanners.breach_scanner import check_hibp
+from digital_footprint.scanners.dark_web_scanner import search_ahmia
+
+HIBP_URL = "https://haveibeenpwned.com/api/v3/breachedaccount/a@example.com"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = ResponseCache(tmp_path / "http_cache.db")
+    yield c
+    c.close()
+
+
+def _response(url, status=200, body=b"[]"):
+    return httpx.Response(status, content=body, headers={"content-type": "application/json"},
+                          request=httpx.Request("GET", url))
+
+
+def test_parse_durations():
+    assert parse_duration("90") == 90
+    assert parse_duration("30m") == 1800
+    assert parse_duration("12h") == 12 * 3600
+    assert parse_ttl_overrides("ahmia=1h, pasteaccount=0,bogus") == {"ahmia": 3600, "pasteaccount": 0}
+
+
+def test_redact_url_sorts_params_and_hides_secrets():
+    url = redact_url("https://API.example.com/x?b=2&api_key=s3cret", {"a": "1", "token": "t"})
+    assert url == f"https://api.example.com/x?a=1&api_key={REDACTED}&b=2&token={REDACTED}"
+
+
+def test_ttl_per_endpoint(cache):
+    assert cache.ttl_for("GET", HIBP_URL) == 24 * 3600
+    assert cache.ttl_for("GET", "https://haveibeenpwned.com/api/v3/pasteaccount/a@example.com") == 12 * 3600
+    assert cache.ttl_for("GET", "https://ahmia.fi/search/?q=a") == 6 * 3600
+    assert cache.ttl_for("POST", HIBP_URL) == 0
+    assert cache.ttl_for("GET", "https://example.com/search") == 0
+
+
+def test_put_and_get_round_trip(cache):
+    url = HIBP_URL + "?truncateResponse=false"
+    assert cache.put(_response(url, body=b'[{"Name": "LinkedIn"}]'))
+    hit = cache.get("GET", HIBP_URL, {"truncateResponse": "false"})
+    assert hit.status_code == 200
+    assert hit.json() == [{"Name": "LinkedIn"}]
+    assert hit.headers["x-cache"] == "HIT"
+    # Different params are a different entry
+    assert cache.get("GET", HIBP_URL) is None
+    assert cache.stats()["hits"] == 1
+
+
+def test_error_statuses_and_unknown_endpoints_not_cached(cache):
+    assert not cache.put(_response(HIBP_URL, status=429))
+    assert not cache.put(_response("https://example.com/x"))
+    assert cache.put(_response(HIBP_URL, status=404, body=b""))
+    assert cache.get("GET", HIBP_URL).status_code == 404
+
+
+def test_entries_expire(cache):
+    cache.put(_response(HIBP_URL))
+    with patch("digital_footprint.sqlite_cache.time.time", return_value=time.time() + 25 * 3600):
+        assert cache.get("GET", HIBP_URL) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_ttl_override_disables_endpoint(tmp_path):
+    cache = ResponseCache(tmp_path / "c.db", ttl_overrides={"breachedaccount": 0})
+    assert not cache.put(_response(HIBP_URL))
+    cache.close()
+
+
+def test_lru_eviction_respects_size_cap(tmp_path):
+    cache = ResponseCache(tmp_path / "c.db", max_bytes=2500)
+    body = random.Random(1).randbytes(1000)  # incompressible
+    urls = [f"https://haveibeenpwned.com/api/v3/breachedaccount/{i}@example.com" for i in range(3)]
+    cache.put(_response(urls[0], body=body))
+    cache.put(_response(urls[1], body=body))
+    cache.conn.execute("UPDATE http_responses SET last_access = last_access - 100")
+    cache.get("GET", urls[0])  # urls[1] is now least recently used
+    cache.put(_response(urls[2], body=body))
+
+    assert cache.get("GET", urls[0]) is not None
+    assert cache.get("GET", urls[1]) is None
+    assert cache.get("GET", urls[2]) is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["stored_bytes"] <= 2500
+    cache.close()
+
+
+def test_open_response_cache_respects_config(tmp_path):
+    config = Config(http_cache_path=tmp_path / "c.db", http_cache_ttls="ahmia=1h")
+    cache = open_response_cache(config)
+    assert cache.stats()["ttls"]["ahmia"] == 3600
+    cache.close()
+    assert open_response_cache(Config(http_cache_enabled=False)) is None
+
+
+@pytest.mark.asyncio
+async def test_manager_serves_repeat_requests_from_cache(cache):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, text="<html></html>")
+
+    manager = HttpClientManager(transport=httpx.MockTransport(handler), cache=cache)
+    first = await manager.get("https://ahmia.fi/search/", params={"q": "a@example.com"})
+    second = await manager.get("https://ahmia.fi/search/", params={"q": "a@example.com"})
+    bypass = await manager.get("https://ahmia.fi/search/", params={"q": "a@example.com"}, use_cache=False)
+    await manager.aclose()
+
+    assert first.text == second.text == bypass.text
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_check_hibp_cache_hit_skips_scheduler(cache):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json=[{"Name": "LinkedIn", "Title": "LinkedIn"}])
+
+    manager = HttpClientManager(transport=httpx.MockTransport(handler), cache=cache)
+    with patch("digital_footprint.scanners.breach_scanner.get_http_client", return_value=manager):
+        first = await check_hibp("a@example.com", api_key="secret-key", rpm=6000)
+        with patch("digital_footprint.scanners.breach_scanner.get_hibp_scheduler") as scheduler:
+            second = await check_hibp("a@example.com", api_key="secret-key", rpm=6000)
+            scheduler.assert_not_called()
+    await manager.aclose()
+
+    assert [b.name for b in first] == [b.name for b in second] == ["LinkedIn"]
+    assert len(calls) == 1
+    stored = cache.conn.execute("SELECT url, headers FROM http_responses").fetchall()
+    assert all("secret-key" not in url + headers for url, headers in stored)
+
+
+@pytest.mark.asyncio
+async def test_search_ahmia_uses_cache(cache):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, text="<ol></ol>")
+
+    manager = HttpClientManager(transport=httpx.MockTransport(handler), cache=cache)
+    with patch("digital_footprint.scanners.dark_web_scanner.get_http_client", return_value=manager):
+        await search_ahmia("a@example.com")
+        await search_ahmia("a@example.com")
+    await manager.aclose()
+    assert len(calls) == 1
@@ -0,0 +1,78 @@
+"""Tests for the shared pooled HTTP client."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from digital_footprint.http_client import (
+    DEFAULT_POLICY,
+    HostPolicy,
+    HttpClientManager,
+    http2_available,
+    run_async,
+)
+
+
+def _manager(handler, **kwargs):
+    return HttpClientManager(transport=httpx.MockTransport(handler), **kwargs)
+
+
+def test_policy_for_matches_parent_domains():
+    manager = HttpClientManager(host_policies={"example.com": HostPolicy(max_connections=1, timeout=3.0)})
+    assert manager.policy_for("https://api.example.com/x").timeout == 3.0
+    assert manager.policy_for("https://other.test/").timeout == DEFAULT_POLICY.timeout
+
+
+def test_http2_only_when_available():
+    assert HttpClientManager(http2=True).http2 == http2_available()
+    assert HttpClientManager(http2=False).http2 is False
+
+
+@pytest.mark.asyncio
+async def test_client_reused_within_loop():
+    manager = _manager(lambda request: httpx.Response(200, json={"ok": True}))
+    first = await manager.get("https://haveibeenpwned.com/api/v3/a")
+    second = await manager.get("https://api.dehashed.com/search")
+    assert first.json() == {"ok": True}
+    assert second.status_code == 200
+    assert manager.clients_created == 1
+
+    client = manager.client()
+    await manager.aclose()
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_per_host_connection_limit():
+    active = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return httpx.Response(200)
+
+    manager = _manager(handler, host_policies={"limited.test": HostPolicy(max_connections=2)})
+    await asyncio.gather(*(manager.get("https://limited.test/x") for _ in range(6)))
+    assert peak == 2
+    await manager.aclose()
+
+
+def test_run_async_closes_pooled_client(monkeypatch):
+    import digital_footprint.http_client as http_client
+
+    manager = _manager(lambda request: httpx.Response(200))
+    monkeypatch.setattr(http_client, "_manager", manager)
+    clients = []
+
+    async def work():
+        await manager.get("https://example.test/")
+        clients.append(manager.client())
+        return "done"
+
+    assert run_async(work()) == "done"
+    assert clients[0].is_closed
@@ -0,0 +1,152 @@
+"""Tests for the HTTP-first broker fetch path."""
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from digital_footprint.broker_registry import validate_broker_yaml
+from digital_footprint.models import Broker
+from digital_footprint.scanners.broker_scanner import scan_broker
+from digital_footprint.scanners.http_fetcher import (
+    HttpFetchResult,
+    fetch_http,
+    html_to_text,
+    looks_like_block_page,
+    looks_like_js_shell,
+)
+
+RESULTS_HTML = (
+    "<html><head><title>Results</title><script>var x = 'John Doe';</script></head><body>"
+    "<h1>People named John Doe</h1>"
+    + "<div class='card'>John Doe, age 35, lives in San Francisco, CA. Relatives: Jane Doe.</div>" * 5
+    + "</body></html>"
+)
+SHELL_HTML = '<html><body><div id="root"></div><script src="/app.js"></script></body></html>'
+BLOCK_HTML = "<html><body><h1>Just a moment...</h1><div class='cf-turnstile'></div></body></html>"
+CHALLENGE_HTML = (
+    "<html><head><title>Checking</title><script>window._cf_chl_opt = {cType: 'managed'};</script></head>"
+    "<body><form id=\"challenge-form\" action=\"/\"></form></body></html>"
+)
+# A normal results page that embeds captcha widgets for its contact form
+CAPTCHA_WIDGET_HTML = RESULTS_HTML.replace(
+    "</body>",
+    '<script src="https://www.google.com/recaptcha/api.js"></script>'
+    '<script src="https://js.hcaptcha.com/1/api.js"></script>'
+    '<div class="g-recaptcha h-captcha" data-sitekey="x"></div>'
+    "<small>This site is protected by reCAPTCHA.</small></body>",
+)
+
+
+def test_html_to_text_strips_scripts_and_tags():
+    text = html_to_text("<p>Hello&nbsp;<b>John</b></p><script>alert('x')</script><style>p{}</style>")
+    assert text == "Hello John"
+
+
+def test_looks_like_js_shell():
+    assert looks_like_js_shell(SHELL_HTML, html_to_text(SHELL_HTML)) is True
+    assert looks_like_js_shell(RESULTS_HTML, html_to_text(RESULTS_HTML)) is False
+
+
+def test_looks_like_block_page():
+    assert looks_like_block_page(200, BLOCK_HTML) is True
+    assert looks_like_block_page(403, "<html></html>") is True
+    assert looks_like_block_page(200, RESULTS_HTML) is False
+    assert looks_like_block_page(200, CHALLENGE_HTML) is True
+
+
+def test_captcha_script_on_results_page_is_not_a_block():
+    assert looks_like_block_page(200, CAPTCHA_WIDGET_HTML) is False
+    result = HttpFetchResult(
+        url="u", status_code=200, html=CAPTCHA_WIDGET_HTML, text=html_to_text(CAPTCHA_WIDGET_HTML)
+    )
+    assert result.needs_browser is False
+
+
+def test_fetch_result_needs_browser():
+    ok = HttpFetchResult(url="u", status_code=200, html=RESULTS_HTML, text=html_to_text(RESULTS_HTML))
+    assert ok.needs_browser is False
+    shell = HttpFetchResult(url="u", status_code=200, html=SHELL_HTML, text=html_to_text(SHELL_HTML))
+    assert shell.needs_browser is True
+    server_error = HttpFetchResult(url="u", status_code=500, html=RESULTS_HTML, text="x" * 300)
+    assert server_error.needs_browser is True
+
+
+@pytest.mark.asyncio
+async def test_fetch_http_with_client():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text=RESULTS_HTML))
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await fetch_http("https://broker.test/John-Doe", client=client)
+    assert result.status_code == 200
+    assert "John Doe, age 35" in result.text
+    assert "var x" not in result.text
+
+
+def test_broker_from_yaml_reads_search_section():
+    broker = Broker.from_yaml("test", {
+        "name": "Test", "url": "https://test.com", "category": "people_search",
+        "search": {"url_pattern": "https://test.com/{first}-{last}", "render_mode": "auto"},
+    })
+    assert broker.search_url_pattern == "https://test.com/{first}-{last}"
+    assert broker.render_mode == "auto"
+    default = Broker.from_yaml("plain", {"name": "P", "url": "https://p.com", "category": "marketing"})
+    assert default.render_mode == "browser"
+
+
+def test_validate_render_mode():
+    errors = validate_broker_yaml({
+        "name": "Test", "url": "https://test.com", "category": "people_search",
+        "search": {"render_mode": "curl"},
+    })
+    assert any("render_mode" in e for e in errors)
+
+
+async def _scan(render_mode, fetched):
+    with patch("digital_footprint.scanners.http_fetcher.fetch_http", new_callable=AsyncMock) as mock_fetch, \
+         patch("digital_footprint.scanners.broker_scanner._browser_page_text", new_callable=AsyncMock) as mock_browser, \
+         patch("digital_footprint.scanners.playwright_scanner.random_delay", new_callable=AsyncMock):
+        mock_fetch.return_value = fetched
+        mock_browser.return_value = "Browser rendered: John Doe of Austin, TX"
+        result = await scan_broker(
+            broker_slug="test",
+            broker_name="Test",
+            url_pattern="https://broker.test/{first}-{last}",
+            first_name="John",
+            last_name="Doe",
+            render_mode=render_mode,
+        )
+    return result, mock_fetch, mock_browser
+
+
+@pytest.mark.asyncio
+async def test_scan_broker_http_mode_skips_browser():
+    fetched = HttpFetchResult(url="u", status_code=200, html=RESULTS_HTML, text=html_to_text(RESULTS_HTML))
+    result, mock_fetch, mock_browser = await _scan("http", fetched)
+    assert result.found is True
+    assert result.render_mode == "http"
+    mock_browser.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_scan_broker_auto_escalates_on_js_shell():
+    fetched = HttpFetchResult(url="u", status_code=200, html=SHELL_HTML, text=html_to_text(SHELL_HTML))
+    result, mock_fetch, mock_browser = await _scan("auto", fetched)
+    assert result.found is True
+    assert result.render_mode == "browser"
+    mock_fetch.assert_awaited_once()
+    mock_browser.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_scan_broker_auto_stays_on_http_for_server_rendered_page():
+    fetched = HttpFetchResult(url="u", status_code=200, html=RESULTS_HTML, text=html_to_text(RESULTS_HTML))
+    result, mock_fetch, mock_browser = await _scan("auto", fetched)
+    assert result.render_mode == "http"
+    mock_browser.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_scan_broker_http_mode_reports_block_status():
+    fetched = HttpFetchResult(url="u", status_code=403, html="denied", text="denied")
+    result, _, _ = await _scan("http", fetched)
+    assert result.found is False
+    assert "403" in result.error
@@ -0,0 +1,83 @@
+"""Tests for the compiled person name matcher."""
+
+from digital_footprint.scanners.name_matcher import (
+    NameMatcher,
+    compile_matcher,
+    first_name_variants,
+    last_name_variants,
+)
+from digital_footprint.scanners.broker_scanner import check_name_in_results
+
+
+def test_first_name_variants_are_symmetric():
+    assert {"william", "bill", "will"} <= first_name_variants("William")
+    assert "william" in first_name_variants("Bill")
+
+
+def test_last_name_variants_hyphenated_and_maiden():
+    variants = last_name_variants("Smith-Jones", maiden_names=["Miller"])
+    assert variants == {"smith-jones", "smith jones", "smith", "jones", "miller"}
+
+
+def test_full_name_with_span():
+    text = "Results: John Doe, age 35"
+    result = NameMatcher("John", "Doe").search(text)
+    assert result.found is True
+    match = result.matches[0]
+    assert match.variant == "full"
+    assert text[match.start:match.end] == "John Doe"
+
+
+def test_middle_initial_nickname_and_reversed_forms():
+    matcher = NameMatcher("William", "Doe", middle="Henry")
+    assert matcher.search("Bill H. Doe lives here").matches[0].variant == "full"
+    assert matcher.search("William Henry Doe").found is True
+    assert matcher.search("DOE, WILLIAM - Springfield").matches[0].variant == "reversed"
+    assert matcher.search("W. Doe, 42").matches[0].variant == "initial"
+
+
+def test_maiden_and_hyphenated_surnames():
+    matcher = NameMatcher("Jane", "Smith-Jones", maiden_names=("Miller",))
+    assert matcher.search("Jane Miller, Portland").found is True
+    assert matcher.search("Jane Smith Jones").found is True
+    assert matcher.search("Jane Jones").found is True
+
+
+def test_far_apart_names_not_found():
+    text = "John Williams lives next door. " + "x " * 100 + "Mary Doe"
+    result = NameMatcher("John", "Doe").search(text)
+    assert result.matches == []
+    assert result.proximity > 12
+    assert result.found is False
+
+
+def test_close_tokens_count_via_proximity():
+    result = NameMatcher("John", "Doe").search("John (aka JD) Doe")
+    assert result.matches == []
+    assert result.proximity == 10
+    assert result.found is True
+
+
+def test_word_boundaries():
+    assert NameMatcher("Jon", "Doe").search("Jonas Doering").found is False
+
+
+def test_from_full_name():
+    matcher = NameMatcher.from_full_name("Mary Ann Smith")
+    assert matcher.search("Mary Ann Smith").found is True
+    assert matcher.search("Mary A. Smith").found is True
+
+
+def test_empty_name_never_matches():
+    for matcher in (NameMatcher("", ""), NameMatcher("  ", " "), NameMatcher.from_full_name("")):
+        assert matcher.search("John Doe, 44, Austin TX").found is False
+    assert check_name_in_results("John Doe", "", "") is False
+
+
+def test_compile_matcher_is_cached():
+    assert compile_matcher("John", "Doe") is compile_matcher("John", "Doe")
+
+
+def test_check_name_in_results_uses_variants():
+    assert check_name_in_results("Johnny Doe, 44, Austin TX", "John", "Doe") is True
+    assert check_name_in_results("John Smith ... Jane Doe", "John", "Doe") is False
@@ -0,0 +1,177 @@
+"""Tests for the on-disk broker page cache."""
+
+import time
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from digital_footprint.scanners.broker_scanner import PageFetch, scan_broker
+from digital_footprint.scanners.page_cache import PageCache, cache_ttl_for
+from digital_footprint.removers.verification import RemovalVerifier
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = PageCache(tmp_path / "pages.db")
+    yield c
+    c.close()
+
+
+def test_cache_roundtrip_and_counters(cache):
+    assert cache.get("https://spokeo.com/John-Doe", "browser") is None
+    cache.put("https://spokeo.com/John-Doe", "browser", "John Doe, age 35", ttl_seconds=60)
+    assert cache.get("https://spokeo.com/John-Doe", "browser") == "John Doe, age 35"
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+
+def test_cache_keyed_by_render_mode(cache):
+    cache.put("https://spokeo.com/John-Doe", "http", "shell", ttl_seconds=60)
+    assert cache.get("https://spokeo.com/John-Doe", "browser") is None
+
+
+def test_cache_entries_expire(cache):
+    cache.put("https://spokeo.com/John-Doe", "browser", "text", ttl_seconds=60)
+    with patch("digital_footprint.sqlite_cache.time.time", return_value=time.time() + 120):
+        assert cache.get("https://spokeo.com/John-Doe", "browser") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_cache_stores_compressed(cache):
+    text = "John Doe lives in San Francisco. " * 500
+    cache.put("https://spokeo.com/John-Doe", "browser", text, ttl_seconds=60)
+    assert cache.stats()["stored_bytes"] < len(text) / 10
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    import os
+    cache = PageCache(tmp_path / "pages.db", max_bytes=1800)
+    for i in range(3):
+        cache.put(f"https://b{i}.com/x", "browser", os.urandom(500).hex(), ttl_seconds=60)
+        time.sleep(0.01)
+    # Touch the oldest entry so b1 becomes least recently used
+    assert cache.get("https://b0.com/x", "browser") is not None
+    cache.put("https://b3.com/x", "browser", os.urandom(500).hex(), ttl_seconds=60)
+
+    assert cache.get("https://b1.com/x", "browser") is None
+    assert cache.get("https://b0.com/x", "browser") is not None
+    assert cache.stats()["evictions"] >= 1
+    cache.close()
+
+
+def test_cache_ttl_for_broker():
+    assert cache_ttl_for({"recheck_days": 7}) == 7 * 24 * 3600
+    assert cache_ttl_for({"recheck_days": 7, "cache_ttl_hours": 12}) == 12 * 3600
+    assert cache_ttl_for({}) == 30 * 24 * 3600
+
+
+@pytest.mark.asyncio
+async def test_scan_broker_serves_repeat_from_cache(cache):
+    with patch("digital_footprint.scanners.broker_scanner._fetch_page_text", new_callable=AsyncMock) as mock_fetch, \
+         patch("digital_footprint.scanners.playwright_scanner.random_delay", new_callable=AsyncMock):
+        mock_fetch.return_value = PageFetch("Results: John Doe, Austin TX", "browser")
+        first = await scan_broker("spokeo", "Spokeo", "https://spokeo.com/{first}-{last}", "John", "Doe", cache=cache)
+        second = await scan_broker("spokeo", "Spokeo", "https://spokeo.com/{first}-{last}", "John", "Doe", cache=cache)
+
+    assert mock_fetch.await_count == 1
+    assert first.cached is False
+    assert second.cached is True
+    assert second.found is True
+
+
+@pytest.mark.asyncio
+async def test_verify_single_can_bypass_cache(cache):
+    cache.put("https://spokeo.com/John-Doe", "browser", "John Doe listed", ttl_seconds=3600)
+    removal = {
+        "id": 1,
+        "broker_slug": "spokeo",
+        "broker_name": "Spokeo",
+        "person_first_name": "John",
+        "person_last_name": "Doe",
+        "search_url_pattern": "https://spokeo.com/{first}-{last}",
+        "attempts": 0,
+    }
+    verifier = RemovalVerifier(cache=cache)
+    with patch("digital_footprint.scanners.broker_scanner._fetch_page_text", new_callable=AsyncMock) as mock_fetch, \
+         patch("digital_footprint.scanners.playwright_scanner.random_delay", new_callable=AsyncMock):
+        mock_fetch.return_value = PageFetch("No records found", "browser")
+        cached_result = await verifier.verify_single(removal)
+        fresh_result = await verifier.verify_single(removal, bypass_cache=True)
+
+    assert cached_result["status"] == "still_found"
+    assert fresh_result["status"] == "confirmed"
+    assert mock_fetch.await_count == 1
+    assert cache.get("https://spokeo.com/John-Doe", "browser") == "No records found"
+
+
+@pytest.mark.asyncio
+async def test_fetch_http_sends_validators():
+    import httpx
+    from digital_footprint.scanners.http_fetcher import fetch_http
+
+    seen = {}
+
+    def handler(request):
+        seen.update(request.headers)
+        return httpx.Response(304, headers={"etag": '"v1"'})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        result = await fetch_http("https://broker.test/x", client=client, etag='"v1"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+    assert seen["if-none-match"] == '"v1"'
+    assert seen["if-modified-since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert result.not_modified is True
+    assert result.needs_browser is False
+
+
+@pytest.mark.asyncio
+async def test_scan_broker_conditional_http_refetch(cache):
+    from digital_footprint.scanners.http_fetcher import HttpFetchResult
+
+    page = "Results: John Doe, Austin TX " + "x" * 300
+    responses = [
+        HttpFetchResult(url="u", status_code=200, html=page, text=page, etag='"v1"'),
+        HttpFetchResult(url="u", status_code=304, html="", text=""),
+    ]
+    with patch("digital_footprint.scanners.http_fetcher.fetch_http", new_callable=AsyncMock) as mock_fetch, \
+         patch("digital_footprint.scanners.playwright_scanner.random_delay", new_callable=AsyncMock):
+        mock_fetch.side_effect = responses
+        args = ("spokeo", "Spokeo", "https://spokeo.com/{first}-{last}", "John", "Doe")
+        first = await scan_broker(*args, render_mode="http", cache=cache)
+        cache.invalidate("https://spokeo.com/John-Doe", "http")  # force a re-fetch
+        second = await scan_broker(*args, render_mode="http", cache=cache)
+
+    assert mock_fetch.call_args.kwargs["etag"] == '"v1"'
+    assert first.outcome == "found"
+    assert second.unchanged is True
+    assert second.found is True
+    assert second.page_text == first.page_text
+    assert cache.get_state("spokeo", "https://spokeo.com/John-Doe").etag == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_scan_broker_browser_hash_unchanged_skips_matching(cache):
+    with patch("digital_footprint.scanners.broker_scanner._fetch_page_text", new_callable=AsyncMock) as mock_fetch, \
+         patch("digital_footprint.scanners.playwright_scanner.random_delay", new_callable=AsyncMock):
+        mock_fetch.return_value = PageFetch("No   records found", "browser")
+        await scan_broker("spokeo", "Spokeo", "https://spokeo.com/{first}-{last}", "John", "Doe", cache=cache)
+        cache.invalidate("https://spokeo.com/John-Doe", "browser")
+        mock_fetch.return_value = PageFetch("No records found", "browser")
+        with patch("digital_footprint.scanners.broker_scanner.check_name_in_results") as mock_match:
+            result = await scan_broker("spokeo", "Spokeo", "https://spokeo.com/{first}-{last}", "John", "Doe", cache=cache)
+
+    mock_match.assert_not_called()
+    assert result.outcome == "unchanged"
+    assert result.found is False
+
+
+def test_summarize_outcomes():
+    from digital_footprint.scanners.broker_scanner import BrokerScanResult, summarize_outcomes
+
+    results = [
+        BrokerScanResult("a", "A", "u", found=True),
+        BrokerScanResult("b", "B", "u", found=True, unchanged=True),
+        BrokerScanResult("c", "C", "u", found=False, cached=True),
+        BrokerScanResult("d", "D", "u", found=False, error="boom"),
+    ]
+    assert summarize_outcomes(results) == {"found": 1, "not_found": 0, "unchanged": 1, "cached": 1, "skipped": 0, "error": 1}
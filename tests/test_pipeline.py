@@ -46,15 +46,15 @@ def test_protect_person_runs_breach_check():
     config = Config()
     config.hibp_api_key = "test-key"
 
-    with patch("digital_footprint.pipeline.pipeline.scan_breaches", new_callable=AsyncMock) as mock_breach:
-        mock_breach.return_value = {
-            "email": "test@example.com",
-            "hibp_breaches": [{"name": "TestBreach", "severity": "high", "breach_date": "2024-01-01", "data_classes": ["Passwords"]}],
-            "hibp_count": 1,
-            "dehashed_records": [],
-            "dehashed_count": 0,
-            "total": 1,
-        }
+    with patch("digital_footprint.pipeline.pipeline.scan_breaches_many", new_callable=AsyncMock) as mock_breach:
+        mock_breach.return_value = {"results": [{
+                "email": "test@example.com",
+                "hibp_breaches": [{"name": "TestBreach", "severity": "high", "breach_date": "2024-01-01", "data_classes": ["Passwords"]}],
+                "hibp_count": 1,
+                "dehashed_records": [],
+                "dehashed_count": 0,
+                "total": 1,
+        }], "errors": {"hibp": {}, "dehashed": {}}}
         with patch("digital_footprint.pipeline.pipeline.run_dark_web_scan", new_callable=AsyncMock) as mock_dark:
             mock_dark.return_value = {
                 "email": "test@example.com",
@@ -72,12 +72,12 @@ def test_protect_person_runs_dark_web():
     db.insert_person(name="Test User", emails=["test@example.com"])
     config = Config()
 
-    with patch("digital_footprint.pipeline.pipeline.scan_breaches", new_callable=AsyncMock) as mock_breach:
-        mock_breach.return_value = {
-            "email": "test@example.com",
-            "hibp_breaches": [], "hibp_count": 0,
-            "dehashed_records": [], "dehashed_count": 0, "total": 0,
-        }
+    with patch("digital_footprint.pipeline.pipeline.scan_breaches_many", new_callable=AsyncMock) as mock_breach:
+        mock_breach.return_value = {"results": [{
+                "email": "test@example.com",
+                "hibp_breaches": [], "hibp_count": 0,
+                "dehashed_records": [], "dehashed_count": 0, "total": 0,
+        }], "errors": {"hibp": {}, "dehashed": {}}}
         with patch("digital_footprint.pipeline.pipeline.run_dark_web_scan", new_callable=AsyncMock) as mock_dark:
             mock_dark.return_value = {
                 "email": "test@example.com",
@@ -96,12 +96,12 @@ def test_protect_person_stores_pipeline_run():
     db.insert_person(name="Test User", emails=["test@example.com"])
     config = Config()
 
-    with patch("digital_footprint.pipeline.pipeline.scan_breaches", new_callable=AsyncMock) as mock_breach:
-        mock_breach.return_value = {
-            "email": "test@example.com",
-            "hibp_breaches": [], "hibp_count": 0,
-            "dehashed_records": [], "dehashed_count": 0, "total": 0,
-        }
+    with patch("digital_footprint.pipeline.pipeline.scan_breaches_many", new_callable=AsyncMock) as mock_breach:
+        mock_breach.return_value = {"results": [{
+                "email": "test@example.com",
+                "hibp_breaches": [], "hibp_count": 0,
+                "dehashed_records": [], "dehashed_count": 0, "total": 0,
+        }], "errors": {"hibp": {}, "dehashed": {}}}
         with patch("digital_footprint.pipeline.pipeline.run_dark_web_scan", new_callable=AsyncMock) as mock_dark:
             mock_dark.return_value = {
                 "email": "test@example.com",
@@ -120,12 +120,12 @@ def test_protect_person_generates_report():
     db.insert_person(name="Test User", emails=["test@example.com"])
     config = Config()
 
-    with patch("digital_footprint.pipeline.pipeline.scan_breaches", new_callable=AsyncMock) as mock_breach:
-        mock_breach.return_value = {
-            "email": "test@example.com",
-            "hibp_breaches": [], "hibp_count": 0,
-            "dehashed_records": [], "dehashed_count": 0, "total": 0,
-        }
+    with patch("digital_footprint.pipeline.pipeline.scan_breaches_many", new_callable=AsyncMock) as mock_breach:
+        mock_breach.return_value = {"results": [{
+                "email": "test@example.com",
+                "hibp_breaches": [], "hibp_count": 0,
+                "dehashed_records": [], "dehashed_count": 0, "total": 0,
+        }], "errors": {"hibp": {}, "dehashed": {}}}
         with patch("digital_footprint.pipeline.pipeline.run_dark_web_scan", new_callable=AsyncMock) as mock_dark:
             mock_dark.return_value = {
                 "email": "test@example.com",
@@ -136,3 +136,32 @@ def test_protect_person_generates_report():
 
     assert "Exposure Report" in result.report
     assert "Test User" in result.report
+
+
+def test_protect_person_saves_broker_findings(tmp_path):
+    from digital_footprint.broker_registry import load_all_brokers
+    from digital_footprint.scanners.broker_scanner import BrokerScanResult
+
+    (tmp_path / "spokeo.yaml").write_text(
+        "name: Spokeo\nurl: https://spokeo.com\ncategory: people_search\n"
+        "search:\n  url_pattern: https://spokeo.com/{first}-{last}\n"
+    )
+    db = make_test_db()
+    config = Config(brokers_dir=tmp_path)
+    for broker in load_all_brokers(tmp_path):
+        db.insert_broker(broker)
+    person_id = db.insert_person(name="John Doe")
+
+    def _scan(found):
+        return [BrokerScanResult("spokeo", "Spokeo", "https://spokeo.com/John-Doe", found=found, page_text="John Doe")]
+
+    with patch("digital_footprint.pipeline.pipeline.scan_all_brokers", new_callable=AsyncMock) as mock_scan:
+        mock_scan.return_value = _scan(True)
+        result = protect_person(person_id=person_id, db=db, config=config)
+        assert mock_scan.call_args.args[1:3] == ("John", "Doe")
+        assert "spokeo.com/John-Doe" in result.report
+        assert len(db.get_findings(person_id, status="active")) == 1
+
+        mock_scan.return_value = _scan(False)
+        protect_person(person_id=person_id, db=db, config=config)
+    assert len(db.get_findings(person_id, status="disappeared")) == 1
@@ -5,6 +5,7 @@ from unittest.mock import patch, AsyncMock, MagicMock
 from digital_footprint.config import Config
 from digital_footprint.pipeline.pipeline import protect_person
 from digital_footprint.pipeline.alerter import check_and_alert, should_alert
+from digital_footprint.scanners.username_scanner import UsernameResult, UsernameScan
 from tests.conftest import make_test_db
 
 
@@ -15,15 +16,15 @@ def test_full_pipeline_end_to_end():
     config = Config()
     config.hibp_api_key = "test-key"
 
-    with patch("digital_footprint.pipeline.pipeline.scan_breaches", new_callable=AsyncMock) as mock_breach:
-        mock_breach.return_value = {
-            "email": "int@example.com",
-            "hibp_breaches": [
-                {"name": "MegaBreach", "title": "MegaBreach", "breach_date": "2024-06-01",
-                 "data_classes": ["Passwords", "Email addresses"], "severity": "critical"},
-            ],
-            "hibp_count": 1, "dehashed_records": [], "dehashed_count": 0, "total": 1,
-        }
+    with patch("digital_footprint.pipeline.pipeline.scan_breaches_many", new_callable=AsyncMock) as mock_breach:
+        mock_breach.return_value = {"results": [{
+                "email": "int@example.com",
+                "hibp_breaches": [
+                    {"name": "MegaBreach", "title": "MegaBreach", "breach_date": "2024-06-01",
+                     "data_classes": ["Passwords", "Email addresses"], "severity": "critical"},
+                ],
+                "hibp_count": 1, "dehashed_records": [], "dehashed_count": 0, "total": 1,
+        }], "errors": {"hibp": {}, "dehashed": {}}}
         with patch("digital_footprint.pipeline.pipeline.run_dark_web_scan", new_callable=AsyncMock) as mock_dark:
             mock_dark.return_value = {
                 "email": "int@example.com",
@@ -32,7 +33,11 @@ def test_full_pipeline_end_to_end():
                 "holehe_results": [{"service": "Twitter", "category": "social", "risk_level": "medium"}],
                 "paste_count": 1, "ahmia_count": 0, "holehe_count": 1, "total": 2,
             }
-            result = protect_person(person_id=1, db=db, config=config)
+            with patch("digital_footprint.pipeline.pipeline.scan_username", new_callable=AsyncMock) as mock_user:
+                mock_user.return_value = UsernameScan(username="intuser", results=[
+                    UsernameResult(site_name="GitHub", url="https://github.com/intuser", tags=["coding"]),
+                ])
+                result = protect_person(person_id=1, db=db, config=config)
 
     # Verify pipeline result
     assert result.status == "completed"
@@ -93,11 +98,11 @@ def test_pipeline_multiple_emails():
     )
     config = Config()
 
-    with patch("digital_footprint.pipeline.pipeline.scan_breaches", new_callable=AsyncMock) as mock_breach:
-        mock_breach.return_value = {
-            "email": "x", "hibp_breaches": [], "hibp_count": 0,
-            "dehashed_records": [], "dehashed_count": 0, "total": 0,
-        }
+    with patch("digital_footprint.pipeline.pipeline.scan_breaches_many", new_callable=AsyncMock) as mock_breach:
+        mock_breach.return_value = {"results": [{
+                "email": "x", "hibp_breaches": [], "hibp_count": 0,
+                "dehashed_records": [], "dehashed_count": 0, "total": 0,
+        }], "errors": {"hibp": {}, "dehashed": {}}}
         with patch("digital_footprint.pipeline.pipeline.run_dark_web_scan", new_callable=AsyncMock) as mock_dark:
             mock_dark.return_value = {
                 "email": "x", "pastes": [], "ahmia_results": [], "holehe_results": [],
@@ -105,7 +110,8 @@ def test_pipeline_multiple_emails():
             }
             result = protect_person(person_id=1, db=db, config=config)
 
-    # scan_breaches should be called twice (once per email)
-    assert mock_breach.call_count == 2
+    # Both emails go to scan_breaches_many in a single batch
+    assert mock_breach.call_count == 1
+    assert mock_breach.call_args.args[0] == ["first@example.com", "second@example.com"]
     assert mock_dark.call_count == 2
     assert result.status == "completed"
@@ -22,12 +22,12 @@ def test_do_protect_success():
     from digital_footprint.config import Config
     config = Config()
 
-    with patch("digital_footprint.pipeline.pipeline.scan_breaches", new_callable=AsyncMock) as mock_breach:
-        mock_breach.return_value = {
-            "email": "test@example.com",
-            "hibp_breaches": [], "hibp_count": 0,
-            "dehashed_records": [], "dehashed_count": 0, "total": 0,
-        }
+    with patch("digital_footprint.pipeline.pipeline.scan_breaches_many", new_callable=AsyncMock) as mock_breach:
+        mock_breach.return_value = {"results": [{
+                "email": "test@example.com",
+                "hibp_breaches": [], "hibp_count": 0,
+                "dehashed_records": [], "dehashed_count": 0, "total": 0,
+        }], "errors": {"hibp": {}, "dehashed": {}}}
         with patch("digital_footprint.pipeline.pipeline.run_dark_web_scan", new_callable=AsyncMock) as mock_dark:
             mock_dark.return_value = {
                 "email": "test@example.com",
@@ -47,12 +47,12 @@ def test_do_protect_returns_risk_score():
     from digital_footprint.config import Config
     config = Config()
 
-    with patch("digital_footprint.pipeline.pipeline.scan_breaches", new_callable=AsyncMock) as mock_breach:
-        mock_breach.return_value = {
-            "email": "test@example.com",
-            "hibp_breaches": [], "hibp_count": 0,
-            "dehashed_records": [], "dehashed_count": 0, "total": 0,
-        }
+    with patch("digital_footprint.pipeline.pipeline.scan_breaches_many", new_callable=AsyncMock) as mock_breach:
+        mock_breach.return_value = {"results": [{
+                "email": "test@example.com",
+                "hibp_breaches": [], "hibp_count": 0,
+                "dehashed_records": [], "dehashed_count": 0, "total": 0,
+        }], "errors": {"hibp": {}, "dehashed": {}}}
         with patch("digital_footprint.pipeline.pipeline.run_dark_web_scan", new_callable=AsyncMock) as mock_dark:
             mock_dark.return_value = {
                 "email": "test@example.com",
@@ -0,0 +1,133 @@
+"""Tests for the offline Pwned Passwords range store."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from digital_footprint.http_client import HttpClientManager
+from digital_footprint.scanners.pwned_passwords import (
+    PwnedPasswordsStore,
+    check_hashes,
+    parse_range,
+    sha1_hex,
+)
+
+# sha1("password")
+PASSWORD_SHA1 = "5BAA61E4C9B93F3F0682250B6CF8331B7EE68FD8"
+RANGE_BODY = (
+    "003D68EB55068C33ACE09247EE4C639306B:3\r\n"
+    "1E4C9B93F3F0682250B6CF8331B7EE68FD8:9545824\r\n"
+    "FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF:0\r\n"
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = PwnedPasswordsStore(tmp_path / "pwned")
+    yield s
+    s.close()
+
+
+def test_sha1_hex():
+    assert sha1_hex("password") == PASSWORD_SHA1
+
+
+def test_parse_range_drops_padding():
+    entries = parse_range(RANGE_BODY)
+    assert entries == {
+        "003D68EB55068C33ACE09247EE4C639306B": 3,
+        "1E4C9B93F3F0682250B6CF8331B7EE68FD8": 9545824,
+    }
+
+
+def test_put_range_and_lookup(store):
+    store.put_range("5baa6", parse_range(RANGE_BODY))
+    assert store.has_range("5BAA6")
+    assert store.lookup(PASSWORD_SHA1) == 9545824
+    assert store.lookup("5BAA6" + "0" * 35) == 0
+    assert store.lookup("00000" + "0" * 35) is None
+    assert store.range("5BAA6") == parse_range(RANGE_BODY)
+
+
+def test_empty_range_is_stored(store):
+    store.put_range("00000", {})
+    assert store.range("00000") == {}
+    assert store.lookup("00000" + "A" * 35) == 0
+
+
+def test_store_persists_and_compacts(tmp_path):
+    path = tmp_path / "pwned"
+    store = PwnedPasswordsStore(path)
+    store.put_range("5BAA6", {"0" * 35: 1})
+    store.put_range("5BAA6", parse_range(RANGE_BODY))
+    before = store.stats()["data_bytes"]
+    store.compact()
+    assert store.stats()["data_bytes"] < before
+    store.close()
+
+    reopened = PwnedPasswordsStore(path)
+    assert reopened.lookup(PASSWORD_SHA1) == 9545824
+    assert reopened.stats()["ranges"] == 1
+    assert reopened.stats()["hashes"] == 2
+    reopened.close()
+
+
+def test_load_dump_from_ordered_file(store, tmp_path):
+    dump = tmp_path / "pwned-passwords-sha1-ordered-by-hash.txt"
+    dump.write_text(
+        "00000A94A8FE5CCB19BA61C4C0873D391E987982:12\n"
+        "00000B94A8FE5CCB19BA61C4C0873D391E987982:1\n"
+        f"{PASSWORD_SHA1}:9545824\n"
+    )
+    assert store.load_dump(dump) == 2
+    assert store.lookup("00000A94A8FE5CCB19BA61C4C0873D391E987982") == 12
+    assert store.lookup(PASSWORD_SHA1) == 9545824
+
+
+def test_load_dump_rejects_prevalence_ordered_file(store, tmp_path):
+    dump = tmp_path / "pwned-passwords-sha1-ordered-by-count.txt"
+    dump.write_text(
+        f"{PASSWORD_SHA1}:9545824\n"
+        "00000A94A8FE5CCB19BA61C4C0873D391E987982:12\n"
+        "5BAA6FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF:1\n"
+    )
+    with pytest.raises(ValueError, match="not ordered by hash"):
+        store.load_dump(dump)
+
+
+def test_load_dump_from_range_directory(store, tmp_path):
+    ranges = tmp_path / "ranges"
+    ranges.mkdir()
+    (ranges / "5BAA6.txt").write_text(RANGE_BODY)
+    (ranges / "README.md").write_text("not a range")
+    assert store.load_dump(ranges) == 1
+    assert store.lookup(PASSWORD_SHA1) == 9545824
+
+
+@pytest.mark.asyncio
+async def test_check_hashes_downloads_missing_ranges_once(store):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, text=RANGE_BODY)
+
+    manager = HttpClientManager(transport=httpx.MockTransport(handler))
+    with patch("digital_footprint.scanners.pwned_passwords.get_http_client", return_value=manager):
+        first = await check_hashes([PASSWORD_SHA1, "5BAA6" + "0" * 35, "$2a$10$notsha1"], store=store)
+        second = await check_hashes([PASSWORD_SHA1], store=store)
+
+    assert first == {PASSWORD_SHA1: 9545824, "5BAA6" + "0" * 35: 0}
+    assert second == {PASSWORD_SHA1: 9545824}
+    assert len(requests) == 1
+    assert requests[0].url.path == "/range/5BAA6"
+    assert requests[0].headers["add-padding"] == "true"
+
+
+@pytest.mark.asyncio
+async def test_check_hashes_offline_never_fetches(store):
+    with patch("digital_footprint.scanners.pwned_passwords.fetch_range") as fetch:
+        result = await check_hashes([PASSWORD_SHA1], store=store, offline=True)
+    assert result == {PASSWORD_SHA1: None}
+    fetch.assert_not_called()
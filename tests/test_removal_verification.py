@@ -8,7 +8,7 @@ from digital_footprint.removers.verification import RemovalVerifier
 @pytest.mark.asyncio
 @patch("digital_footprint.removers.verification.scan_broker")
 async def test_verify_confirmed(mock_scan):
-    mock_scan.return_value = MagicMock(found=False)
+    mock_scan.return_value = MagicMock(skipped=False, found=False, error=None)
 
     verifier = RemovalVerifier()
     result = await verifier.verify_single(
@@ -28,7 +28,7 @@ async def test_verify_confirmed(mock_scan):
 @pytest.mark.asyncio
 @patch("digital_footprint.removers.verification.scan_broker")
 async def test_verify_still_found(mock_scan):
-    mock_scan.return_value = MagicMock(found=True)
+    mock_scan.return_value = MagicMock(skipped=False, found=True, error=None)
 
     verifier = RemovalVerifier()
     result = await verifier.verify_single(
@@ -49,7 +49,7 @@ async def test_verify_still_found(mock_scan):
 @pytest.mark.asyncio
 @patch("digital_footprint.removers.verification.scan_broker")
 async def test_verify_max_attempts_reached(mock_scan):
-    mock_scan.return_value = MagicMock(found=True)
+    mock_scan.return_value = MagicMock(skipped=False, found=True, error=None)
 
     verifier = RemovalVerifier()
     result = await verifier.verify_single(
@@ -69,7 +69,7 @@ async def test_verify_max_attempts_reached(mock_scan):
 @pytest.mark.asyncio
 @patch("digital_footprint.removers.verification.scan_broker")
 async def test_verify_scan_error(mock_scan):
-    mock_scan.return_value = MagicMock(found=False, error="Timeout")
+    mock_scan.return_value = MagicMock(skipped=False, found=False, error="Timeout")
 
     verifier = RemovalVerifier()
     result = await verifier.verify_single(
@@ -83,5 +83,25 @@ async def test_verify_scan_error(mock_scan):
             "attempts": 0,
         },
     )
-    # Not found but had error -- still counts as confirmed (conservative)
-    assert result["status"] == "confirmed"
+    # A failed scan must never confirm a removal
+    assert result["status"] == "error"
+    assert result["attempts"] == 1
+
+
+@pytest.mark.asyncio
+@patch("digital_footprint.removers.verification.scan_broker")
+async def test_verify_without_person_name(mock_scan):
+    verifier = RemovalVerifier()
+    result = await verifier.verify_single(
+        removal={
+            "id": 1,
+            "broker_slug": "spokeo",
+            "broker_name": "Spokeo",
+            "person_first_name": "",
+            "person_last_name": "",
+            "search_url_pattern": "https://spokeo.com/{first}-{last}",
+            "attempts": 0,
+        },
+    )
+    assert result["status"] == "error"
+    mock_scan.assert_not_called()
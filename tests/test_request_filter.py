@@ -0,0 +1,82 @@
+"""Tests for stealth-context request interception."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from digital_footprint.scanners.request_filter import (
+    ESTIMATED_BYTES,
+    ResourceBlocker,
+    is_tracker,
+)
+from digital_footprint.scanners.broker_scanner import scan_broker
+
+
+def _route(resource_type, url):
+    route = MagicMock()
+    route.request.resource_type = resource_type
+    route.request.url = url
+    route.abort = AsyncMock()
+    route.continue_ = AsyncMock()
+    return route
+
+
+def test_is_tracker_matches_subdomains():
+    assert is_tracker("https://www.google-analytics.com/collect") is True
+    assert is_tracker("https://stats.g.doubleclick.net/x") is True
+    assert is_tracker("https://www.spokeo.com/search") is False
+
+
+def test_block_reason():
+    blocker = ResourceBlocker()
+    assert blocker.block_reason("image", "https://spokeo.com/a.png") == "image"
+    assert blocker.block_reason("font", "https://spokeo.com/a.woff2") == "font"
+    assert blocker.block_reason("script", "https://www.googletagmanager.com/gtm.js") == "tracker"
+    assert blocker.block_reason("document", "https://spokeo.com/John-Doe") is None
+    assert blocker.block_reason("script", "https://spokeo.com/app.js") is None
+
+
+@pytest.mark.asyncio
+async def test_handle_aborts_and_counts():
+    blocker = ResourceBlocker()
+    img = _route("image", "https://spokeo.com/photo.jpg")
+    doc = _route("document", "https://spokeo.com/John-Doe")
+    tracker = _route("script", "https://connect.facebook.net/fbevents.js")
+
+    for route in (img, doc, tracker):
+        await blocker._handle(route)
+
+    img.abort.assert_awaited_once()
+    tracker.abort.assert_awaited_once()
+    doc.continue_.assert_awaited_once()
+    stats = blocker.stats.to_dict()
+    assert stats["blocked_requests"] == 2
+    assert stats["allowed_requests"] == 1
+    assert stats["by_category"] == {"image": 1, "tracker": 1}
+    assert stats["estimated_bytes_saved"] == ESTIMATED_BYTES["image"] + ESTIMATED_BYTES["tracker"]
+
+
+@pytest.mark.asyncio
+async def test_install_routes_all_requests():
+    context = AsyncMock()
+    blocker = ResourceBlocker()
+    await blocker.install(context)
+    context.route.assert_awaited_once_with("**/*", blocker._handle)
+
+
+def test_allowlist():
+    blocker = ResourceBlocker(allowlist={"zillow"})
+    assert blocker.applies_to("zillow") is False
+    assert blocker.applies_to("spokeo") is True
+
+
+@pytest.mark.asyncio
+async def test_scan_broker_skips_blocker_for_allowlisted_broker():
+    blocker = ResourceBlocker(allowlist={"spokeo"})
+    with patch("digital_footprint.scanners.broker_scanner._browser_page_text", new_callable=AsyncMock) as mock_browser, \
+         patch("digital_footprint.scanners.playwright_scanner.random_delay", new_callable=AsyncMock):
+        mock_browser.return_value = "John Doe"
+        await scan_broker("spokeo", "Spokeo", "https://spokeo.com/{first}-{last}", "John", "Doe", blocker=blocker)
+        assert mock_browser.call_args.args[3] is None
+
+        await scan_broker("radaris", "Radaris", "https://radaris.com/{first}-{last}", "John", "Doe", blocker=blocker)
+        assert mock_browser.call_args.args[3] is blocker
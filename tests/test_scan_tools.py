@@ -7,7 +7,9 @@ import pytest
 from digital_footprint.tools.scan_tools import (
     do_breach_check,
     do_exposure_report,
+    do_google_dork,
 )
+from digital_footprint.scanners.google_dorker import DorkResult
 
 
 @pytest.mark.asyncio
@@ -35,6 +37,55 @@ async def test_do_breach_check_with_hibp_key():
     assert parsed["total"] == 0
 
 
+@pytest.mark.asyncio
+async def test_do_breach_check_reports_provider_error():
+    with patch("digital_footprint.scanners.breach_scanner.check_hibp", new_callable=AsyncMock) as mock_hibp:
+        mock_hibp.side_effect = RuntimeError("401 Unauthorized")
+        result = await do_breach_check(email="test@example.com", hibp_api_key="bad-key")
+
+    parsed = json.loads(result)
+    assert parsed["total"] == 0
+    assert parsed["errors"] == {"hibp": "401 Unauthorized"}
+
+
+@pytest.mark.asyncio
+async def test_do_google_dork_without_backend_returns_queries():
+    parsed = json.loads(await do_google_dork(name="John Doe"))
+    assert parsed["count"] == len(parsed["queries"]) > 0
+    assert "SEARXNG_URL" in parsed["message"]
+
+
+@pytest.mark.asyncio
+async def test_do_google_dork_runs_planned_queries():
+    outcome = {
+        "queries": 3,
+        "results": [DorkResult(query='"John Doe"', url="https://pastebin.com/abc", title="Paste", snippet="")],
+        "high_risk": 1,
+        "errors": {},
+        "plan": {"requests": [{"query": '"John Doe"', "covers": ['"John Doe"']}], "pruned": [], "skipped_recent": []},
+        "requested": 3,
+        "cached": 0,
+    }
+    with patch("digital_footprint.tools.scan_tools.run_planned_dorks", new_callable=AsyncMock) as mock_run:
+        mock_run.return_value = outcome
+        parsed = json.loads(await do_google_dork(name="John Doe", searxng_url="http://searx.local"))
+
+    assert parsed["count"] == 1
+    assert parsed["results"][0]["risk"] == "high"
+    assert parsed["queries"] == ['"John Doe"']
+    assert mock_run.call_args.args[1].base_url == "http://searx.local"
+
+
+@pytest.mark.asyncio
+async def test_do_google_dork_for_person_merges_queries(tmp_db):
+    tmp_db.insert_person(name="John Doe", emails=["a@x.com", "b@y.com"], phones=["555-0100"])
+    parsed = json.loads(await do_google_dork(person_id=1, db=tmp_db))
+    assert parsed["name"] == "John Doe"
+    assert '"John Doe"' in parsed["queries"]
+    assert '"a@x.com" OR "b@y.com" OR "555-0100"' in parsed["queries"]
+    assert '"John Doe" "a@x.com"' in parsed["plan"]["pruned"]
+
+
 def test_do_exposure_report_minimal(tmp_db):
     tmp_db.insert_person(name="John Doe", emails=["john@example.com"])
     report = do_exposure_report(person_id=1, db=tmp_db)
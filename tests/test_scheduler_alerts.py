@@ -15,12 +15,12 @@ def test_breach_recheck_calls_alert_on_new():
     config.alert_email = "alerts@test.com"
 
     # First run: 0 previous breaches
-    with patch("digital_footprint.scheduler.jobs.scan_breaches", new_callable=AsyncMock) as mock_scan:
-        mock_scan.return_value = {
-            "email": "test@example.com",
-            "hibp_breaches": [{"name": "Breach1", "severity": "high"}],
-            "hibp_count": 1, "dehashed_records": [], "dehashed_count": 0, "total": 1,
-        }
+    with patch("digital_footprint.scheduler.jobs.scan_breaches_many", new_callable=AsyncMock) as mock_scan:
+        mock_scan.return_value = {"results": [{
+                "email": "test@example.com",
+                "hibp_breaches": [{"name": "Breach1", "severity": "high"}],
+                "hibp_count": 1, "dehashed_records": [], "dehashed_count": 0, "total": 1,
+        }], "errors": {"hibp": {}, "dehashed": {}}}
         with patch("digital_footprint.scheduler.jobs.check_and_alert") as mock_alert:
             result = job_breach_recheck(db, config)
             # Alert should be called since we found new breaches
@@ -33,12 +33,12 @@ def test_breach_recheck_no_alert_when_no_findings():
     config = Config()
     config.hibp_api_key = "test-key"
 
-    with patch("digital_footprint.scheduler.jobs.scan_breaches", new_callable=AsyncMock) as mock_scan:
-        mock_scan.return_value = {
-            "email": "test@example.com",
-            "hibp_breaches": [], "hibp_count": 0,
-            "dehashed_records": [], "dehashed_count": 0, "total": 0,
-        }
+    with patch("digital_footprint.scheduler.jobs.scan_breaches_many", new_callable=AsyncMock) as mock_scan:
+        mock_scan.return_value = {"results": [{
+                "email": "test@example.com",
+                "hibp_breaches": [], "hibp_count": 0,
+                "dehashed_records": [], "dehashed_count": 0, "total": 0,
+        }], "errors": {"hibp": {}, "dehashed": {}}}
         with patch("digital_footprint.scheduler.jobs.check_and_alert") as mock_alert:
             result = job_breach_recheck(db, config)
             mock_alert.assert_called_once_with(
@@ -57,12 +57,12 @@ def test_dark_web_calls_alert():
     config.alert_email = "alerts@test.com"
 
     with patch("digital_footprint.scheduler.jobs.run_dark_web_scan", new_callable=AsyncMock) as mock_scan:
-        mock_scan.return_value = {
-            "email": "test@example.com",
-            "pastes": [{"source": "Pastebin", "severity": "high"}],
-            "ahmia_results": [], "holehe_results": [],
-            "paste_count": 1, "ahmia_count": 0, "holehe_count": 0, "total": 1,
-        }
+        mock_scan.return_value = {"results": [{
+                "email": "test@example.com",
+                "pastes": [{"source": "Pastebin", "severity": "high"}],
+                "ahmia_results": [], "holehe_results": [],
+                "paste_count": 1, "ahmia_count": 0, "holehe_count": 0, "total": 1,
+        }], "errors": {"hibp": {}, "dehashed": {}}}
         with patch("digital_footprint.scheduler.jobs.check_and_alert") as mock_alert:
             result = job_dark_web_monitor(db, config)
             mock_alert.assert_called()
@@ -20,7 +20,7 @@ def test_full_scheduler_cycle():
     assert len(overdue) == len(JOB_INTERVALS)
 
     # 2. Run all jobs (mock external calls)
-    with patch("digital_footprint.scheduler.jobs.scan_breaches", new_callable=AsyncMock) as mock_breach, \
+    with patch("digital_footprint.scheduler.jobs.scan_breaches_many", new_callable=AsyncMock) as mock_breach, \
          patch("digital_footprint.scheduler.jobs.run_dark_web_scan", new_callable=AsyncMock) as mock_dark:
         mock_breach.return_value = {"email": "x", "hibp_breaches": [], "hibp_count": 0, "dehashed_records": [], "dehashed_count": 0, "total": 0}
         mock_dark.return_value = {"email": "x", "pastes": [], "ahmia_results": [], "holehe_results": [], "paste_count": 0, "ahmia_count": 0, "holehe_count": 0, "total": 0}
@@ -55,15 +55,15 @@ def test_job_breach_recheck_with_person():
     config = Config()
     config.hibp_api_key = "test-key"
 
-    with patch("digital_footprint.scheduler.jobs.scan_breaches", new_callable=AsyncMock) as mock_scan:
-        mock_scan.return_value = {
-            "email": "test@example.com",
-            "hibp_breaches": [],
-            "hibp_count": 0,
-            "dehashed_records": [],
-            "dehashed_count": 0,
-            "total": 0,
-        }
+    with patch("digital_footprint.scheduler.jobs.scan_breaches_many", new_callable=AsyncMock) as mock_scan:
+        mock_scan.return_value = {"results": [{
+                "email": "test@example.com",
+                "hibp_breaches": [],
+                "hibp_count": 0,
+                "dehashed_records": [],
+                "dehashed_count": 0,
+                "total": 0,
+        }], "errors": {"hibp": {}, "dehashed": {}}}
         result = job_breach_recheck(db, config)
 
     assert result.status == "success"
@@ -127,3 +127,74 @@ def test_job_generate_report_with_person(tmp_path):
     result = job_generate_report(db, config)
     assert result.status == "success"
     assert result.details["persons_reported"] == 1
+
+
+def _pending_removals(tmp_path, slugs):
+    """A database with one submitted removal due for verification per broker slug."""
+    from digital_footprint.broker_registry import load_all_brokers
+    from digital_footprint.config import Config
+    from digital_footprint.db import Database
+
+    brokers_dir = tmp_path / "brokers"
+    brokers_dir.mkdir()
+    for slug in slugs:
+        (brokers_dir / f"{slug}.yaml").write_text(
+            f"name: {slug.title()}\nurl: https://{slug}.com\ncategory: people_search\n"
+            f"search:\n  url_pattern: https://{slug}.com/{{first}}-{{last}}\n  render_mode: http\n"
+        )
+    config = Config(db_path=tmp_path / "test.db", brokers_dir=brokers_dir)
+    db = Database(config)
+    db.initialize()
+    for broker in load_all_brokers(brokers_dir):
+        db.insert_broker(broker)
+    person_id = db.insert_person("John Doe")
+    ids = {
+        slug: db.insert_removal(
+            person_id=person_id, broker_id=db.get_broker_by_slug(slug).id, method="web_form",
+            status="submitted", next_check_at="2000-01-01 00:00:00",
+        )
+        for slug in slugs
+    }
+    return db, config, ids
+
+
+def test_job_verify_removals_rescans_with_persistent_breaker(tmp_path):
+    from digital_footprint.scanners.broker_health import BrokerHealth
+    from digital_footprint.scanners.broker_scanner import PageFetch
+
+    db, config, ids = _pending_removals(tmp_path, ("spokeo", "radaris"))
+    # Opened by an earlier run
+    for _ in range(3):
+        BrokerHealth(db).record_failure("spokeo", "timeout")
+
+    with patch("digital_footprint.scanners.broker_scanner._fetch_page_text", new_callable=AsyncMock) as mock_fetch, \
+         patch("digital_footprint.scanners.playwright_scanner.random_delay", new_callable=AsyncMock):
+        mock_fetch.return_value = PageFetch("No records found", "http")
+        result = job_verify_removals(db, config)
+
+    assert result.status == "success"
+    assert result.details["outcomes"] == {"skipped": 1, "confirmed": 1}
+    assert mock_fetch.await_count == 1
+    assert "radaris.com" in mock_fetch.call_args.args[0]
+    assert db.get_removal(ids["radaris"])["status"] == "confirmed"
+    assert db.get_removal(ids["spokeo"])["status"] == "submitted"
+    assert db.list_broker_breakers()[0]["broker_slug"] == "radaris"
+    db.close()
+
+
+def test_job_verify_removals_blocked_page_keeps_removal_pending(tmp_path):
+    from digital_footprint.scanners.broker_scanner import PageFetch
+
+    db, config, ids = _pending_removals(tmp_path, ("spokeo",))
+    with patch("digital_footprint.scanners.broker_scanner._fetch_page_text", new_callable=AsyncMock) as mock_fetch, \
+         patch("digital_footprint.scanners.playwright_scanner.random_delay", new_callable=AsyncMock):
+        mock_fetch.return_value = PageFetch("Please complete the CAPTCHA to continue", "http")
+        result = job_verify_removals(db, config)
+
+    assert result.details["outcomes"] == {"error": 1}
+    removal = db.get_removal(ids["spokeo"])
+    assert removal["status"] == "submitted"
+    assert removal["confirmed_at"] is None
+    assert removal["attempts"] == 1
+    assert removal["last_checked_at"] is not None
+    db.close()
@@ -0,0 +1,67 @@
+"""Tests for per-host throttling and concurrent broker sweeps."""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from digital_footprint.scanners.broker_scanner import BrokerScanResult, scan_all_brokers
+from digital_footprint.scanners.throttle import HostThrottle, host_key
+
+
+def test_host_key_strips_www_and_path():
+    assert host_key("https://www.Spokeo.com/John-Doe") == "spokeo.com"
+    assert host_key("https://radaris.com/p/John/Doe/") == "radaris.com"
+
+
+@pytest.mark.asyncio
+async def test_throttle_spaces_same_host():
+    throttle = HostThrottle(min_interval=0.05, max_interval=0.05)
+    start = time.monotonic()
+    await throttle.wait("https://spokeo.com/a")
+    await throttle.wait("https://spokeo.com/b")
+    assert time.monotonic() - start >= 0.045
+
+
+@pytest.mark.asyncio
+async def test_throttle_does_not_delay_other_hosts():
+    throttle = HostThrottle(min_interval=1.0, max_interval=1.0)
+    await throttle.wait("https://spokeo.com/a")
+    start = time.monotonic()
+    waited = await throttle.wait("https://radaris.com/a")
+    assert waited == 0
+    assert time.monotonic() - start < 0.5
+
+
+@pytest.mark.asyncio
+async def test_scan_all_brokers_concurrent_keeps_order():
+    brokers = [
+        {"slug": f"b{i}", "name": f"Broker {i}", "search_url_pattern": f"https://b{i}.com/{{first}}-{{last}}"}
+        for i in range(6)
+    ]
+    brokers.insert(2, {"slug": "nosearch", "name": "No Search"})
+    running = 0
+    peak = 0
+
+    async def fake_scan(**kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        # Later brokers finish first
+        await asyncio.sleep(0.01 * (10 - int(kwargs["broker_slug"][1:])))
+        running -= 1
+        return BrokerScanResult(
+            broker_slug=kwargs["broker_slug"],
+            broker_name=kwargs["broker_name"],
+            url=kwargs["url_pattern"],
+            found=False,
+        )
+
+    with patch("digital_footprint.scanners.broker_scanner.scan_broker", side_effect=fake_scan):
+        results = await scan_all_brokers(
+            brokers, "John", "Doe", pool=AsyncMock(), concurrency=3,
+        )
+
+    assert [r.broker_slug for r in results] == [f"b{i}" for i in range(6)]
+    assert all(isinstance(r, BrokerScanResult) for r in results)
+    assert peak == 3
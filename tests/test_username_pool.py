@@ -0,0 +1,152 @@
+"""Tests for the queued Maigret username scan worker pool."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from digital_footprint.cli import cli
+from digital_footprint.scanners.username_pool import UsernameScanPool, enqueue_usernames
+from digital_footprint.scanners.username_scanner import UsernameResult, UsernameScan
+from digital_footprint.tools.username_tools import do_username_cancel, do_username_jobs, do_username_queue
+
+
+def test_enqueue_usernames_from_all_persons_dedupes(tmp_db):
+    tmp_db.insert_person(name="John Doe", usernames=["johnd", "jd"])
+    tmp_db.insert_person(name="Jane Doe", usernames=["jd", "janed"])
+
+    job_ids = enqueue_usernames(tmp_db)
+    assert len(job_ids) == 3
+    assert enqueue_usernames(tmp_db, usernames=["johnd"]) == job_ids[:1]
+    assert {j["username"] for j in tmp_db.list_username_jobs(status="queued")} == {"johnd", "jd", "janed"}
+
+
+def test_claim_and_cancel_jobs(tmp_db):
+    first = tmp_db.enqueue_username_job("alice")
+    second = tmp_db.enqueue_username_job("bob")
+
+    assert tmp_db.claim_username_job()["id"] == first
+    assert tmp_db.cancel_username_jobs() == 2
+    assert tmp_db.get_username_job(second)["status"] == "cancelled"
+    assert tmp_db.username_job_cancel_requested(first)
+    assert tmp_db.claim_username_job() is None
+
+    assert tmp_db.requeue_running_username_jobs() == 1
+    assert tmp_db.get_username_job(first)["status"] == "cancelled"
+
+
+@pytest.mark.asyncio
+async def test_pool_respects_concurrency_and_stores_results(tmp_db):
+    for name in ["a", "b", "c", "d", "e"]:
+        tmp_db.enqueue_username_job(name)
+    running = 0
+    peak = 0
+
+    async def fake_scan(username, timeout, deadline, cancel, tier):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        return UsernameScan(username=username, results=[UsernameResult(site_name="GitHub", url=f"https://github.com/{username}")])
+
+    with patch("digital_footprint.scanners.username_pool.scan_username", side_effect=fake_scan):
+        counts = await UsernameScanPool(tmp_db, concurrency=2).run()
+
+    assert counts == {"completed": 5}
+    assert peak == 2
+    job = tmp_db.list_username_jobs()[0]
+    assert job["status"] == "completed"
+    assert job["results"][0]["url"] == "https://github.com/e"
+
+
+@pytest.mark.asyncio
+async def test_pool_cancels_running_job_from_db_flag(tmp_db):
+    job_id = tmp_db.enqueue_username_job("slowuser")
+
+    async def fake_scan(username, timeout, deadline, cancel, tier):
+        await cancel.wait()
+        return UsernameScan(username=username, status="cancelled",
+                            results=[UsernameResult(site_name="GitHub", url="https://github.com/slowuser")])
+
+    async def cancel_soon():
+        await asyncio.sleep(0.05)
+        tmp_db.cancel_username_jobs(job_id)
+
+    with patch("digital_footprint.scanners.username_pool.scan_username", side_effect=fake_scan):
+        counts, _ = await asyncio.gather(UsernameScanPool(tmp_db, poll_interval=0.01).run(), cancel_soon())
+
+    assert counts == {"cancelled": 1}
+    job = tmp_db.get_username_job(job_id)
+    assert job["status"] == "cancelled"
+    assert len(job["results"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_records_scanner_errors(tmp_db):
+    tmp_db.enqueue_username_job("boom")
+    with patch("digital_footprint.scanners.username_pool.scan_username", side_effect=RuntimeError("bad")):
+        counts = await UsernameScanPool(tmp_db).run()
+    assert counts == {"failed": 1}
+    assert tmp_db.list_username_jobs()[0]["error"] == "bad"
+
+
+def test_username_tools(tmp_db):
+    tmp_db.insert_person(name="John Doe", usernames=["johnd"])
+    assert json.loads(do_username_queue(tmp_db))["queued"] == [1]
+    assert json.loads(do_username_jobs(tmp_db))[0]["status"] == "queued"
+    assert json.loads(do_username_jobs(tmp_db, job_id=1))["results"] == []
+    assert json.loads(do_username_cancel(tmp_db, job_id=1)) == {"cancelled": 1}
+
+
+def test_cli_queue_list_and_cancel(tmp_db):
+    runner = CliRunner()
+    with patch("digital_footprint.cli._get_db", return_value=tmp_db):
+        result = runner.invoke(cli, ["usernames", "queue", "alice", "bob"])
+        assert "Queued 2 jobs" in result.output
+        assert "alice" in runner.invoke(cli, ["usernames", "jobs"]).output
+        assert "Cancelled 2 jobs" in runner.invoke(cli, ["usernames", "cancel"]).output
+
+
+def test_username_accounts_merge_latest_scan_per_tier(tmp_db):
+    github = {"site_name": "GitHub", "url": "https://github.com/jd", "tags": []}
+    tmp_db.record_username_scan("jd", "fast", "completed", [github])
+    tmp_db.record_username_scan("jd", "tail", "completed", [{"site_name": "Old", "url": "https://old.example/jd", "tags": []}])
+    tmp_db.record_username_scan("jd", "tail", "timeout", [
+        dict(github, tags=["coding"]),
+        {"site_name": "NicheBlog", "url": "https://blog.example/jd", "tags": ["blog"]},
+    ])
+    tmp_db.record_username_scan("jd", "full", "failed", [{"site_name": "Ignored", "url": "", "tags": []}])
+
+    accounts = {a["site_name"]: a for a in tmp_db.get_username_accounts("jd")}
+    assert set(accounts) == {"GitHub", "NicheBlog"}
+    assert accounts["GitHub"]["tags"] == ["coding"]
+
+
+def test_pipeline_username_stage_queues_long_tail(tmp_db):
+    from digital_footprint.config import Config
+    from digital_footprint.pipeline.pipeline import _username_stage
+
+    person_id = tmp_db.insert_person(name="John Doe", usernames=["jd"])
+    scan = UsernameScan(username="jd", status="timeout", results=[
+        UsernameResult(site_name="Twitter", url="https://twitter.com/jd", tags=["social"]),
+    ])
+    with patch("digital_footprint.pipeline.pipeline.scan_username", return_value=scan) as mock_scan:
+        accounts = _username_stage(["jd"], Config(username_time_budget=30), tmp_db, person_id)
+
+    assert mock_scan.call_args.kwargs["tier"] == "fast"
+    assert mock_scan.call_args.kwargs["deadline"] == 30
+    assert accounts == [{"site_name": "Twitter", "url": "https://twitter.com/jd", "risk_level": "medium"}]
+    queued = tmp_db.list_username_jobs(status="queued")
+    assert [(j["username"], j["tier"]) for j in queued] == [("jd", "tail")]
+
+
+def test_pipeline_username_stage_disabled_by_zero_budget(tmp_db):
+    from digital_footprint.config import Config
+    from digital_footprint.pipeline.pipeline import _username_stage
+
+    with patch("digital_footprint.pipeline.pipeline.scan_username") as mock_scan:
+        assert _username_stage(["jd"], Config(username_time_budget=0), tmp_db, 1) == []
+    mock_scan.assert_not_called()
@@ -0,0 +1,116 @@
+"""Tests for differential username re-scans and the per-site cache."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from digital_footprint.scanners.username_rescan import rescan_username, stale_sites
+from digital_footprint.scanners.username_scanner import UsernameResult, UsernameScan
+
+SITES = {"engines": {}, "sites": {
+    "GitHub": {"tags": ["coding"]},
+    "Twitter": {"tags": ["social"]},
+    "Reddit": {"tags": ["forum"]},
+    "Dead": {"tags": [], "disabled": True},
+}}
+
+
+def _scan(*sites, status="completed"):
+    return UsernameScan(username="jd", status=status, results=[
+        UsernameResult(site_name=s, url=f"https://{s.lower()}.com/jd") for s in sites
+    ])
+
+
+class _FakeMaigret:
+    """Records which sites each run was limited to."""
+
+    def __init__(self, *scans):
+        self.scans = list(scans)
+        self.checked = []
+
+    async def __call__(self, username, timeout, deadline, sites_db, tier=None, top_sites=None):
+        import json
+        self.checked.append(sorted(json.loads(sites_db.read_text())["sites"]) if sites_db else None)
+        return self.scans.pop(0)
+
+
+def test_stale_sites():
+    cached = {"a": {"last_checked_at": 100.0}, "b": {"last_checked_at": 10.0}}
+    assert stale_sites(cached, ["a", "b", "c"], ttl=50, now=120.0) == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_first_scan_checks_everything_and_reports_new(tmp_db):
+    fake = _FakeMaigret(_scan("GitHub", "Twitter"))
+    with patch("digital_footprint.scanners.username_rescan.scan_username", new=fake):
+        diff = await rescan_username(tmp_db, "jd", sites_data=SITES)
+
+    assert fake.checked == [["GitHub", "Reddit", "Twitter"]]
+    assert [r.site_name for r in diff.new] == ["GitHub", "Twitter"]
+    assert diff.gone == []
+    assert (diff.checked, diff.cached) == (3, 0)
+    assert tmp_db.get_username_sites("jd")["Reddit"]["claimed"] is False
+
+
+@pytest.mark.asyncio
+async def test_fast_tier_limits_candidate_sites(tmp_db):
+    fake = _FakeMaigret(_scan("Twitter"))
+    with patch("digital_footprint.scanners.username_rescan.scan_username", new=fake):
+        diff = await rescan_username(tmp_db, "jd", sites_data=SITES, tier="fast", top_sites=0)
+
+    # Only the social/forum-tagged sites are in the fast tier
+    assert fake.checked == [["Reddit", "Twitter"]]
+    assert diff.checked == 2
+    assert "GitHub" not in tmp_db.get_username_sites("jd")
+
+
+@pytest.mark.asyncio
+async def test_rescan_only_checks_stale_sites(tmp_db):
+    tmp_db.update_username_sites("jd", claimed=[{"site_name": "GitHub", "url": "u"}],
+                                 unclaimed=["Reddit"], checked_at=time.time())
+    tmp_db.update_username_sites("jd", claimed=[{"site_name": "Twitter", "url": "u"}],
+                                 unclaimed=[], checked_at=time.time() - 30 * 86400)
+    fake = _FakeMaigret(_scan())
+    with patch("digital_footprint.scanners.username_rescan.scan_username", new=fake):
+        diff = await rescan_username(tmp_db, "jd", sites_data=SITES)
+
+    assert fake.checked == [["Twitter"]]
+    assert diff.gone == ["Twitter"]
+    assert diff.new == []
+    assert [r.site_name for r in diff.accounts] == ["GitHub"]
+    assert diff.cached == 2
+
+
+@pytest.mark.asyncio
+async def test_fresh_cache_skips_maigret(tmp_db):
+    tmp_db.update_username_sites("jd", claimed=[{"site_name": "GitHub", "url": "u"}],
+                                 unclaimed=["Reddit", "Twitter"], checked_at=time.time())
+    with patch("digital_footprint.scanners.username_rescan.scan_username") as mock_scan:
+        diff = await rescan_username(tmp_db, "jd", sites_data=SITES)
+    mock_scan.assert_not_called()
+    assert [r.site_name for r in diff.accounts] == ["GitHub"]
+    assert diff.checked == 0
+
+
+@pytest.mark.asyncio
+async def test_partial_scan_does_not_mark_sites_gone(tmp_db):
+    tmp_db.update_username_sites("jd", claimed=[{"site_name": "GitHub", "url": "u"}],
+                                 unclaimed=[], checked_at=time.time() - 30 * 86400)
+    fake = _FakeMaigret(_scan("Twitter", status="timeout"))
+    with patch("digital_footprint.scanners.username_rescan.scan_username", new=fake):
+        diff = await rescan_username(tmp_db, "jd", sites_data=SITES)
+
+    assert diff.status == "timeout"
+    assert diff.gone == []
+    assert [r.site_name for r in diff.new] == ["Twitter"]
+    assert set(tmp_db.get_username_sites("jd", claimed_only=True)) == {"GitHub", "Twitter"}
+
+
+def test_update_username_sites_keeps_first_seen_and_tags(tmp_db):
+    tmp_db.update_username_sites("jd", claimed=[{"site_name": "GitHub", "url": "u", "tags": ["coding"]}],
+                                 unclaimed=[], checked_at=100.0)
+    tmp_db.update_username_sites("jd", claimed=[{"site_name": "GitHub", "url": "u2", "tags": []}],
+                                 unclaimed=[], checked_at=200.0)
+    site = tmp_db.get_username_sites("jd")["GitHub"]
+    assert (site["first_seen_at"], site["last_checked_at"], site["url"], site["tags"]) == (100.0, 200.0, "u2", ["coding"])
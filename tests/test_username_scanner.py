@@ -1,15 +1,43 @@
 """Tests for username scanner (Maigret wrapper)."""
 
+import asyncio
 import json
+import sys
 from unittest.mock import patch, MagicMock, AsyncMock
 import pytest
 
 from digital_footprint.scanners.username_scanner import (
+    FAST_TIER_TAGS,
+    _tier_db,
+    parse_claimed_line,
+    split_site_tiers,
+    tier_args,
+    scan_username,
     search_username,
     parse_maigret_results,
     UsernameResult,
 )
 
+# Stand-in for maigret: prints two claimed sites, then hangs
+FAKE_MAIGRET = (
+    "import sys, time\n"
+    "print('[*] Checking username testuser on:', flush=True)\n"
+    "print('[+] GitHub: https://github.com/testuser', flush=True)\n"
+    "print('[+] Reddit: https://reddit.com/user/testuser', flush=True)\n"
+    "time.sleep(60)\n"
+)
+
+
+def _fake_maigret(script=FAKE_MAIGRET):
+    real_exec = asyncio.create_subprocess_exec
+    calls = []
+
+    async def fake_exec(*args, **kwargs):
+        calls.append(args)
+        return await real_exec(sys.executable, "-c", script, **kwargs)
+
+    return patch("digital_footprint.scanners.username_scanner.asyncio.create_subprocess_exec", fake_exec), calls
+
 
 @pytest.fixture
 def maigret_json_output():
@@ -95,6 +123,7 @@ async def test_search_username_runs_maigret(tmp_path, maigret_json_output):
     with patch("digital_footprint.scanners.username_scanner.asyncio.create_subprocess_exec") as mock_exec:
         mock_exec.return_value = mock_proc
         mock_proc.communicate = AsyncMock(return_value=(b"", b""))
+        mock_proc.wait = AsyncMock(return_value=0)
 
         with patch("digital_footprint.scanners.username_scanner._get_output_dir", return_value=tmp_path):
             results = await search_username("testuser")
@@ -102,3 +131,93 @@ async def test_search_username_runs_maigret(tmp_path, maigret_json_output):
     assert len(results) == 3
     sites = {r.site_name for r in results}
     assert "GitHub" in sites
+
+
+def test_parse_claimed_line():
+    result = parse_claimed_line("[+] GitHub: https://github.com/testuser\n")
+    assert (result.site_name, result.url) == ("GitHub", "https://github.com/testuser")
+    assert parse_claimed_line("[-] Twitter: Not found!") is None
+
+
+@pytest.mark.asyncio
+async def test_scan_username_kills_on_deadline_and_keeps_partial_results():
+    patcher, calls = _fake_maigret()
+    with patcher:
+        scan = await scan_username("testuser", timeout=5, deadline=1.0)
+
+    assert scan.status == "timeout"
+    assert scan.partial
+    assert [r.site_name for r in scan.results] == ["GitHub", "Reddit"]
+
+
+@pytest.mark.asyncio
+async def test_scan_username_cancel_event_stops_run():
+    cancel = asyncio.Event()
+    patcher, _ = _fake_maigret()
+    with patcher:
+        task = asyncio.ensure_future(scan_username("testuser", deadline=30, cancel=cancel))
+        await asyncio.sleep(0.5)
+        cancel.set()
+        scan = await asyncio.wait_for(task, 5)
+    assert scan.status == "cancelled"
+    assert len(scan.results) == 2
+
+
+@pytest.mark.asyncio
+async def test_scan_username_uses_private_scratch_dirs():
+    patcher, calls = _fake_maigret("print('[+] GitHub: https://github.com/testuser')")
+    with patcher:
+        await asyncio.gather(scan_username("testuser"), scan_username("testuser"))
+    dirs = [args[args.index("--folderoutput") + 1] for args in calls]
+    assert len(set(dirs)) == 2
+
+
+@pytest.mark.asyncio
+async def test_scan_username_maigret_missing():
+    with patch("digital_footprint.scanners.username_scanner.asyncio.create_subprocess_exec",
+               side_effect=FileNotFoundError):
+        scan = await scan_username("testuser")
+    assert scan.status == "failed"
+    assert scan.results == []
+
+
+SITES_DB = {
+    "engines": {},
+    "sites": {
+        "GitHub": {"alexaRank": 50, "tags": ["coding"]},
+        "Twitter": {"alexaRank": 10, "tags": ["social"]},
+        "NicheDating": {"alexaRank": 90000, "tags": ["dating"]},
+        "NicheBlog": {"alexaRank": 80000, "tags": ["blog"]},
+        "Unranked": {"tags": ["coding"]},
+        "Dead": {"alexaRank": 1, "tags": [], "disabled": True},
+    },
+}
+
+
+def test_split_site_tiers_by_rank_and_tags():
+    fast, tail = split_site_tiers(SITES_DB, top_n=2, tags=FAST_TIER_TAGS)
+    assert set(fast) == {"Twitter", "GitHub", "NicheDating"}
+    assert set(tail) == {"NicheBlog", "Unranked"}
+
+
+def test_tier_args_write_subset_databases():
+    _tier_db.cache_clear()
+    with patch("digital_footprint.scanners.username_scanner.load_maigret_sites", return_value=SITES_DB):
+        fast_args = tier_args("fast", top_n=1)
+        tail_args = tier_args("tail", top_n=1)
+    _tier_db.cache_clear()
+
+    assert fast_args[0] == "--db" and fast_args[-1] == "-a"
+    fast_sites = json.loads(open(fast_args[1]).read())["sites"]
+    tail_sites = json.loads(open(tail_args[1]).read())["sites"]
+    assert set(fast_sites) == {"Twitter", "NicheDating"}
+    assert set(tail_sites) == {"GitHub", "NicheBlog", "Unranked"}
+    assert tier_args("full") == ["-a"]
+
+
+def test_tier_args_without_site_database():
+    _tier_db.cache_clear()
+    with patch("digital_footprint.scanners.username_scanner.load_maigret_sites", return_value=None):
+        assert tier_args("fast", top_n=100) == ["--top-sites", "100"]
+        assert tier_args("tail", top_n=100) == ["-a"]
+    _tier_db.cache_clear()